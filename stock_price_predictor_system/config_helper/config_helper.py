@@ -43,6 +43,9 @@ consumerSecret = your_consumerSecret
 url = https://fc-data.ssi.com.vn/
 stream_url = https://fc-datahub.ssi.com.vn
 
+; Add more FastConnect credentials in sections named [ssi_crawler_info.2],
+; [ssi_crawler_info.3], ... with their own consumerID and consumerSecret.
+
 [realtional_database]
 server_name = your_server_name
 login = your_username
@@ -76,6 +79,25 @@ token = your_token
                 stream_url=config.get("ssi_crawler_info", "stream_url"),
             )
 
+            # Other keys of an additional credential default to the primary one
+            additional_ssi_crawler_info_config_list = [
+                SsiCrawlerInfoConfig(
+                    auth_type=config.get(
+                        section, "auth_type", fallback=ssi_crawler_info_config.auth_type
+                    ),
+                    consumerID=config.get(section, "consumerID"),
+                    consumerSecret=config.get(section, "consumerSecret"),
+                    url=config.get(section, "url", fallback=ssi_crawler_info_config.url),
+                    stream_url=config.get(
+                        section,
+                        "stream_url",
+                        fallback=ssi_crawler_info_config.stream_url,
+                    ),
+                )
+                for section in config.sections()
+                if section.startswith("ssi_crawler_info.")
+            ]
+
             relational_database_config = RelationalDatabaseConfig(
                 server_name=config.get("realtional_database", "server_name"),
                 login=config.get("realtional_database", "login"),
@@ -92,6 +114,7 @@ token = your_token
             return ConfigModel(
                 general=general_config,
                 ssi_crawler_info=ssi_crawler_info_config,
+                additional_ssi_crawler_info=additional_ssi_crawler_info_config_list,
                 relational_database=relational_database_config,
                 time_series_database=time_series_database_config,
             )
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import List
 
 
 class GeneralConfig(BaseModel):
@@ -30,5 +31,8 @@ class TimeSeriesDatabaseConfig(BaseModel):
 class ConfigModel(BaseModel):
     general: GeneralConfig
     ssi_crawler_info: SsiCrawlerInfoConfig
+    additional_ssi_crawler_info: List[SsiCrawlerInfoConfig] = Field(
+        default_factory=list
+    )
     relational_database: RelationalDatabaseConfig
     time_series_database: TimeSeriesDatabaseConfig
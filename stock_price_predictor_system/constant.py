@@ -1,7 +1,22 @@
+import os
 from datetime import datetime, timedelta
 
-# General constants
-COOL_DOWN_BETWEEN_API_CALL = 1.1  # seconds | MUST BE GREATER THAN 1 second
+from .ssi_data_crawler.enum import MarketCode, TimeSeriesCrawlMode
+
+# API rate limit constants
+# Every endpoint of a consumer draws from one rate, which starts at
+# API_RATE_LIMIT_PER_SECOND, backs off when the API throttles or fails and
+# recovers while responses are healthy. FastConnect allows a consumer one
+# request per second, so the rate never grows past it.
+API_RATE_LIMIT_PER_SECOND = 1 / 1.1  # requests per second
+API_MIN_RATE_LIMIT_PER_SECOND = 0.1  # requests per second
+API_MAX_RATE_LIMIT_PER_SECOND = 1 / 1.1  # requests per second
+API_RATE_ADDITIVE_INCREASE = 0.05  # requests per second, per healthy response
+API_RATE_MULTIPLICATIVE_DECREASE = 0.5
+API_RATE_LIMIT_BURST = 1  # tokens
+API_THROTTLED_STATUSES = {429, 500, 502, 503, 504}
+MAX_API_RETRY = 5  # attempts per call after throttling
+MAX_CONCURRENT_API_CALL = 4  # requests in flight in asynchronous crawl mode
 
 
 # Relational database constants
@@ -13,7 +28,69 @@ RELATIONAL_DATABASE_NAME = "SSI_STOCKS"
 ENABLE_CRAWL_TIME_SERIES_DATABASE = True
 
 DEFAULT_CRAWL_DATA_START_DATE = datetime(2020, 2, 1)
-CRAWL_DATA_TIME_INTERVAL = timedelta(days=30)
+CRAWL_DATA_TIME_INTERVAL = timedelta(days=30)  # initial size of an adaptive interval
+MIN_CRAWL_DATA_TIME_INTERVAL = timedelta(days=7)
+MAX_CRAWL_DATA_TIME_INTERVAL = timedelta(days=365)
+ADAPTIVE_INTERVAL_TARGET_FILL = 0.9  # fraction of a full page an interval aims for
+DAILY_STOCK_PRICE_PAGE_SIZE = 1000
+MAX_PAGE_INDEX = 10  # FastConnect rejects pageIndex greater than 10
+TIME_SERIES_CRAWL_MODE = TimeSeriesCrawlMode.INCREMENTAL
+
+# Market-wide crawl mode constants
+MARKET_WIDE_CRAWL_MARKETS = [MarketCode.HOSE, MarketCode.HNX, MarketCode.UPCOM]
+
+# Listing lifetime planner constants
+ENABLE_LISTING_LIFETIME_PLANNER = True
+SECURITIES_DETAILS_PAGE_SIZE = 1000
+
+# Trading calendar constants
+LEARN_TRADING_HOLIDAYS = True  # learn holidays from market-wide responses
+
+# Pipeline crawl mode constants
+PIPELINE_FETCH_WORKERS = MAX_CONCURRENT_API_CALL
+PIPELINE_PARSE_WORKERS = 1
+PIPELINE_WRITE_WORKERS = 2
+PIPELINE_QUEUE_SIZE = 32  # items per stage before the stage in front blocks
+
+# Response cache constants
+ENABLE_RESPONSE_CACHE = True
+RESPONSE_CACHE_DIRECTORY = ".cache/ssi_api"
+RESPONSE_CACHE_TTLS = {  # endpoints missing here, like intraday_ohlc, are never cached
+    "securities": timedelta(days=1),
+    "securities_details": timedelta(days=1),
+    "index_components": timedelta(days=1),
+    "index_list": timedelta(days=1),
+    "daily_ohlc": timedelta(hours=1),
+    "daily_index": timedelta(hours=1),
+    "daily_stock_price": timedelta(hours=1),
+}
+RESPONSE_CACHE_SETTLEMENT_DELAY = timedelta(days=2)  # after that, an interval is closed
+
+# Change detection constants
+# Points re-crawled with the same values as when they were written are not
+# written again. Purging the time series data clears the index.
+ENABLE_CHANGE_DETECTION = True
+FINGERPRINT_INDEX_DIRECTORY = ".cache/fingerprints"
+
+# Streaming decode constants
+# Paged time series responses are decoded while they download and converted
+# in batches, instead of holding the body, its dicts and models at once.
+ENABLE_STREAMING_DECODE = True
+STREAMING_CHUNK_SIZE = 64 * 1024  # bytes read from the socket at a time
+STREAMING_BATCH_SIZE = 100  # rows converted at a time
+
+# Relational write constants
+# Watermark updates are written in transactions committed every this many
+# statements, instead of one log flush per statement.
+COMMIT_BATCH_SIZE = 500
+
+# Backfill constants
+BACKFILL_TIMESTAMP_FIELD = "close_price"  # every stored bar has this field
+PARALLEL_BACKFILL_PROCESSES = os.cpu_count() or 1
+
+# Incremental crawl mode constants
+INCREMENTAL_MARKET_WIDE_THRESHOLD = 20  # securities sharing a market and watermark
+INCREMENTAL_MARKET_WIDE_MAX_DELTA = timedelta(days=14)
 
 BUCKET_NAME = "root"
 MEASUREMENT_NAME = "ssi_stocks"
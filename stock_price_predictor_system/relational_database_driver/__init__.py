@@ -1 +1 @@
-version = "0.1.0"
\ No newline at end of file
+version = "0.1.0"
@@ -0,0 +1,158 @@
+"""Round trips per statement of SqlServerDriver with and without the catalog cache."""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from .model import *
+from .sql_server_driver import SqlServerDriver
+from ..config_helper.config_helper import ConfigHelper
+from ..logger.logger import Logger
+
+# Never the database of the system, the table is dropped and created again
+DATABASE_NAME = "CatalogBenchmark"
+TABLE_NAME = "CatalogBenchmark"
+
+
+def build_operations(
+    driver: SqlServerDriver,
+) -> List[Tuple[str, Callable[[int], object]]]:
+    condition = lambda index: Condition(
+        column="Symbol",
+        operator=Operator.EQUAL_TO,
+        value=f"S{index:06d}",
+        dataType=DataType.NVARCHAR,
+    )
+
+    return [
+        (
+            "insert",
+            lambda index: driver.insert(
+                database_name=DATABASE_NAME,
+                table_name=TABLE_NAME,
+                records=RecordBatch(
+                    columnNameList=["Symbol", "UpdateDate"],
+                    dataTypeList=[DataType.NVARCHAR, DataType.DATETIME],
+                    valueList=[(f"S{index:06d}", datetime.now())],
+                ),
+            ),
+        ),
+        (
+            "select",
+            lambda index: driver.select(
+                database_name=DATABASE_NAME,
+                table_name=TABLE_NAME,
+                condition_list=[condition(index)],
+            ),
+        ),
+        (
+            "update (checkpoint)",
+            lambda index: driver.update(
+                database_name=DATABASE_NAME,
+                table_name=TABLE_NAME,
+                record=Record(
+                    [
+                        DataModel(
+                            columnName="UpdateDate",
+                            value=datetime.now(),
+                            dataType=DataType.DATETIME,
+                        )
+                    ]
+                ),
+                condition_list=[condition(index)],
+            ),
+        ),
+        (
+            "delete",
+            lambda index: driver.delete(
+                database_name=DATABASE_NAME,
+                table_name=TABLE_NAME,
+                condition_list=[condition(index)],
+            ),
+        ),
+    ]
+
+
+def measure(
+    driver: SqlServerDriver, number_of_operation: int
+) -> Dict[str, Tuple[float, float]]:
+    """Return the round trips and milliseconds per call of every operation."""
+    results = {}
+
+    for name, operation in build_operations(driver):
+        number_of_round_trip = driver.number_of_round_trip
+        start_time = time.perf_counter()
+
+        for index in range(number_of_operation):
+            operation(index)
+
+        elapsed_time = time.perf_counter() - start_time
+        results[name] = (
+            (driver.number_of_round_trip - number_of_round_trip) / number_of_operation,
+            elapsed_time * 1000 / number_of_operation,
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare SQL Server round trips with and without the catalog cache."
+    )
+    parser.add_argument("--operations", type=int, default=200)
+    arguments = parser.parse_args()
+
+    _logger = Logger("catalog_benchmark")
+    config = ConfigHelper(_logger).load_config()
+    if not config:
+        return
+
+    authentication = SqlServerAuthentication(
+        server=config.relational_database.server_name,
+        login=config.relational_database.login,
+        password=config.relational_database.password,
+    )
+
+    results = {}
+    for enable_catalog_cache in (False, True):
+        driver = SqlServerDriver(_logger, enable_catalog_cache=enable_catalog_cache)
+        if not driver.open_connection(authentication):
+            return
+
+        if not driver.check_database_exist(DATABASE_NAME):
+            driver.create_database(DATABASE_NAME)
+
+        driver.drop_table(DATABASE_NAME, TABLE_NAME)
+        driver.create_table(
+            database_name=DATABASE_NAME,
+            table_name=TABLE_NAME,
+            columns=[
+                Column(columnName="ID", dataType=DataType.INT(), nullable=False),
+                Column(
+                    columnName="Symbol", dataType=DataType.NVARCHAR(10), nullable=False
+                ),
+                Column(
+                    columnName="UpdateDate", dataType=DataType.DATETIME(), nullable=True
+                ),
+            ],
+            key_column_name="ID",
+        )
+
+        results[enable_catalog_cache] = measure(driver, arguments.operations)
+
+        driver.drop_table(DATABASE_NAME, TABLE_NAME)
+        driver.close_connection()
+
+    print(f"\nRound trips per operation ({arguments.operations} calls each)")
+    print(f"  {'operation':<20} {'without cache':>22} {'with cache':>22}")
+    for name, (round_trips, milliseconds) in results[False].items():
+        cached_round_trips, cached_milliseconds = results[True][name]
+        print(
+            f"  {name:<20} {round_trips:>9.2f} {milliseconds:>9.2f} ms "
+            f"{cached_round_trips:>9.2f} {cached_milliseconds:>9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class DictionaryArray:
+    """Text column as codes into `dictionary`, -1 for null."""
+
+    codes: np.ndarray
+    dictionary: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> np.ndarray:
+        """Values of the column, with nulls as empty strings."""
+        if not len(self.dictionary):
+            return np.full(len(self.codes), "", dtype=np.str_)
+
+        return np.where(self.codes >= 0, self.dictionary[np.maximum(self.codes, 0)], "")
+
+
+class ColumnarBuilder:
+    """One typed array per column, converted chunk by chunk as rows are fetched."""
+
+    def __init__(self, column_names: List[str], type_codes: List[type]):
+        self._column_names = column_names
+        self._type_codes = type_codes
+
+        self._chunks: List[List[np.ndarray]] = [[] for _ in column_names]
+        self._dictionaries: List[Dict[str, int]] = [{} for _ in column_names]
+
+    # region Public methods
+
+    def append(self, rows: Sequence[Sequence]):
+        if not rows:
+            return
+
+        for index, values in enumerate(zip(*rows)):
+            self._chunks[index].append(self._convert(index, values))
+
+    def build(self) -> Dict[str, np.ndarray | DictionaryArray]:
+        columns = {}
+
+        for index, column_name in enumerate(self._column_names):
+            chunks = self._chunks[index]
+            type_code = self._type_codes[index]
+
+            if type_code is int and any(chunk.dtype == np.float64 for chunk in chunks):
+                chunks = [chunk.astype(np.float64) for chunk in chunks]
+
+            values = (
+                np.concatenate(chunks)
+                if chunks
+                else np.empty(0, dtype=self._get_dtype(type_code))
+            )
+
+            if type_code is str:
+                dictionary = self._dictionaries[index]
+                columns[column_name] = DictionaryArray(
+                    codes=values,
+                    dictionary=np.array(list(dictionary), dtype=np.str_),
+                )
+            else:
+                columns[column_name] = values
+
+        return columns
+
+    @staticmethod
+    def infer_type_codes(rows: Sequence[Sequence], number_of_column: int) -> List[type]:
+        """Type of the first value that is not null of every column."""
+        type_codes = [None] * number_of_column
+
+        for row in rows:
+            for index, value in enumerate(row):
+                if type_codes[index] is None and value is not None:
+                    type_codes[index] = type(value)
+
+            if None not in type_codes:
+                break
+
+        return type_codes
+
+    # endregion
+
+    # region Private methods
+
+    def _convert(self, index: int, values: Sequence) -> np.ndarray:
+        type_code = self._type_codes[index]
+
+        if type_code is str:
+            dictionary = self._dictionaries[index]
+            return np.fromiter(
+                (
+                    (
+                        -1
+                        if value is None
+                        else dictionary.setdefault(value, len(dictionary))
+                    )
+                    for value in values
+                ),
+                dtype=np.int32,
+                count=len(values),
+            )
+
+        if type_code is int and None in values:
+            return np.array(values, dtype=np.float64)
+
+        return np.array(values, dtype=self._get_dtype(type_code))
+
+    @staticmethod
+    def _get_dtype(type_code: type) -> np.dtype:
+        if type_code is datetime:
+            return np.dtype("datetime64[ms]")
+
+        if type_code is date:
+            return np.dtype("datetime64[D]")
+
+        if type_code is int:
+            return np.dtype(np.int64)
+
+        if type_code in (float, Decimal):
+            return np.dtype(np.float64)
+
+        if type_code is bool:
+            return np.dtype(bool)
+
+        if type_code is str:
+            return np.dtype(np.int32)
+
+        return np.dtype(object)
+
+    # endregion
@@ -0,0 +1,191 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List
+
+# Defaults of SqlServerDriver, times in seconds
+POOL_MAX_SIZE = 8
+POOL_MAX_IDLE_TIME = 300
+POOL_MAX_LIFETIME = 1800
+POOL_HEALTH_CHECK_INTERVAL = 30
+POOL_CHECKOUT_TIMEOUT = 30
+
+
+@dataclass(slots=True)
+class PooledConnection:
+    connection: object
+    createTime: float
+    lastUseTime: float
+    lastCheckTime: float
+
+
+class ConnectionPool:
+    """Bounded pool of connections shared by threads."""
+
+    def __init__(
+        self,
+        connect: Callable[[], object],
+        max_size: int = POOL_MAX_SIZE,
+        max_idle_time: float = POOL_MAX_IDLE_TIME,
+        max_lifetime: float = POOL_MAX_LIFETIME,
+        health_check_interval: float = POOL_HEALTH_CHECK_INTERVAL,
+        health_check_query: str = "SELECT 1",
+    ):
+        self._connect = connect
+        self._max_size = max(1, max_size)
+        self._max_idle_time = max_idle_time
+        self._max_lifetime = max_lifetime
+        self._health_check_interval = health_check_interval
+        self._health_check_query = health_check_query
+
+        self._idle_connections: List[PooledConnection] = []
+        self._number_of_open_connection = 0
+        self._is_closed = False
+        self._condition = threading.Condition()
+
+    # region Public methods
+
+    @property
+    def number_of_open_connection(self) -> int:
+        return self._number_of_open_connection
+
+    @property
+    def number_of_idle_connection(self) -> int:
+        return len(self._idle_connections)
+
+    def acquire(self, timeout: float = POOL_CHECKOUT_TIMEOUT) -> PooledConnection:
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._is_closed:
+                    raise RuntimeError("Connection pool is closed.")
+
+                if self._idle_connections:
+                    pooled_connection = self._idle_connections.pop()
+                    break
+
+                if self._number_of_open_connection < self._max_size:
+                    self._number_of_open_connection += 1
+                    pooled_connection = None
+                    break
+
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    raise TimeoutError(
+                        f"No connection was returned to the pool within {timeout}s."
+                    )
+
+                self._condition.wait(remaining_time)
+
+        # Connecting and checking take a round trip, do it outside the lock.
+        # A connection that cannot be used is replaced in the same slot.
+        if pooled_connection is not None:
+            if self._is_usable(pooled_connection):
+                return pooled_connection
+
+            self._close(pooled_connection)
+
+        try:
+            now = time.monotonic()
+            return PooledConnection(
+                connection=self._connect(),
+                createTime=now,
+                lastUseTime=now,
+                lastCheckTime=now,
+            )
+
+        except Exception:
+            self._free_slot()
+            raise
+
+    def release(self, pooled_connection: PooledConnection, healthy: bool = True):
+        """Return a connection. One returned after an error is checked before reuse."""
+        now = time.monotonic()
+        pooled_connection.lastUseTime = now
+        pooled_connection.lastCheckTime = now if healthy else 0
+
+        with self._condition:
+            if not self._is_closed:
+                self._idle_connections.append(pooled_connection)
+                self._condition.notify()
+                return
+
+        self._close(pooled_connection)
+        self._free_slot()
+
+    def discard(self, pooled_connection: PooledConnection):
+        """Close a checked out connection whose state is unknown, instead of returning it."""
+        self._close(pooled_connection)
+        self._free_slot()
+
+    @contextmanager
+    def connection(self, timeout: float = POOL_CHECKOUT_TIMEOUT) -> Iterator[object]:
+        pooled_connection = self.acquire(timeout)
+        healthy = True
+
+        try:
+            yield pooled_connection.connection
+
+        except Exception:
+            healthy = False
+            raise
+
+        finally:
+            self.release(pooled_connection, healthy)
+
+    def close(self):
+        """Close the idle connections now, the checked out ones when returned."""
+        with self._condition:
+            self._is_closed = True
+            idle_connections = self._idle_connections
+            self._idle_connections = []
+            self._number_of_open_connection -= len(idle_connections)
+            self._condition.notify_all()
+
+        for pooled_connection in idle_connections:
+            self._close(pooled_connection)
+
+    # endregion
+
+    # region Private methods
+
+    def _is_usable(self, pooled_connection: PooledConnection) -> bool:
+        now = time.monotonic()
+
+        if now - pooled_connection.createTime > self._max_lifetime:
+            return False
+
+        if now - pooled_connection.lastUseTime > self._max_idle_time:
+            return False
+
+        if now - pooled_connection.lastCheckTime > self._health_check_interval:
+            try:
+                cursor = pooled_connection.connection.cursor()
+                cursor.execute(self._health_check_query)
+                cursor.fetchall()
+                cursor.close()
+
+            except Exception:
+                return False
+
+            pooled_connection.lastCheckTime = now
+
+        return True
+
+    def _free_slot(self):
+        with self._condition:
+            self._number_of_open_connection -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close(pooled_connection: PooledConnection):
+        try:
+            pooled_connection.connection.close()
+
+        # The connection may already be broken
+        except Exception:
+            pass
+
+    # endregion
@@ -0,0 +1,290 @@
+import threading
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .relational_database_driver import RelationalDatabaseDriver
+from .columnar import ColumnarBuilder, DictionaryArray
+from .model import *
+from .row_factory import SELECT_ARRAY_SIZE, compile_row_factory
+from ..logger.logger import Logger
+
+
+class InMemoryDriver(RelationalDatabaseDriver):
+    """Relational database held in dictionaries, for benchmarks and offline runs."""
+
+    def __init__(self, _logger: Logger):
+        self._logger = _logger
+
+        self._databases: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+
+    # region Public methods
+
+    def open_connection(self, _authentication: SqlServerAuthentication = None) -> bool:
+        return True
+
+    def close_connection(self) -> bool:
+        return True
+
+    def check_database_exist(self, database_name: str) -> bool:
+        return database_name in self._databases
+
+    def check_table_exist(self, database_name: str, table_name: str) -> bool:
+        return table_name in self._databases.get(database_name, {})
+
+    def create_database(self, database_name: str) -> bool:
+        if self.check_database_exist(database_name):
+            return False
+
+        self._databases[database_name] = {}
+        return True
+
+    def create_table(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[Column],
+        key_column_name: str,
+        foreign_keys: List[ForeignKey] = None,
+    ) -> bool:
+        if not self.check_database_exist(database_name):
+            self.create_database(database_name)
+
+        if self.check_table_exist(database_name, table_name):
+            return False
+
+        self._databases[database_name][table_name] = {
+            "columns": [column.columnName for column in columns],
+            "key_column_name": key_column_name,
+            "next_key": 1,
+            "rows": [],
+        }
+        return True
+
+    def truncate_table(self, database_name: str, table_name: str) -> bool:
+        table = self._get_table(database_name, table_name)
+        if table is None:
+            return False
+
+        with self._lock:
+            table["rows"] = []
+            table["next_key"] = 1
+
+        return True
+
+    def drop_table(self, database_name: str, table_name: str) -> bool:
+        if self._get_table(database_name, table_name) is None:
+            return False
+
+        del self._databases[database_name][table_name]
+        return True
+
+    def select(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str] = None,
+        limit: int = None,
+        condition_list: List[Condition] = None,
+    ) -> List[Tuple]:
+        table = self._get_table(database_name, table_name)
+        if table is None:
+            return None
+
+        columns = columns or table["columns"]
+
+        with self._lock:
+            rows = [
+                tuple(row.get(column) for column in columns)
+                for row in table["rows"]
+                if self._match(row, condition_list)
+            ]
+
+        return rows[:limit] if limit else rows
+
+    def select_iter(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str] = None,
+        limit: int = None,
+        condition_list: List[Condition] = None,
+        row_type: type = None,
+        array_size: int = SELECT_ARRAY_SIZE,
+    ) -> Iterator:
+        rows = self.select(database_name, table_name, columns, limit, condition_list)
+        if rows is None:
+            return None
+
+        return map(
+            compile_row_factory(row_type, tuple(columns) if columns else None), rows
+        )
+
+    def select_columnar(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str] = None,
+        limit: int = None,
+        condition_list: List[Condition] = None,
+        array_size: int = SELECT_ARRAY_SIZE,
+    ) -> Dict[str, np.ndarray | DictionaryArray]:
+        rows = self.select(database_name, table_name, columns, limit, condition_list)
+        if rows is None:
+            return None
+
+        column_names = columns or self._get_table(database_name, table_name)["columns"]
+        builder = ColumnarBuilder(
+            column_names,
+            ColumnarBuilder.infer_type_codes(rows, len(column_names)),
+        )
+
+        for start in range(0, len(rows), array_size):
+            builder.append(rows[start : start + array_size])
+
+        return builder.build()
+
+    def insert(
+        self, database_name: str, table_name: str, records: List[Record] | RecordBatch
+    ) -> bool:
+        table = self._get_table(database_name, table_name)
+        if table is None or not records:
+            return False
+
+        if not isinstance(records, RecordBatch):
+            records = RecordBatch.from_records(records)
+
+        with self._lock:
+            for values in records.valueList:
+                row = {column: None for column in table["columns"]}
+                row[table["key_column_name"]] = table["next_key"]
+                table["next_key"] += 1
+                row.update(zip(records.columnNameList, values))
+
+                table["rows"].append(row)
+
+        return True
+
+    def bulk_insert(
+        self, database_name: str, table_name: str, records: List[Record] | RecordBatch
+    ) -> bool:
+        return self.insert(database_name, table_name, records)
+
+    def update(
+        self,
+        database_name: str,
+        table_name: str,
+        record: Record,
+        join_model: JoinModel = None,
+        condition_list: List[Condition] = None,
+    ) -> bool:
+        table = self._get_table(database_name, table_name)
+        if table is None or join_model:
+            return False
+
+        with self._lock:
+            for row in table["rows"]:
+                if self._match(row, condition_list):
+                    for data_model in record.dataModelList:
+                        row[data_model.columnName] = data_model.value
+
+        return True
+
+    def delete(
+        self,
+        database_name: str,
+        table_name: str,
+        condition_list: List[Condition] = None,
+    ) -> bool:
+        table = self._get_table(database_name, table_name)
+        if table is None:
+            return False
+
+        with self._lock:
+            table["rows"] = [
+                row for row in table["rows"] if not self._match(row, condition_list)
+            ]
+
+        return True
+
+    def merge(self, *args, **kwargs) -> bool:
+        print("\nMERGE is not supported by the in-memory driver.")
+        self._logger.log_error("MERGE is not supported by the in-memory driver.")
+        return False
+
+    def begin_transaction(self) -> bool:
+        return True
+
+    def commit_transaction(self) -> bool:
+        return True
+
+    def rollback_transaction(self) -> bool:
+        return True
+
+    # endregion
+
+    # region Private methods
+
+    def _get_table(self, database_name: str, table_name: str) -> Dict:
+        table = self._databases.get(database_name, {}).get(table_name)
+
+        if table is None:
+            print(f"\nTable [{database_name}].[dbo].[{table_name}] does not exist.")
+            self._logger.log_error(
+                f"Table [{database_name}].[dbo].[{table_name}] does not exist."
+            )
+
+        return table
+
+    def _match(self, row: Dict, condition_list: List[Condition]) -> bool:
+        if isinstance(condition_list, Condition):
+            condition_list = [condition_list]
+
+        for condition in condition_list or []:
+            value = row.get(condition.column)
+
+            match (condition.operator):
+
+                case Operator.EQUAL_TO:
+                    matched = value == condition.value
+
+                case Operator.NOT_EQUAL_TO:
+                    matched = value != condition.value
+
+                case Operator.GREATER_THAN:
+                    matched = value is not None and value > condition.value
+
+                case Operator.LESS_THAN:
+                    matched = value is not None and value < condition.value
+
+                case Operator.GREATER_THAN_OR_EQUAL_TO:
+                    matched = value is not None and value >= condition.value
+
+                case Operator.LESS_THAN_OR_EQUAL_TO:
+                    matched = value is not None and value <= condition.value
+
+                # Only "IS NULL" and "IS NOT NULL" are meaningful
+                case Operator.IS:
+                    matched = value is None
+
+                case Operator.IS_NOT:
+                    matched = value is not None
+
+                case Operator.IN:
+                    matched = value in condition.value
+
+                case Operator.NOT_IN:
+                    matched = value not in condition.value
+
+                case _:
+                    raise ValueError(
+                        f"Unsupported operator of the in-memory driver: {condition.operator}."
+                    )
+
+            if not matched:
+                return False
+
+        return True
+
+    # endregion
@@ -0,0 +1,119 @@
+"""Memory held by the relational record models, per row."""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from .model import DataModel, DataType, Record, RecordBatch
+
+
+def to_dict_backed(data_class: type) -> type:
+    """Same fields as `data_class`, without `__slots__`."""
+    return make_dataclass(
+        data_class.__name__, [(field.name, field.type) for field in fields(data_class)]
+    )
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, float]:
+    """Return the bytes held by the result of `build` and the seconds it took."""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    result = build()
+
+    elapsed_time = time.perf_counter() - start_time
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del result
+    return current, elapsed_time
+
+
+def build_records(
+    data_model_class: type, record_class: type, rows: List[Tuple]
+) -> List:
+    return [
+        record_class(
+            [
+                data_model_class(
+                    columnName="Symbol", value=symbol, dataType=DataType.NVARCHAR
+                ),
+                data_model_class(
+                    columnName="LastTradingDate",
+                    value=last_trading_date,
+                    dataType=DataType.DATETIME,
+                ),
+                data_model_class(
+                    columnName="UpdateDate",
+                    value=update_date,
+                    dataType=DataType.DATETIME,
+                ),
+            ]
+        )
+        for symbol, last_trading_date, update_date in rows
+    ]
+
+
+def report(title: str, number_of_row: int, results: List[Tuple[str, int, float]]):
+    baseline = results[0][1]
+
+    print(f"\n{title} ({number_of_row} rows)")
+    for name, size, elapsed_time in results:
+        print(
+            f"  {name:<28} {size / 2**20:>9.2f} MiB {size / number_of_row:>8.0f} B/row "
+            f"{baseline / size:>6.1f}x smaller {elapsed_time:>7.2f} s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the memory held by relational record representations."
+    )
+    parser.add_argument("--records", type=int, default=200000)
+    arguments = parser.parse_args()
+
+    # Relational records, shaped like the rows of SymbolWatermark
+    now = datetime.now().replace(microsecond=0)
+    rows = [
+        (f"S{index:06d}", now - timedelta(days=index % 1000), now)
+        for index in range(arguments.records)
+    ]
+
+    DictBackedDataModel = to_dict_backed(DataModel)
+    DictBackedRecord = to_dict_backed(Record)
+
+    report(
+        "Relational records",
+        len(rows),
+        [
+            (
+                "dict-backed Record",
+                *measure(lambda: build_records(DictBackedDataModel, DictBackedRecord, rows)),
+            ),
+            ("slotted Record", *measure(lambda: build_records(DataModel, Record, rows))),
+            (
+                "RecordBatch",
+                *measure(
+                    lambda: RecordBatch(
+                        columnNameList=["Symbol", "LastTradingDate", "UpdateDate"],
+                        dataTypeList=[
+                            DataType.NVARCHAR,
+                            DataType.DATETIME,
+                            DataType.DATETIME,
+                        ],
+                        valueList=[
+                            (symbol, last_trading_date, update_date)
+                            for symbol, last_trading_date, update_date in rows
+                        ],
+                    )
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 from .enums import *
 
 
@@ -48,25 +48,67 @@ class Column:
     columnName: str
     dataType: DataType
     nullable: bool
+    unique: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DataModel:
     columnName: str
     value: str | int | float
     dataType: DataType
 
 
-@dataclass
+@dataclass(slots=True)
 class Record:
     dataModelList: List[DataModel]
 
 
-@dataclass
+@dataclass(slots=True)
+class RecordBatch:
+    """Rows of one table as tuples under a single column header."""
+
+    columnNameList: List[str]
+    dataTypeList: List[DataType]
+    valueList: List[Tuple]
+
+    def __len__(self) -> int:
+        return len(self.valueList)
+
+    @classmethod
+    def from_records(cls, records: List[Record]) -> "RecordBatch":
+        """Take the header from the first record, which all records must share."""
+        return cls(
+            columnNameList=[
+                data_model.columnName for data_model in records[0].dataModelList
+            ],
+            dataTypeList=[
+                data_model.dataType for data_model in records[0].dataModelList
+            ],
+            valueList=[
+                tuple(data_model.value for data_model in record.dataModelList)
+                for record in records
+            ],
+        )
+
+    def to_records(self) -> List[Record]:
+        return [
+            Record(
+                [
+                    DataModel(columnName=column_name, value=value, dataType=data_type)
+                    for column_name, data_type, value in zip(
+                        self.columnNameList, self.dataTypeList, values
+                    )
+                ]
+            )
+            for values in self.valueList
+        ]
+
+
+@dataclass(slots=True)
 class Condition:
     column: str
     operator: Operator
-    value: str | int | float  # Need to upgrade to avoid SQL injection
+    value: str | int | float
     dataType: DataType
 
 
@@ -90,7 +132,7 @@ class JoinModel:
 class ColumnToUpdate:
     target_column: str
     source_column: str = None
-    value: str | int | float = None  # Need to upgrade to avoid SQL injection
+    value: str | int | float = None
     dataType: DataType = None
 
 
@@ -112,3 +154,11 @@ class UpdateInMerge(ActionInMerge):
 @dataclass
 class DeleteInMerge(ActionInMerge):
     pass
+
+
+@dataclass(slots=True)
+class UnitOfWork:
+    commitBatchSize: int = None  # statements per commit, None for one commit
+    numberOfStatement: int = 0
+    failed: bool = False
+    committed: bool = False
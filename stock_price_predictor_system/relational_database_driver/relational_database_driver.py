@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from .model import UnitOfWork
 
 
 class RelationalDatabaseDriver(ABC):
@@ -40,10 +43,22 @@ class RelationalDatabaseDriver(ABC):
     def select(self) -> List:
         pass
 
+    @abstractmethod
+    def select_iter(self) -> Iterator:
+        pass
+
+    @abstractmethod
+    def select_columnar(self) -> Dict:
+        pass
+
     @abstractmethod
     def insert(self) -> bool:
         pass
 
+    @abstractmethod
+    def bulk_insert(self) -> bool:
+        pass
+
     @abstractmethod
     def update(self) -> bool:
         pass
@@ -63,3 +78,22 @@ class RelationalDatabaseDriver(ABC):
     @abstractmethod
     def rollback_transaction(self) -> bool:
         pass
+
+    @contextmanager
+    def unit_of_work(self, commit_batch_size: int = None) -> Iterator[UnitOfWork]:
+        """Run the block in one transaction, rolled back if it raises."""
+        unit_of_work = UnitOfWork(commitBatchSize=commit_batch_size)
+        if not self.begin_transaction():
+            raise RuntimeError("Cannot begin transaction.")
+
+        try:
+            yield unit_of_work
+
+        except BaseException:
+            self.rollback_transaction()
+            raise
+
+        if unit_of_work.failed:
+            self.rollback_transaction()
+        else:
+            unit_of_work.committed = bool(self.commit_transaction())
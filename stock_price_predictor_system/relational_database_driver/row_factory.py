@@ -0,0 +1,113 @@
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Callable, Iterator, Sequence, Tuple
+
+# Rows fetched at a time by `select_iter`
+SELECT_ARRAY_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def compile_row_factory(
+    row_type: type = None, columns: Tuple[str, ...] = None
+) -> Callable[[Sequence], object]:
+    """Compile a function that builds a `row_type` from a row of `columns`."""
+    if row_type is None:
+        return tuple
+
+    if issubclass(row_type, tuple) and hasattr(row_type, "_fields"):
+        if columns is None or columns == row_type._fields:
+            return row_type._make
+
+        names = columns
+
+    elif is_dataclass(row_type):
+        names = columns or tuple(field.name for field in fields(row_type))
+
+    else:
+        raise TypeError(
+            f"Cannot build rows of {row_type.__name__}. Must be a dataclass or a namedtuple."
+        )
+
+    for name in names:
+        if not name.isidentifier():
+            raise ValueError(
+                f"Column '{name}' cannot be a field of {row_type.__name__}."
+            )
+
+    arguments = ", ".join(f"{name}=row[{index}]" for index, name in enumerate(names))
+    namespace = {"row_type": row_type}
+    exec(f"def make_row(row):\n    return row_type({arguments})", namespace)
+
+    return namespace["make_row"]
+
+
+class RowIterator:
+    """Rows of a cursor, fetched in chunks; holds its connection until closed."""
+
+    def __init__(
+        self,
+        cursor,
+        row_factory: Callable[[Sequence], object],
+        close: Callable[[bool], None],
+        array_size: int = SELECT_ARRAY_SIZE,
+    ):
+        self._cursor = cursor
+        self._row_factory = row_factory
+        self._close = close
+        self._array_size = array_size
+
+        self._rows: Iterator = iter(())
+
+    # region Public methods
+
+    def __iter__(self) -> "RowIterator":
+        return self
+
+    def __next__(self):
+        # A caller that stops on an error may never close the iterator, so the
+        # connection is released before any exception leaves it
+        try:
+            return self._next_row()
+
+        except StopIteration:
+            self.close()
+            raise
+
+        except BaseException:
+            self.close(healthy=False)
+            raise
+
+    def __enter__(self) -> "RowIterator":
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close(healthy=exception_type is None)
+
+    def __del__(self):
+        self.close()
+
+    def close(self, healthy: bool = True):
+        if self._close:
+            close = self._close
+            self._close = None
+            close(healthy)
+
+    # endregion
+
+    # region Private methods
+
+    def _next_row(self):
+        while True:
+            for row in self._rows:
+                return row
+
+            if self._close is None:
+                raise StopIteration
+
+            rows = self._cursor.fetchmany(self._array_size)
+            if not rows:
+                raise StopIteration
+
+            self._rows = map(self._row_factory, rows)
+
+    # endregion
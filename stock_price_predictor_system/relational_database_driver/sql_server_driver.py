@@ -1,15 +1,64 @@
+import numpy as np
 import pyodbc
-from typing import List, Tuple
-
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+from .connection_pool import (
+    POOL_HEALTH_CHECK_INTERVAL,
+    POOL_MAX_IDLE_TIME,
+    POOL_MAX_LIFETIME,
+    POOL_MAX_SIZE,
+    ConnectionPool,
+    PooledConnection,
+)
+from .columnar import ColumnarBuilder, DictionaryArray
 from .relational_database_driver import RelationalDatabaseDriver
+from .row_factory import SELECT_ARRAY_SIZE, RowIterator, compile_row_factory
 from .model import *
 from ..logger.logger import Logger
 
+# SQL Server limits
+MAX_PARAMETERS_PER_STATEMENT = 2100
+MAX_ROWS_PER_VALUES_CLAUSE = 1000
+
+# Rows bound at once by `bulk_insert`, which holds them in one parameter array
+BULK_INSERT_MAX_ROWS_PER_CHUNK = 10000
+BULK_INSERT_MAX_PARAMETERS_PER_CHUNK = 200000
+
 
 class SqlServerDriver(RelationalDatabaseDriver):
 
-    def __init__(self, _logger: Logger):
+    def __init__(
+        self,
+        _logger: Logger,
+        enable_catalog_cache: bool = True,
+        pool_size: int = POOL_MAX_SIZE,
+        max_idle_time: float = POOL_MAX_IDLE_TIME,
+        max_lifetime: float = POOL_MAX_LIFETIME,
+        health_check_interval: float = POOL_HEALTH_CHECK_INTERVAL,
+    ):
         self._logger = _logger
+        self._statement_cache: Dict[Tuple, str] = {}
+
+        self._enable_catalog_cache = enable_catalog_cache
+        self._database_names: Set[str] = None
+        self._table_names: Dict[str, Set[str]] = {}
+        self._catalog_version = 0  # incremented whenever the cache is reset
+        self._catalog_lock = threading.Lock()
+        self._number_of_round_trip = 0
+        self._lock = threading.Lock()
+
+        self._pool_size = pool_size
+        self._max_idle_time = max_idle_time
+        self._max_lifetime = max_lifetime
+        self._health_check_interval = health_check_interval
+        self._pool: ConnectionPool = None
+
+        # Open transaction and units of work of each thread
+        self._local = threading.local()
 
     # region Public methods
 
@@ -21,12 +70,22 @@ class SqlServerDriver(RelationalDatabaseDriver):
             self._logger.log_info(f"Start to connect to SQL Server.")
 
             _connection_string = f"DRIVER={self._authentication.driver};SERVER={self._authentication.server};DATABASE={self._authentication.database};UID={self._authentication.login};PWD={self._authentication.password}"
-            self._connection = pyodbc.connect(
-                _connection_string, autocommit=True, timeout=10
+
+            if self._pool:
+                self._pool.close()
+
+            self._pool = ConnectionPool(
+                lambda: pyodbc.connect(_connection_string, autocommit=True, timeout=10),
+                max_size=self._pool_size,
+                max_idle_time=self._max_idle_time,
+                max_lifetime=self._max_lifetime,
+                health_check_interval=self._health_check_interval,
             )
-            self._cursor = self._connection.cursor()
             self._current_database = None
 
+            # Open the first connection now, to report a wrong configuration
+            self._pool.release(self._pool.acquire())
+
             print("Connected to SQL Server.")
             self._logger.log_info(
                 f"Connected to SQL Server.",
@@ -41,8 +100,9 @@ class SqlServerDriver(RelationalDatabaseDriver):
             return False
 
     def close_connection(self):
-        if "connection" in locals():
-            self._connection.close()
+        if self._pool:
+            self._pool.close()
+            self._pool = None
 
             print("\nClosed connection to SQL Server.")
             self._logger.log_info(
@@ -58,39 +118,85 @@ class SqlServerDriver(RelationalDatabaseDriver):
     def get_current_database(self):
         return self._current_database
 
-    def check_database_exist(self, database_name: str):
-        query = f"""
+    @property
+    def number_of_cached_statement(self) -> int:
+        return len(self._statement_cache)
+
+    @property
+    def number_of_round_trip(self) -> int:
+        return self._number_of_round_trip
+
+    def refresh_catalog(self):
+        """Forget the cached catalog, it is read again by the next check."""
+        with self._catalog_lock:
+            self._database_names = None
+            self._table_names.clear()
+            self._catalog_version += 1
+
+        self._logger.log_info("Refreshed catalog of SQL Server.")
+
+    def check_database_exist(self, database_name: str, refresh: bool = False):
+        if self._enable_catalog_cache:
+            if refresh:
+                self._invalidate_catalog(database_name, include_databases=True)
+
+            # Another thread may reset the cache, so it is only read once
+            database_names = self._database_names
+            if database_names is None:
+                database_names = self._load_database_names()
+                if database_names is None:
+                    return
+
+            return database_name.casefold() in database_names
+
+        query = """
             SELECT 
             CASE 
-                WHEN EXISTS (SELECT 1 FROM sys.databases WHERE name = '{database_name}') 
+                WHEN EXISTS (SELECT 1 FROM sys.databases WHERE name = ?) 
                 THEN 'True' 
                 ELSE 'False' 
             END AS Result;
         """
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        result = self._fetch_query(query, [database_name])
+        if result is None:
             return
 
-        result = self._cursor.fetchall()
-
         if result[0][0] == "True":
             return True
         else:
             return False
 
-    def check_table_exist(self, database_name: str, table_name: str):
-        query = f"""
+    def check_table_exist(
+        self, database_name: str, table_name: str, refresh: bool = False
+    ):
+        if self._enable_catalog_cache:
+            if refresh:
+                self._invalidate_catalog(database_name)
+
+            table_names = self._table_names.get(database_name.casefold())
+
+            if table_names is None:
+                if not self.check_database_exist(database_name):
+                    return False
+
+                table_names = self._load_table_names(database_name)
+                if table_names is None:
+                    return
+
+            return table_name.casefold() in table_names
+
+        query = """
             SELECT CASE 
-                WHEN OBJECT_ID('{database_name}.dbo.{table_name}', 'U') IS NOT NULL THEN 'True'
+                WHEN OBJECT_ID(?, 'U') IS NOT NULL THEN 'True'
                 ELSE 'False'
             END AS Result;
         """
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        result = self._fetch_query(query, [f"{database_name}.dbo.{table_name}"])
+        if result is None:
             return
 
-        result = self._cursor.fetchall()
-
         if result[0][0] == "True":
             return True
         else:
@@ -110,7 +216,9 @@ class SqlServerDriver(RelationalDatabaseDriver):
             CREATE DATABASE [{database_name}];
         """
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        executed = self._execute_query(query)
+        self._invalidate_catalog(database_name, include_databases=True)
+        if not executed:
             return
 
         query = f"""
@@ -196,7 +304,7 @@ class SqlServerDriver(RelationalDatabaseDriver):
         key_column_in_query = f"{key_column.columnName} {key_column.dataType} IDENTITY(1,1) PRIMARY KEY NOT NULL,"
         other_columns_in_query = ",\n\t".join(
             [
-                f"{column.columnName} {column.dataType} {'NULL' if column.nullable else 'NOT NULL'}"
+                f"{column.columnName} {column.dataType} {'NULL' if column.nullable else 'NOT NULL'}{' UNIQUE' if column.unique else ''}"
                 for column in other_columns
             ]
         )
@@ -228,7 +336,9 @@ CREATE TABLE {table_name} (
 );"""
 
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        executed = self._execute_query(query)
+        self._invalidate_catalog(database_name)
+        if not executed:
             return False
 
         print(
@@ -283,7 +393,9 @@ CREATE TABLE {table_name} (
             return False
 
         query = f"""DROP TABLE [{database_name}].[dbo].[{table_name}]"""
-        if not self._execute_query(query):
+        executed = self._execute_query(query)
+        self._invalidate_catalog(database_name)
+        if not executed:
             return
 
     def select(
@@ -294,95 +406,170 @@ CREATE TABLE {table_name} (
         limit: int = None,
         condition_list: List[Condition] = None,
     ) -> List[Tuple]:
-        # Validate the database
-        if not self.check_database_exist(database_name):
+        statement = self._build_select_query(
+            database_name, table_name, columns, limit, condition_list
+        )
+        if statement is None:
+            return None
+
+        query, parameters, columns = statement
+
+        try:
+            result = self._fetch_query(query, parameters)
+            if result is None:
+                return
+
             print(
-                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since database [{database_name}] does not exist."
+                f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {len(result)} records."
             )
-            self._logger.log_warning(
-                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since database [{database_name}] does not exist."
+            self._logger.log_info(
+                f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {len(result)} records."
             )
-            return None
 
-        # Validate the table
-        if not self.check_table_exist(database_name, table_name):
+            return result
+
+        except Exception as e:
             print(
-                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since table [{database_name}].[dbo].[{table_name}] does not exist."
+                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
             )
-            self._logger.log_warning(
-                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since table [{database_name}].[dbo].[{table_name}] does not exist."
+            self._logger.log_error(
+                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
             )
+
             return None
 
-        # Validate columns to be retrieved
-        if columns and (not isinstance(columns, List) or len(columns) < 1):
-            print(
-                f"Invalid columns to SELECT from table [{database_name}].[dbo].[{table_name}]. 'columns' value will not be applied."
-            )
-            self._logger.log_warning(
-                f"Invalid columns to SELECT from table [{database_name}].[dbo].[{table_name}]. 'columns' value will not be applied."
+    def select_iter(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str] = None,
+        limit: int = None,
+        condition_list: List[Condition] = None,
+        row_type: type = None,
+        array_size: int = SELECT_ARRAY_SIZE,
+    ) -> RowIterator:
+        """Like `select`, but fetch rows lazily; None if the query fails."""
+        statement = self._build_select_query(
+            database_name, table_name, columns, limit, condition_list
+        )
+        if statement is None:
+            return None
+
+        query, parameters, columns = statement
+        self._count_round_trip()
+
+        try:
+            row_factory = compile_row_factory(
+                row_type, tuple(columns) if columns else None
             )
-            columns = None
+            cursor, close_cursor = self._open_cursor()
 
-        # Validate limit value
-        if limit and (not isinstance(limit, int) or limit < 0):
+        except Exception as e:
             print(
-                f"Invalid 'limit' value in SELECT query from table [{database_name}].[dbo].[{table_name}]. 'limit' value will not be applied."
+                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
             )
-            self._logger.log_warning(
-                f"Invalid 'limit' value in SELECT query from table [{database_name}].[dbo].[{table_name}]. 'limit' value will not be applied."
+            self._logger.log_error(
+                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
             )
-            limit = None
+            return None
 
-        columns_string = ""
-        if not columns:
-            columns_string = "*"
-        else:
-            columns_string = ",".join(columns)
+        try:
+            cursor.arraysize = array_size
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
 
-        query = ""
-        if limit:
-            query = f"SELECT TOP ({limit}) {columns_string} FROM [{database_name}].[dbo].[{table_name}]"
+        except Exception as e:
+            close_cursor(False)
+            self._fail_unit_of_work()
 
-        else:
-            query = (
-                f"SELECT {columns_string} FROM [{database_name}].[dbo].[{table_name}]"
-            )
+            print(f"Error executing query:\n{query}")
+            print(f"Error detail: {e}")
+            self._logger.log_error(f"Error executing query:\n{query}")
+            self._logger.log_error(f"Error detail: {e}")
+            return None
 
-        condition_query = self._add_condition(condition_list=condition_list)
-        if condition_query:
-            query += condition_query
+        self._count_statement_of_unit_of_work()
 
-        self._cursor.fetchall()
+        print(
+            f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Fetching {array_size} records at a time."
+        )
+        self._logger.log_info(
+            f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Fetching {array_size} records at a time."
+        )
 
-        try:
-            if not self._execute_query(query):
-                return
+        return RowIterator(cursor, row_factory, close_cursor, array_size)
 
-            result = self._cursor.fetchall()
+    def select_columnar(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str] = None,
+        limit: int = None,
+        condition_list: List[Condition] = None,
+        array_size: int = SELECT_ARRAY_SIZE,
+    ) -> Dict[str, np.ndarray | DictionaryArray]:
+        """Like `select`, but return one typed array per column."""
+        statement = self._build_select_query(
+            database_name, table_name, columns, limit, condition_list
+        )
+        if statement is None:
+            return None
 
-            print(
-                f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {len(result)} records."
-            )
-            self._logger.log_info(
-                f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {len(result)} records."
-            )
+        query, parameters, columns = statement
+        self._count_round_trip()
 
-            return result
+        try:
+            with self._checkout_cursor() as cursor:
+                cursor.arraysize = array_size
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+
+                builder = ColumnarBuilder(
+                    [description[0] for description in cursor.description],
+                    [description[1] for description in cursor.description],
+                )
+
+                while rows := cursor.fetchmany(array_size):
+                    builder.append(rows)
 
         except Exception as e:
-            print(
-                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
-            )
-            self._logger.log_error(
-                f"Cannot SELECT with columns: {columns} from table '[{database_name}].[dbo].[{table_name}]'\nError: {e}."
-            )
+            self._fail_unit_of_work()
 
+            print(f"Error executing query:\n{query}")
+            print(f"Error detail: {e}")
+            self._logger.log_error(f"Error executing query:\n{query}")
+            self._logger.log_error(f"Error detail: {e}")
             return None
 
-    def insert(self, database_name: str, table_name: str, records: List[Record]):
+        self._count_statement_of_unit_of_work()
+        result = builder.build()
+
+        number_of_record = len(next(iter(result.values()))) if result else 0
+        print(
+            f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {number_of_record} records as columns."
+        )
+        self._logger.log_info(
+            f"Successfully SELECT from table '[{database_name}].[dbo].[{table_name}]'. Retrieved {number_of_record} records as columns."
+        )
+
+        return result
+
+    def insert(
+        self,
+        database_name: str,
+        table_name: str,
+        records: List[Record] | RecordBatch,
+    ):
         # Check whether records has at least one record
-        if not records or not isinstance(records, List) or not len(records) > 0:
+        if (
+            not records
+            or not isinstance(records, (List, RecordBatch))
+            or not len(records) > 0
+        ):
             print(
                 f"'Invalid data for 'records'.",
             )
@@ -413,34 +600,147 @@ CREATE TABLE {table_name} (
             )
             return False
 
-        column_names_in_query = ",\n    ".join(
-            [f"[{data_model.columnName}]" for data_model in records[0].dataModelList]
+        if not isinstance(records, RecordBatch):
+            records = RecordBatch.from_records(records)
+
+        # Both the rows of a VALUES clause and the parameters of a statement
+        # are limited, so large batches take several statements.
+        number_of_column = len(records.columnNameList)
+        number_of_row_per_statement = max(
+            1,
+            min(
+                MAX_ROWS_PER_VALUES_CLAUSE,
+                (MAX_PARAMETERS_PER_STATEMENT - 1) // number_of_column,
+            ),
         )
 
-        new_values = ",\n".join(
-            f"""(
-    {", ".join(self._format_value(data_model.value, data_model.dataType) for data_model in record.dataModelList)}
-)"""
-            for record in records
+        for start in range(0, len(records), number_of_row_per_statement):
+            values_list = records.valueList[start : start + number_of_row_per_statement]
+
+            query = self._get_statement(
+                (
+                    "insert",
+                    database_name,
+                    table_name,
+                    tuple(records.columnNameList),
+                    len(values_list),
+                ),
+                lambda: self._build_insert_query(
+                    database_name, table_name, records.columnNameList, len(values_list)
+                ),
+            )
+            parameters = [
+                self._to_parameter(value, data_type)
+                for values in values_list
+                for value, data_type in zip(values, records.dataTypeList)
+            ]
+
+            self._logger.log_debug(f"\n{query}")
+            if not self._execute_query(query, parameters):
+                return False
+
+        print(
+            f"Inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}]",
+        )
+        self._logger.log_info(
+            f"Inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}]",
         )
 
-        query = f"""INSERT INTO [{database_name}].[dbo].[{table_name}]
-(
-    {column_names_in_query}
-)
-VALUES
-{new_values}
-"""
+        return True
+
+    def bulk_insert(
+        self,
+        database_name: str,
+        table_name: str,
+        records: List[Record] | RecordBatch,
+    ):
+        """Insert through `fast_executemany`, in chunks of typed parameter arrays."""
+        if (
+            not records
+            or not isinstance(records, (List, RecordBatch))
+            or not len(records) > 0
+        ):
+            print(
+                f"'Invalid data for 'records'.",
+            )
+            self._logger.log_warning(
+                f"'Invalid data for 'records'.",
+            )
+            return False
+
+        if not self.check_database_exist(database_name):
+            print(
+                f"Datbase [{database_name}] does not exist yet. Cannot insert data.",
+            )
+            self._logger.log_info(
+                f"Datbase [{database_name}] does not exist yet. Cannot insert data.",
+            )
+            return False
+
+        if not self.check_table_exist(
+            database_name=database_name, table_name=table_name
+        ):
+            print(
+                f"Table [{database_name}].[dbo].[{table_name}] does not exist yet. Cannot insert data",
+            )
+            self._logger.log_info(
+                f"Table [{database_name}].[dbo].[{table_name}] does not exist yet. Cannot insert data",
+            )
+            return False
+
+        if not isinstance(records, RecordBatch):
+            records = RecordBatch.from_records(records)
+
+        query = self._get_statement(
+            ("insert", database_name, table_name, tuple(records.columnNameList), 1),
+            lambda: self._build_insert_query(
+                database_name, table_name, records.columnNameList, 1
+            ),
+        )
+        number_of_row_per_chunk = max(
+            1,
+            min(
+                BULK_INSERT_MAX_ROWS_PER_CHUNK,
+                BULK_INSERT_MAX_PARAMETERS_PER_CHUNK // len(records.columnNameList),
+            ),
+        )
 
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        start_time = time.perf_counter()
+
+        # The cursor is only used for this insert, so its array settings do
+        # not leak into other statements.
+        try:
+            with self._checkout_cursor() as cursor:
+                cursor.fast_executemany = True
+
+                for start in range(0, len(records), number_of_row_per_chunk):
+                    input_sizes, parameters = self._get_parameter_arrays(
+                        records.dataTypeList,
+                        records.valueList[start : start + number_of_row_per_chunk],
+                    )
+                    cursor.setinputsizes(input_sizes)
+                    cursor.executemany(query, parameters)
+                    self._count_round_trip()
+                    self._count_statement_of_unit_of_work()
+
+        except Exception as e:
+            self._fail_unit_of_work()
+
+            print(f"Error executing query:\n{query}")
+            print(f"Error detail: {e}")
+            self._logger.log_error(f"Error executing query:\n{query}")
+            self._logger.log_error(f"Error detail: {e}")
             return False
 
+        elapsed_time = time.perf_counter() - start_time
+        number_of_row_per_second = len(records) / elapsed_time if elapsed_time else 0
+
         print(
-            f"Inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}]",
+            f"Bulk inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}] in {elapsed_time:.3f}s ({number_of_row_per_second:.0f} rows/s).",
         )
         self._logger.log_info(
-            f"Inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}]",
+            f"Bulk inserted {len(records)} records into table [{database_name}].[dbo].[{table_name}] in {elapsed_time:.3f}s ({number_of_row_per_second:.0f} rows/s).",
         )
 
         return True
@@ -485,23 +785,44 @@ VALUES
             )
             return False
 
-        query = f"""UPDATE [{database_name}].[dbo].[{table_name}]
-SET {",\n\t".join(f"{data_model.columnName} = {self._format_value(data_model.value, data_model.dataType)}" for data_model in record.dataModelList)}
+        condition_list = self._to_condition_list(condition_list)
+
+        def build_query() -> str:
+            query = f"""UPDATE [{database_name}].[dbo].[{table_name}]
+SET {",\n\t".join(f"{data_model.columnName} = ?" for data_model in record.dataModelList)}
 """
 
-        if join_model:
-            join_query = self._add_join(join_model=join_model)
-            if join_query:
-                query += join_query
+            if join_model:
+                join_query = self._add_join(join_model=join_model)
+                if join_query:
+                    query += join_query
 
-        if condition_list:
-            condition_query = self._add_condition(condition_list=condition_list)
-            if condition_query:
-                query += condition_query
+            if condition_list:
+                condition_query = self._add_condition(condition_list=condition_list)
+                if condition_query:
+                    query += condition_query
+
+            return query
+
+        query = self._get_statement(
+            (
+                "update",
+                database_name,
+                table_name,
+                tuple(data_model.columnName for data_model in record.dataModelList),
+                self._get_join_shape(join_model),
+                self._get_condition_shape(condition_list),
+            ),
+            build_query,
+        )
+        parameters = [
+            self._to_parameter(data_model.value, data_model.dataType)
+            for data_model in record.dataModelList
+        ] + self._get_condition_parameters(condition_list)
 
         self._logger.log_debug(f"\n{query}")
 
-        return self._execute_query(query)
+        return self._execute_query(query, parameters)
 
     def delete(
         self,
@@ -527,14 +848,31 @@ SET {",\n\t".join(f"{data_model.columnName} = {self._format_value(data_model.val
             )
             return False
 
-        query = f"DELETE FROM [{database_name}].[dbo].[{table_name}]"
+        condition_list = self._to_condition_list(condition_list)
 
-        if condition_list:
-            conditions = self._add_condition(condition_list)
-            if conditions:
-                query += conditions
+        def build_query() -> str:
+            query = f"DELETE FROM [{database_name}].[dbo].[{table_name}]"
 
-        if not self._execute_query(query):
+            if condition_list:
+                conditions = self._add_condition(condition_list)
+                if conditions:
+                    query += conditions
+
+            return query
+
+        query = self._get_statement(
+            (
+                "delete",
+                database_name,
+                table_name,
+                self._get_condition_shape(condition_list),
+            ),
+            build_query,
+        )
+
+        if not self._execute_query(
+            query, self._get_condition_parameters(condition_list)
+        ):
             return False
 
         print(f"Successfully purge data from table '{table_name}'.")
@@ -613,8 +951,20 @@ WHEN NOT MATCHED BY SOURCE THEN
     {parsed_action_when_not_match_by_source};
 """
 
+        parameters = [
+            self._to_parameter(column_pair.value, column_pair.dataType)
+            for action in (
+                action_when_match,
+                action_when_not_match_by_target,
+                action_when_not_match_by_source,
+            )
+            for column_pair in getattr(action, "column_to_update_list", [])
+            if not column_pair.source_column
+            and column_pair.dataType not in [DataType.RAW]
+        ]
+
         self._logger.log_debug(f"\n{query}")
-        if not self._execute_query(query):
+        if not self._execute_query(query, parameters):
             return False
 
         print(
@@ -627,36 +977,524 @@ WHEN NOT MATCHED BY SOURCE THEN
         return True
 
     def begin_transaction(self) -> bool:
-        pass
+        if self._get_transaction_connection():
+            print("\nA transaction is already open in this thread. Use a savepoint.")
+            self._logger.log_warning(
+                "A transaction is already open in this thread. Use a savepoint."
+            )
+            return False
+
+        if not self._pool:
+            print("\nCannot begin transaction since not connected to SQL Server.")
+            self._logger.log_error(
+                "Cannot begin transaction since not connected to SQL Server."
+            )
+            return False
+
+        pool = self._pool
+        try:
+            pooled_connection = pool.acquire()
+
+        except Exception as e:
+            print(f"\nCannot begin transaction. Error: {e}.")
+            self._logger.log_error(f"Cannot begin transaction. Error: {e}.")
+            return False
+
+        try:
+            pooled_connection.connection.autocommit = False
+
+        except Exception as e:
+            pool.discard(pooled_connection)
+
+            print(f"\nCannot begin transaction. Error: {e}.")
+            self._logger.log_error(f"Cannot begin transaction. Error: {e}.")
+            return False
+
+        self._local.pool = pool
+        self._local.pooled_connection = pooled_connection
+
+        return True
 
     def commit_transaction(self) -> bool:
-        pass
+        pooled_connection = self._get_transaction_connection()
+        if not pooled_connection:
+            print("\nCannot commit since no transaction is open in this thread.")
+            self._logger.log_warning(
+                "Cannot commit since no transaction is open in this thread."
+            )
+            return False
+
+        try:
+            pooled_connection.connection.commit()
+
+        except Exception as e:
+            print(f"\nCannot commit transaction. Error: {e}.")
+            self._logger.log_error(f"Cannot commit transaction. Error: {e}.")
+
+            self._end_transaction(rollback=True)
+            return False
+
+        return self._end_transaction(rollback=False)
 
     def rollback_transaction(self) -> bool:
-        pass
+        if not self._get_transaction_connection():
+            print("\nCannot roll back since no transaction is open in this thread.")
+            self._logger.log_warning(
+                "Cannot roll back since no transaction is open in this thread."
+            )
+            return False
+
+        return self._end_transaction(rollback=True)
+
+    def savepoint(self, savepoint_name: str) -> bool:
+        if not self._get_transaction_connection():
+            print(
+                f"\nCannot save transaction [{savepoint_name}] since no transaction is open in this thread."
+            )
+            self._logger.log_warning(
+                f"Cannot save transaction [{savepoint_name}] since no transaction is open in this thread."
+            )
+            return False
+
+        query = f"SAVE TRANSACTION [{savepoint_name}];"
+        self._logger.log_debug(f"\n{query}")
+
+        return self._execute_query(query)
+
+    def rollback_to_savepoint(self, savepoint_name: str) -> bool:
+        if not self._get_transaction_connection():
+            print(
+                f"\nCannot roll back to [{savepoint_name}] since no transaction is open in this thread."
+            )
+            self._logger.log_warning(
+                f"Cannot roll back to [{savepoint_name}] since no transaction is open in this thread."
+            )
+            return False
+
+        query = f"ROLLBACK TRANSACTION [{savepoint_name}];"
+        self._logger.log_debug(f"\n{query}")
+
+        return self._execute_query(query)
+
+    @contextmanager
+    def unit_of_work(self, commit_batch_size: int = None) -> Iterator[UnitOfWork]:
+        """Nested units are savepoints; RuntimeError if no transaction can begin."""
+        unit_of_work = UnitOfWork(commitBatchSize=commit_batch_size)
+        unit_of_work_list = self._get_unit_of_work_list()
+
+        if self._get_transaction_connection():
+            savepoint_name = f"UnitOfWork{len(unit_of_work_list)}"
+            unit_of_work_list.append(unit_of_work)
+
+            # Without the savepoint, the unit could only be undone with the
+            # whole transaction, so the enclosing unit is failed too
+            if not self.savepoint(savepoint_name):
+                unit_of_work_list.pop()
+                unit_of_work_list[-1].failed = True
+                raise RuntimeError(f"Cannot save transaction [{savepoint_name}].")
+
+            try:
+                yield unit_of_work
+
+            except BaseException:
+                unit_of_work_list.pop()
+                self.rollback_to_savepoint(savepoint_name)
+                raise
+
+            unit_of_work_list.pop()
+            if unit_of_work.failed:
+                self.rollback_to_savepoint(savepoint_name)
+            else:
+                unit_of_work.committed = True
+
+            return
+
+        if not self.begin_transaction():
+            raise RuntimeError("Cannot begin transaction.")
+
+        unit_of_work_list.append(unit_of_work)
+
+        try:
+            yield unit_of_work
+
+        except BaseException:
+            unit_of_work_list.pop()
+            self.rollback_transaction()
+            raise
+
+        unit_of_work_list.pop()
+        if unit_of_work.failed:
+            self.rollback_transaction()
+        else:
+            unit_of_work.committed = self.commit_transaction()
 
     # endregion
 
     # region Private methods
 
-    def _execute_query(self, query: str):
+    @contextmanager
+    def _checkout_cursor(self) -> Iterator[pyodbc.Cursor]:
+        """A cursor of a pooled connection, for one operation."""
+        cursor, close_cursor = self._open_cursor()
+        healthy = True
+
         try:
-            self._cursor.execute(query)
-            return True
+            yield cursor
+
+        except Exception:
+            healthy = False
+            raise
+
+        finally:
+            close_cursor(healthy)
+
+    def _open_cursor(self) -> Tuple[pyodbc.Cursor, Callable[[bool], None]]:
+        """Cursor on the connection of this thread's transaction or a pooled one."""
+        pooled_connection = self._get_transaction_connection()
+        if pooled_connection:
+            cursor = pooled_connection.connection.cursor()
+            return cursor, lambda healthy: cursor.close()
+
+        if not self._pool:
+            raise RuntimeError("Not connected to SQL Server.")
+
+        pool = self._pool
+        pooled_connection = pool.acquire()
+
+        try:
+            cursor = pooled_connection.connection.cursor()
+
+        except Exception:
+            pool.release(pooled_connection, healthy=False)
+            raise
+
+        def close_cursor(healthy: bool):
+            try:
+                cursor.close()
+
+            # The connection is checked before its next use
+            except Exception:
+                healthy = False
+
+            pool.release(pooled_connection, healthy)
+
+        return cursor, close_cursor
+
+    def _count_round_trip(self):
+        with self._lock:
+            self._number_of_round_trip += 1
+
+    def _execute_query(self, query: str, parameters: List = None):
+        return self._run_query(query, parameters, fetch=False) is not None
+
+    def _fetch_query(self, query: str, parameters: List = None) -> List[Tuple]:
+        """Return all rows of the query, or None if it failed."""
+        return self._run_query(query, parameters, fetch=True)
+
+    def _run_query(self, query: str, parameters: List, fetch: bool) -> List[Tuple]:
+        self._count_round_trip()
+
+        try:
+            with self._checkout_cursor() as cursor:
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+
+                result = cursor.fetchall() if fetch else []
 
         except Exception as e:
+            self._fail_unit_of_work()
+
             print(f"Error executing query:\n{query}")
             print(f"Error detail: {e}")
             self._logger.log_error(f"Error executing query:\n{query}")
             self._logger.log_error(f"Error detail: {e}")
+            return None
+
+        self._count_statement_of_unit_of_work()
+        return result
+
+    def _get_transaction_connection(self) -> PooledConnection:
+        return getattr(self._local, "pooled_connection", None)
+
+    def _get_unit_of_work_list(self) -> List[UnitOfWork]:
+        if not hasattr(self._local, "unit_of_work_list"):
+            self._local.unit_of_work_list = []
+
+        return self._local.unit_of_work_list
+
+    def _end_transaction(self, rollback: bool) -> bool:
+        pool = self._local.pool
+        pooled_connection = self._local.pooled_connection
+        self._local.pool = None
+        self._local.pooled_connection = None
+
+        try:
+            if rollback:
+                pooled_connection.connection.rollback()
+
+            pooled_connection.connection.autocommit = True
+
+        # A connection whose transaction may still be open is not reused
+        except Exception as e:
+            pool.discard(pooled_connection)
+
+            print(f"\nCannot end transaction. Error: {e}.")
+            self._logger.log_error(f"Cannot end transaction. Error: {e}.")
             return False
 
+        pool.release(pooled_connection)
+        return True
+
+    def _fail_unit_of_work(self):
+        unit_of_work_list = self._get_unit_of_work_list()
+        if unit_of_work_list:
+            unit_of_work_list[-1].failed = True
+
+    def _count_statement_of_unit_of_work(self):
+        unit_of_work_list = self._get_unit_of_work_list()
+        if not unit_of_work_list:
+            return
+
+        unit_of_work = unit_of_work_list[0]
+        unit_of_work.numberOfStatement += 1
+
+        # A commit ends the savepoints, so inner units of work hold the batch
+        if (
+            not unit_of_work.commitBatchSize
+            or unit_of_work.failed
+            or len(unit_of_work_list) > 1
+            or unit_of_work.numberOfStatement % unit_of_work.commitBatchSize
+        ):
+            return
+
+        try:
+            self._get_transaction_connection().connection.commit()
+
+        except Exception as e:
+            unit_of_work.failed = True
+
+            print(f"\nCannot commit transaction. Error: {e}.")
+            self._logger.log_error(f"Cannot commit transaction. Error: {e}.")
+
+    def _load_database_names(self) -> Set[str]:
+        catalog_version = self._catalog_version
+
+        query = "SELECT name FROM sys.databases;"
+        self._logger.log_debug(f"\n{query}")
+        result = self._fetch_query(query)
+        if result is None:
+            return None
+
+        # A catalog reset while the query ran may have made the result stale
+        database_names = {row[0].casefold() for row in result}
+        with self._catalog_lock:
+            if self._catalog_version == catalog_version:
+                self._database_names = database_names
+
+        return database_names
+
+    def _load_table_names(self, database_name: str) -> Set[str]:
+        catalog_version = self._catalog_version
+
+        query = f"""
+            SELECT T.name
+            FROM [{database_name}].sys.tables AS T
+            INNER JOIN [{database_name}].sys.schemas AS S ON T.schema_id = S.schema_id
+            WHERE S.name = 'dbo';
+        """
+        self._logger.log_debug(f"\n{query}")
+        result = self._fetch_query(query)
+        if result is None:
+            return None
+
+        table_names = {row[0].casefold() for row in result}
+        with self._catalog_lock:
+            if self._catalog_version == catalog_version:
+                self._table_names[database_name.casefold()] = table_names
+
+        return table_names
+
+    def _invalidate_catalog(self, database_name: str, include_databases: bool = False):
+        # SQL Server compares names case-insensitively by default
+        with self._catalog_lock:
+            if include_databases:
+                self._database_names = None
+
+            self._table_names.pop(database_name.casefold(), None)
+            self._catalog_version += 1
+
+    def _get_statement(self, key: Tuple, build_statement: Callable[[], str]) -> str:
+        """Return the cached statement of `key`, building it on the first call."""
+        statement = self._statement_cache.get(key)
+
+        if statement is None:
+            statement = build_statement()
+            self._statement_cache[key] = statement
+
+        return statement
+
+    def _build_select_query(
+        self,
+        database_name: str,
+        table_name: str,
+        columns: List[str],
+        limit: int,
+        condition_list: List[Condition],
+    ) -> Tuple[str, List, List[str]]:
+        """Query, parameters and retrieved columns (None for all), None if invalid."""
+        # Validate the database
+        if not self.check_database_exist(database_name):
+            print(
+                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since database [{database_name}] does not exist."
+            )
+            self._logger.log_warning(
+                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since database [{database_name}] does not exist."
+            )
+            return None
+
+        # Validate the table
+        if not self.check_table_exist(database_name, table_name):
+            print(
+                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since table [{database_name}].[dbo].[{table_name}] does not exist."
+            )
+            self._logger.log_warning(
+                f"Cannot SELECT from table [{database_name}].[dbo].[{table_name}] since table [{database_name}].[dbo].[{table_name}] does not exist."
+            )
+            return None
+
+        # Validate columns to be retrieved
+        if columns and (not isinstance(columns, List) or len(columns) < 1):
+            print(
+                f"Invalid columns to SELECT from table [{database_name}].[dbo].[{table_name}]. 'columns' value will not be applied."
+            )
+            self._logger.log_warning(
+                f"Invalid columns to SELECT from table [{database_name}].[dbo].[{table_name}]. 'columns' value will not be applied."
+            )
+            columns = None
+
+        # Validate limit value
+        if limit and (not isinstance(limit, int) or limit < 0):
+            print(
+                f"Invalid 'limit' value in SELECT query from table [{database_name}].[dbo].[{table_name}]. 'limit' value will not be applied."
+            )
+            self._logger.log_warning(
+                f"Invalid 'limit' value in SELECT query from table [{database_name}].[dbo].[{table_name}]. 'limit' value will not be applied."
+            )
+            limit = None
+
+        condition_list = self._to_condition_list(condition_list)
+
+        def build_query() -> str:
+            columns_string = ""
+            if not columns:
+                columns_string = "*"
+            else:
+                columns_string = ",".join(columns)
+
+            query = ""
+            if limit:
+                query = f"SELECT TOP (?) {columns_string} FROM [{database_name}].[dbo].[{table_name}]"
+
+            else:
+                query = f"SELECT {columns_string} FROM [{database_name}].[dbo].[{table_name}]"
+
+            condition_query = self._add_condition(condition_list=condition_list)
+            if condition_query:
+                query += condition_query
+
+            return query
+
+        query = self._get_statement(
+            (
+                "select",
+                database_name,
+                table_name,
+                tuple(columns or ()),
+                bool(limit),
+                self._get_condition_shape(condition_list),
+            ),
+            build_query,
+        )
+        parameters = ([limit] if limit else []) + self._get_condition_parameters(
+            condition_list
+        )
+
+        return query, parameters, columns
+
+    def _build_insert_query(
+        self,
+        database_name: str,
+        table_name: str,
+        column_name_list: List[str],
+        number_of_row: int,
+    ) -> str:
+        column_names_in_query = ",\n    ".join(
+            [f"[{column_name}]" for column_name in column_name_list]
+        )
+        row_in_query = f"({", ".join("?" * len(column_name_list))})"
+
+        return f"""INSERT INTO [{database_name}].[dbo].[{table_name}]
+(
+    {column_names_in_query}
+)
+VALUES
+{",\n".join([row_in_query] * number_of_row)}
+"""
+
+    def _to_parameter(self, value, data_type: DataType):
+        """Value to bind to a `?` marker of a column of `data_type`."""
+        # DATETIME keeps milliseconds, more digits do not fit the column
+        if data_type in [DataType.DATETIME] and isinstance(value, datetime):
+            return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+        return value
+
+    def _get_parameter_arrays(
+        self, data_type_list: List[DataType], values_list: List[Tuple]
+    ) -> Tuple[List[Tuple], List[Tuple]]:
+        """Input sizes and rows of a chunk; mistyped columns are bound as NVARCHAR."""
+        input_sizes = []
+        columns = []
+
+        for index, data_type in enumerate(data_type_list):
+            values = [
+                self._to_parameter(values[index], data_type) for values in values_list
+            ]
+            not_null_values = [value for value in values if value is not None]
+
+            if data_type in [DataType.INT] and all(
+                isinstance(value, int) for value in not_null_values
+            ):
+                input_sizes.append((pyodbc.SQL_INTEGER, 0, 0))
+
+            elif data_type in [DataType.BIGINT] and all(
+                isinstance(value, int) for value in not_null_values
+            ):
+                input_sizes.append((pyodbc.SQL_BIGINT, 0, 0))
+
+            elif data_type in [DataType.DATETIME] and all(
+                isinstance(value, datetime) for value in not_null_values
+            ):
+                input_sizes.append((pyodbc.SQL_TYPE_TIMESTAMP, 23, 3))
+
+            else:
+                values = [None if value is None else str(value) for value in values]
+                input_sizes.append(
+                    (
+                        pyodbc.SQL_WVARCHAR,
+                        max((len(value) for value in values if value), default=1),
+                        0,
+                    )
+                )
+
+            columns.append(values)
+
+        return input_sizes, list(zip(*columns))
+
     def _format_value(self, value, data_type: DataType):
-        """Format value based on its data type for SQL query."""
-        if data_type in [DataType.NVARCHAR]:
-            return f"N'{value.replace("'", "''") if value else value}'"
-        elif data_type in [DataType.DATETIME]:
-            return f"CAST ('{value}' AS DATETIME)"
+        """Format a value of `DataType.RAW`, which is written into the query."""
         return str(value)
 
     def _add_join(self, join_model: JoinModel) -> str:
@@ -728,7 +1566,7 @@ WHEN NOT MATCHED BY SOURCE THEN
 
         return query
 
-    def _add_condition(self, condition_list: List[Condition]):
+    def _to_condition_list(self, condition_list: List[Condition]) -> List[Condition]:
         if condition_list and isinstance(condition_list, Condition):
             condition_list = [condition_list]
 
@@ -737,11 +1575,91 @@ WHEN NOT MATCHED BY SOURCE THEN
             and isinstance(condition_list, List)
             and len(condition_list) > 0
         ):
-            query = f"""\nWHERE {" AND ".join(f"{condition.column} {condition.operator.value} {self._format_value(condition.value, condition.dataType)}" for condition in condition_list)}"""
+            return condition_list
+
+        return []
+
+    def _add_condition(self, condition_list: List[Condition]):
+        condition_list = self._to_condition_list(condition_list)
+
+        if condition_list:
+            query = f"""\nWHERE {" AND ".join(f"{condition.column} {condition.operator.value} {self._format_condition_value(condition)}" for condition in condition_list)}"""
             return query
 
         return None
 
+    def _format_condition_value(self, condition: Condition) -> str:
+        if condition.dataType in [DataType.RAW]:
+            return self._format_value(condition.value, condition.dataType)
+
+        if condition.operator in [Operator.IN, Operator.NOT_IN]:
+            return f"({", ".join("?" * len(condition.value))})"
+
+        return "?"
+
+    def _get_condition_shape(self, condition_list: List[Condition]) -> Tuple:
+        """What the text of the WHERE clause depends on, to key the statement cache."""
+        return tuple(
+            (
+                condition.column,
+                condition.operator,
+                (
+                    condition.value
+                    if condition.dataType in [DataType.RAW]
+                    else (
+                        len(condition.value)
+                        if condition.operator in [Operator.IN, Operator.NOT_IN]
+                        else None
+                    )
+                ),
+            )
+            for condition in condition_list
+        )
+
+    def _get_condition_parameters(self, condition_list: List[Condition]) -> List:
+        parameters = []
+
+        for condition in condition_list:
+            if condition.dataType in [DataType.RAW]:
+                continue
+
+            if condition.operator in [Operator.IN, Operator.NOT_IN]:
+                parameters.extend(
+                    self._to_parameter(value, condition.dataType)
+                    for value in condition.value
+                )
+            else:
+                parameters.append(
+                    self._to_parameter(condition.value, condition.dataType)
+                )
+
+        return parameters
+
+    def _get_join_shape(self, join_model: JoinModel) -> Tuple:
+        if not join_model:
+            return ()
+
+        return (
+            join_model.database,
+            join_model.table,
+            tuple(
+                (
+                    join_combination.join_type,
+                    join_combination.table_left,
+                    join_combination.table_right,
+                    join_combination.column_left,
+                    join_combination.column_right,
+                )
+                for join_combination in join_model.join_combination_list or []
+            ),
+        )
+
+    def _format_merge_value(self, column_pair: ColumnToUpdate) -> str:
+        if column_pair.dataType in [DataType.RAW]:
+            return self._format_value(column_pair.value, column_pair.dataType)
+
+        return "?"
+
     def _parse_action_when_merge(self, action: ActionInMerge):
         if not action:
             print("Invalid action.")
@@ -750,10 +1668,10 @@ WHEN NOT MATCHED BY SOURCE THEN
 
         if isinstance(action, InsertInMerge):
             return f"""INSERT ({", ".join([column_pair.target_column for column_pair in action.column_to_update_list])})
-    VALUES ({", ".join([f"S.{column_pair.source_column}" if column_pair.source_column else self._format_value(column_pair.value, column_pair.dataType) for column_pair in action.column_to_update_list])})"""
+    VALUES ({", ".join([f"S.{column_pair.source_column}" if column_pair.source_column else self._format_merge_value(column_pair) for column_pair in action.column_to_update_list])})"""
 
         elif isinstance(action, UpdateInMerge):
-            return f"UPDATE SET {", ".join([f"T.{column_pair.target_column} = S.{column_pair.source_column}" if column_pair.source_column else f"T.{column_pair.target_column} = {self._format_value(column_pair.value, column_pair.dataType)}" for column_pair in action.column_to_update_list])}"
+            return f"UPDATE SET {", ".join([f"T.{column_pair.target_column} = S.{column_pair.source_column}" if column_pair.source_column else f"T.{column_pair.target_column} = {self._format_merge_value(column_pair)}" for column_pair in action.column_to_update_list])}"
 
         elif isinstance(action, DeleteInMerge):
             return "DELETE"
@@ -0,0 +1,194 @@
+"""Offline throughput benchmark of the time series crawl against SsiApiSimulator."""
+
+import argparse
+import time
+from datetime import datetime
+
+from .fixture import Fixture, RecordedFixture, SyntheticFixture
+from .ssi_api_simulator import SsiApiSimulator
+
+from ..config_helper.model import SsiCrawlerInfoConfig
+from ..logger.logger import Logger
+from ..relational_database_driver.in_memory_driver import (
+    InMemoryDriver as InMemoryRelationalDatabaseDriver,
+)
+from ..relational_database_driver.model import *
+from ..ssi_data_crawler.database_model import *
+from ..ssi_data_crawler.enum import MarketCode, TimeSeriesCrawlMode
+from ..ssi_data_crawler.ssi_data_crawler import SsiDataCrawler
+from ..time_series_database_driver.in_memory_driver import (
+    InMemoryDriver as InMemoryTimeSeriesDatabaseDriver,
+)
+from ..constant import *
+
+
+def create_relational_database(
+    _logger: Logger, fixture: Fixture
+) -> InMemoryRelationalDatabaseDriver:
+    """Create the tables used by the time series crawl and seed Security."""
+    relational_database_driver = InMemoryRelationalDatabaseDriver(_logger)
+
+    for table_name, data_class in (
+        ("Security", Security),
+        ("CrawlCheckpoint", CrawlCheckpoint),
+        ("MarketCrawlCheckpoint", MarketCrawlCheckpoint),
+        ("SymbolWatermark", SymbolWatermark),
+        ("TradingHoliday", TradingHoliday),
+    ):
+        relational_database_driver.create_table(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name=table_name,
+            columns=[
+                Column(columnName=key, dataType=DataType.NVARCHAR("MAX"), nullable=True)
+                for key in data_class.get_key_list()
+            ],
+            key_column_name="ID",
+        )
+
+    securities = fixture.securities(None)
+    if securities:
+        relational_database_driver.insert(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name="Security",
+            records=RecordBatch(
+                columnNameList=["Symbol", "Name", "EnName", "Market_ID", "CreateDate"],
+                dataTypeList=[
+                    DataType.NVARCHAR,
+                    DataType.NVARCHAR,
+                    DataType.NVARCHAR,
+                    DataType.INT,
+                    DataType.DATETIME,
+                ],
+                valueList=[
+                    (
+                        security["Symbol"],
+                        security["StockName"],
+                        security["StockEnName"],
+                        MarketCode.get_market_code(security["Market"]),
+                        datetime.now(),
+                    )
+                    for security in securities
+                ],
+            ),
+        )
+
+    return relational_database_driver
+
+
+def run_benchmark(
+    fixture: Fixture,
+    crawl_mode: TimeSeriesCrawlMode,
+    latency: float,
+    server_rate_limit: float,
+    client_rate_limit: float,
+    client_max_rate_limit: float,
+    number_of_credential: int,
+) -> bool:
+    _logger = Logger(file_name="benchmark")
+
+    with SsiApiSimulator(
+        fixture, latency=latency, rate_limit_per_second=server_rate_limit
+    ) as simulator:
+        crawler_configs = [
+            SsiCrawlerInfoConfig(
+                consumerID=f"benchmark-{index}",
+                consumerSecret="benchmark",
+                url=simulator.url,
+            )
+            for index in range(number_of_credential)
+        ]
+
+        relational_database_driver = create_relational_database(_logger, fixture)
+        time_series_database_driver = InMemoryTimeSeriesDatabaseDriver(_logger)
+        time_series_database_driver.create_bucket(BUCKET_NAME)
+
+        # Responses must come from the simulator and every point must be
+        # written, whatever an earlier run left behind.
+        ssi_data_crawler = SsiDataCrawler(
+            _logger, enable_response_cache=False, enable_change_detection=False
+        )
+        ssi_data_crawler.add_crawler_config(crawler_configs[0], crawler_configs[1:])
+        ssi_data_crawler.set_api_rate_limit(client_rate_limit, client_max_rate_limit)
+        ssi_data_crawler.add_relational_database_driver(relational_database_driver)
+        ssi_data_crawler.add_time_series_database_driver(time_series_database_driver)
+
+        # Requests of the access tokens are not part of the crawl
+        number_of_setup_request = simulator.number_of_request
+
+        start_time = time.perf_counter()
+        successful = ssi_data_crawler.crawl_time_series_data(crawl_mode)
+        elapsed_time = time.perf_counter() - start_time
+
+        number_of_call = simulator.number_of_request - number_of_setup_request
+        number_of_row = time_series_database_driver.number_of_written_point
+
+    print(
+        f"\nBenchmark {"succeeded" if successful else "failed"} in {elapsed_time:.2f} s "
+        f"with mode {crawl_mode.value} and {number_of_credential} credentials."
+    )
+    print(
+        f"API calls: {number_of_call} ({number_of_call / elapsed_time:.2f} calls/s), "
+        f"{simulator.number_of_rejected_request} rejected."
+    )
+    print(f"Rows: {number_of_row} ({number_of_row / elapsed_time:.2f} rows/s).")
+
+    return successful
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the time series crawl against a local SSI FastConnect simulator."
+    )
+    parser.add_argument(
+        "--mode",
+        choices=[crawl_mode.value for crawl_mode in TimeSeriesCrawlMode],
+        default=TIME_SERIES_CRAWL_MODE.value,
+    )
+    parser.add_argument(
+        "--securities", type=int, default=50, help="number of synthetic securities"
+    )
+    parser.add_argument(
+        "--fixture-directory",
+        help="replay responses recorded by the response cache instead of synthetic data",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="seconds per simulated request"
+    )
+    parser.add_argument(
+        "--server-rate", type=float, help="requests per second per access token"
+    )
+    parser.add_argument(
+        "--client-rate",
+        type=float,
+        default=API_RATE_LIMIT_PER_SECOND,
+        help="initial requests per second of each crawler credential and endpoint",
+    )
+    parser.add_argument(
+        "--client-max-rate",
+        type=float,
+        default=API_MAX_RATE_LIMIT_PER_SECOND,
+        help="requests per second the rate controller may grow to",
+    )
+    parser.add_argument("--credentials", type=int, default=1)
+    arguments = parser.parse_args()
+
+    if arguments.fixture_directory:
+        fixture = RecordedFixture(arguments.fixture_directory)
+    else:
+        fixture = SyntheticFixture(
+            arguments.securities, DEFAULT_CRAWL_DATA_START_DATE.date()
+        )
+
+    run_benchmark(
+        fixture,
+        TimeSeriesCrawlMode(arguments.mode),
+        arguments.latency,
+        arguments.server_rate,
+        arguments.client_rate,
+        arguments.client_max_rate,
+        arguments.credentials,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+import bisect
+import gzip
+import json
+import os
+import random
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from ..trading_calendar.trading_calendar import TradingCalendar
+
+MARKET_NAMES = ["HOSE", "HNX", "UPCOM"]
+INDEX_IDS = {"VNINDEX": "HOSE", "HNXINDEX": "HNX", "UPCOMINDEX": "UPCOM"}
+
+
+class Fixture(ABC):
+    """Data served by the simulator, shaped like SSI FastConnect responses."""
+
+    @abstractmethod
+    def securities(self, market: Optional[str]) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def securities_details(
+        self, market: Optional[str], symbol: Optional[str]
+    ) -> List[Dict]:
+        """Return the `RepeatedInfo` rows of the matching securities."""
+        pass
+
+    @abstractmethod
+    def daily_stock_price(
+        self, symbol: Optional[str], market: Optional[str], from_date: date, to_date: date
+    ) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def daily_index(self, index_id: str, from_date: date, to_date: date) -> List[Dict]:
+        pass
+
+    def daily_ohlc(self, symbol: str, from_date: date, to_date: date) -> List[Dict]:
+        return [
+            {
+                "Symbol": row["Symbol"],
+                "Market": row.get("Market", ""),
+                "TradingDate": row["TradingDate"],
+                "Time": None,
+                "Open": row["OpenPrice"],
+                "High": row["HighestPrice"],
+                "Low": row["LowestPrice"],
+                "Close": row["ClosePrice"],
+                "Volume": row["TotalMatchVol"],
+                "Value": row["TotalMatchVal"],
+            }
+            for row in self.daily_stock_price(symbol, None, from_date, to_date)
+        ]
+
+    def intraday_ohlc(
+        self, symbol: str, from_date: date, to_date: date, resolution: int
+    ) -> List[Dict]:
+        """Interpolate minute bars between the open and the close of every day."""
+        rows = []
+        resolution = max(1, resolution)
+
+        for daily_row in self.daily_ohlc(symbol, from_date, to_date):
+            open_price = float(daily_row["Open"])
+            close_price = float(daily_row["Close"])
+
+            # Morning and afternoon sessions of HOSE
+            minutes = [
+                minute
+                for start, end in ((9 * 60 + 15, 11 * 60 + 30), (13 * 60, 14 * 60 + 45))
+                for minute in range(start, end, resolution)
+            ]
+
+            for index, minute in enumerate(minutes):
+                price = open_price + (close_price - open_price) * index / len(minutes)
+                rows.append(
+                    {
+                        "Symbol": daily_row["Symbol"],
+                        "Value": str(price),
+                        "TradingDate": daily_row["TradingDate"],
+                        "Time": f"{minute // 60:02d}:{minute % 60:02d}:00",
+                        "Open": str(price),
+                        "High": str(price),
+                        "Low": str(price),
+                        "Close": str(price),
+                        "Volume": str(int(float(daily_row["Volume"]) / len(minutes))),
+                    }
+                )
+
+        return rows
+
+
+class SyntheticFixture(Fixture):
+    """Deterministic random securities, some listing late or delisting early."""
+
+    def __init__(
+        self,
+        number_of_security: int,
+        start_date: date,
+        trading_calendar: TradingCalendar = None,
+        seed: int = 0,
+    ):
+        self._trading_calendar = trading_calendar or TradingCalendar()
+        self._sessions = self._trading_calendar.sessions(start_date, date.today())
+        self._random = random.Random(seed)
+
+        self._securities: List[Dict] = []
+        self._close_prices: Dict[str, List[float]] = {}
+        self._lifetimes: Dict[str, tuple] = {}
+
+        for index in range(number_of_security):
+            symbol = self._get_symbol(index)
+            market = MARKET_NAMES[index % len(MARKET_NAMES)]
+
+            first_index = 0
+            last_index = len(self._sessions) - 1
+            if self._random.random() < 0.1:
+                first_index = self._random.randrange(len(self._sessions))
+            if self._random.random() < 0.05:
+                last_index = self._random.randrange(first_index, len(self._sessions))
+
+            self._securities.append(
+                {
+                    "Market": market,
+                    "Symbol": symbol,
+                    "StockName": f"Synthetic security {symbol}",
+                    "StockEnName": f"Synthetic security {symbol}",
+                }
+            )
+            self._lifetimes[symbol] = (first_index, last_index)
+            self._close_prices[symbol] = self._random_walk(
+                self._random.uniform(5000, 100000), len(self._sessions)
+            )
+
+        self._index_values = {
+            index_id: self._random_walk(1000, len(self._sessions))
+            for index_id in INDEX_IDS
+        }
+
+    def securities(self, market: Optional[str]) -> List[Dict]:
+        return [
+            security
+            for security in self._securities
+            if not market or security["Market"] == market.upper()
+        ]
+
+    def securities_details(
+        self, market: Optional[str], symbol: Optional[str]
+    ) -> List[Dict]:
+        rows = []
+
+        for security in self.securities(market):
+            if symbol and security["Symbol"] != symbol.upper():
+                continue
+
+            first_index, last_index = self._lifetimes[security["Symbol"]]
+            rows.append(
+                {
+                    "Isin": f"VN000000{security["Symbol"]}",
+                    "Symbol": security["Symbol"],
+                    "SymbolName": security["StockName"],
+                    "SymbolEngName": security["StockEnName"],
+                    "SecType": "ST",
+                    "MarketId": security["Market"],
+                    "Exchange": security["Market"],
+                    "Issuer": "",
+                    "LotSize": "100",
+                    "IssueDate": "",
+                    "MaturityDate": "",
+                    "FirstTradingDate": (
+                        self._sessions[first_index].strftime("%d/%m/%Y")
+                        if first_index
+                        else ""
+                    ),
+                    "LastTradingDate": (
+                        self._sessions[last_index].strftime("%d/%m/%Y")
+                        if last_index < len(self._sessions) - 1
+                        else ""
+                    ),
+                    "ContractMultiplier": "",
+                    "SettlMethod": "",
+                }
+            )
+
+        return rows
+
+    def daily_stock_price(
+        self, symbol: Optional[str], market: Optional[str], from_date: date, to_date: date
+    ) -> List[Dict]:
+        start_index = bisect.bisect_left(self._sessions, from_date)
+        end_index = bisect.bisect_right(self._sessions, to_date)
+
+        securities = [
+            security
+            for security in self.securities(market)
+            if not symbol or security["Symbol"] == symbol.upper()
+        ]
+
+        # Market-wide responses are ordered by trading date, then by symbol
+        return [
+            self._build_daily_stock_price_row(security, session_index)
+            for session_index in range(start_index, end_index)
+            for security in securities
+            if self._lifetimes[security["Symbol"]][0]
+            <= session_index
+            <= self._lifetimes[security["Symbol"]][1]
+        ]
+
+    def daily_index(self, index_id: str, from_date: date, to_date: date) -> List[Dict]:
+        index_id = index_id.upper()
+        if index_id not in self._index_values:
+            return []
+
+        values = self._index_values[index_id]
+        start_index = bisect.bisect_left(self._sessions, from_date)
+        end_index = bisect.bisect_right(self._sessions, to_date)
+
+        return [
+            {
+                "IndexId": index_id,
+                "IndexValue": f"{values[index]:.2f}",
+                "TradingDate": self._sessions[index].strftime("%d/%m/%Y"),
+                "Time": None,
+                "Change": f"{values[index] - values[max(0, index - 1)]:.2f}",
+                "RatioChange": f"{(values[index] / values[max(0, index - 1)] - 1) * 100:.2f}",
+                "TotalTrade": "0",
+                "TotalMatchVol": "0",
+                "TotalMatchVal": "0",
+                "TypeIndex": "Main",
+                "IndexName": index_id,
+                "Advances": "0",
+                "NoChanges": "0",
+                "Declines": "0",
+                "Ceilings": "0",
+                "Floors": "0",
+                "TotalDealVol": "0",
+                "TotalDealVal": "0",
+                "TotalVol": "0",
+                "TotalVal": "0",
+                "TradingSession": "C",
+                "Market": INDEX_IDS[index_id],
+                "Exchange": INDEX_IDS[index_id],
+            }
+            for index in range(start_index, end_index)
+        ]
+
+    def _build_daily_stock_price_row(self, security: Dict, session_index: int) -> Dict:
+        close_prices = self._close_prices[security["Symbol"]]
+        close_price = round(close_prices[session_index], -1)
+        ref_price = round(close_prices[max(0, session_index - 1)], -1)
+        volume = int(close_price) % 997 * 1000 + 100
+
+        return {
+            "Symbol": security["Symbol"],
+            "Market": security["Market"],
+            "TradingDate": self._sessions[session_index].strftime("%d/%m/%Y"),
+            "Time": None,
+            "PriceChange": str(close_price - ref_price),
+            "PerPriceChange": f"{(close_price / ref_price - 1) * 100:.2f}",
+            "CeilingPrice": str(round(ref_price * 1.07, -1)),
+            "FloorPrice": str(round(ref_price * 0.93, -1)),
+            "RefPrice": str(ref_price),
+            "OpenPrice": str(ref_price),
+            "HighestPrice": str(max(ref_price, close_price)),
+            "LowestPrice": str(min(ref_price, close_price)),
+            "ClosePrice": str(close_price),
+            "AveragePrice": str(round((ref_price + close_price) / 2, -1)),
+            "ClosePriceAdjusted": str(close_price),
+            "TotalMatchVol": str(volume),
+            "TotalMatchVal": str(int(volume * close_price)),
+            "TotalDealVal": "0",
+            "TotalDealVol": "0",
+            "ForeignBuyVolTotal": "0",
+            "ForeignCurrentRoom": "0",
+            "ForeignSellVolTotal": "0",
+            "ForeignBuyValTotal": "0",
+            "ForeignSellValTotal": "0",
+            "TotalBuyTrade": "0",
+            "TotalBuyTradeVol": "0",
+            "TotalSellTrade": "0",
+            "TotalSellTradeVol": "0",
+            "NetBuySellVol": "0",
+            "NetBuySellVal": "0",
+            "TotalTradedVol": str(volume),
+            "TotalTradedValue": str(int(volume * close_price)),
+        }
+
+    def _random_walk(self, start_value: float, length: int) -> List[float]:
+        values = [start_value]
+
+        for _ in range(length - 1):
+            values.append(max(100.0, values[-1] * (1 + self._random.gauss(0, 0.02))))
+
+        return values
+
+    @staticmethod
+    def _get_symbol(index: int) -> str:
+        letters = []
+
+        for _ in range(3):
+            index, remainder = divmod(index, 26)
+            letters.append(chr(ord("A") + remainder))
+
+        return "".join(reversed(letters))
+
+
+class RecordedFixture(Fixture):
+    """Responses recorded by the response cache, replayed from its directory."""
+
+    def __init__(self, response_cache_directory: str):
+        self._securities: Dict[str, Dict] = {}
+        self._securities_details: Dict[str, Dict] = {}
+        self._daily_stock_price: Dict[str, Dict[date, Dict]] = {}
+        self._daily_index: Dict[str, Dict[date, Dict]] = {}
+
+        for response in self._read_responses(response_cache_directory, "securities"):
+            for row in response.get("data") or []:
+                self._securities[row["Symbol"]] = row
+
+        for response in self._read_responses(
+            response_cache_directory, "securities_details"
+        ):
+            for row in response.get("data") or []:
+                for repeated_info in row.get("RepeatedInfo") or []:
+                    self._securities_details[repeated_info["Symbol"]] = repeated_info
+
+        for response in self._read_responses(
+            response_cache_directory, "daily_stock_price"
+        ):
+            for row in response.get("data") or []:
+                self._daily_stock_price.setdefault(row["Symbol"], {})[
+                    self._parse_date(row["TradingDate"])
+                ] = row
+
+        for response in self._read_responses(response_cache_directory, "daily_index"):
+            for row in response.get("data") or []:
+                self._daily_index.setdefault(row["IndexId"].upper(), {})[
+                    self._parse_date(row["TradingDate"])
+                ] = row
+
+    def securities(self, market: Optional[str]) -> List[Dict]:
+        return [
+            security
+            for security in self._securities.values()
+            if not market or security.get("Market") == market.upper()
+        ]
+
+    def securities_details(
+        self, market: Optional[str], symbol: Optional[str]
+    ) -> List[Dict]:
+        symbols = {security["Symbol"] for security in self.securities(market)}
+
+        return [
+            repeated_info
+            for repeated_info in self._securities_details.values()
+            if (not market or repeated_info["Symbol"] in symbols)
+            and (not symbol or repeated_info["Symbol"] == symbol.upper())
+        ]
+
+    def daily_stock_price(
+        self, symbol: Optional[str], market: Optional[str], from_date: date, to_date: date
+    ) -> List[Dict]:
+        symbols = [symbol.upper()] if symbol else sorted(self._daily_stock_price)
+        if market:
+            market_symbols = {security["Symbol"] for security in self.securities(market)}
+            symbols = [symbol for symbol in symbols if symbol in market_symbols]
+
+        rows = [
+            (trading_date, row)
+            for symbol in symbols
+            for trading_date, row in self._daily_stock_price.get(symbol, {}).items()
+            if from_date <= trading_date <= to_date
+        ]
+
+        return [row for _, row in sorted(rows, key=lambda item: item[0])]
+
+    def daily_index(self, index_id: str, from_date: date, to_date: date) -> List[Dict]:
+        rows = self._daily_index.get(index_id.upper(), {})
+
+        return [
+            rows[trading_date]
+            for trading_date in sorted(rows)
+            if from_date <= trading_date <= to_date
+        ]
+
+    @staticmethod
+    def _read_responses(directory: str, endpoint: str) -> List[Dict]:
+        responses = []
+
+        for root, _, file_names in os.walk(os.path.join(directory, endpoint)):
+            for file_name in file_names:
+                if not file_name.endswith(".json.gz"):
+                    continue
+
+                with gzip.open(os.path.join(root, file_name), "rt", encoding="utf-8") as cache_file:
+                    responses.append(json.load(cache_file)["response"])
+
+        return responses
+
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        return datetime.strptime(value.split(" ")[0], "%d/%m/%Y").date()
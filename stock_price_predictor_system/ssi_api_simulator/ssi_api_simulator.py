@@ -0,0 +1,347 @@
+import base64
+import json
+import random
+import secrets
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .fixture import Fixture
+
+MAX_PAGE_INDEX = 10
+MAX_PAGE_SIZE = 1000
+MAX_DAILY_OHLC_DAYS = 30
+ACCESS_TOKEN_LIFETIME = timedelta(hours=8)
+
+
+class SsiApiSimulator:
+    """Local stand-in for the SSI FastConnect Data API, with latency and rate limits."""
+
+    def __init__(
+        self,
+        fixture: Fixture,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        rate_limit_per_second: float = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self._fixture = fixture
+        self._latency = latency
+        self._latency_jitter = latency_jitter
+        self._rate_limit_per_second = rate_limit_per_second
+
+        # Token bucket of every access token: token -> (tokens, last refill)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._number_of_request = 0
+        self._number_of_rejected_request = 0
+        self._lock = threading.Lock()
+
+        simulator = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                simulator._handle(self, "GET")
+
+            def do_POST(self):
+                simulator._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), RequestHandler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread = None
+
+    # region Public methods
+
+    @property
+    def url(self) -> str:
+        """Base URL to put in `SsiCrawlerInfoConfig.url`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def number_of_request(self) -> int:
+        return self._number_of_request
+
+    @property
+    def number_of_rejected_request(self) -> int:
+        return self._number_of_rejected_request
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="ssi-api-simulator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "SsiApiSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # endregion
+
+    # region Private methods
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        url = urlsplit(handler.path)
+        route = url.path.rstrip("/").split("/")[-1].lower()
+
+        # The real API does not care about the case of parameter names
+        parameters = {key.lower(): value for key, value in parse_qsl(url.query)}
+
+        with self._lock:
+            self._number_of_request += 1
+
+        if self._latency or self._latency_jitter:
+            time.sleep(
+                max(0.0, self._latency + random.uniform(-1, 1) * self._latency_jitter)
+            )
+
+        if method == "POST":
+            if route != "accesstoken":
+                return self._send(handler, self._build_response(None, 404, "Not found"))
+
+            # Unlike data responses, token responses have no "totalRecord"
+            response = self._create_access_token(handler)
+            del response["totalRecord"]
+            return self._send(handler, response)
+
+        access_token = handler.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not access_token:
+            return self._send(handler, self._build_response(None, 401, "Unauthorized"))
+
+        if not self._consume_token(access_token):
+            with self._lock:
+                self._number_of_rejected_request += 1
+
+            return self._send(
+                handler, self._build_response(None, 429, "Too many requests"), 429
+            )
+
+        try:
+            response = self._route(route, parameters)
+
+        except ValueError as e:
+            response = self._build_response(None, 400, str(e))
+
+        self._send(handler, response)
+
+    def _route(self, route: str, parameters: Dict[str, str]) -> Dict:
+        match (route):
+
+            case "securities":
+                return self._paginate(
+                    self._fixture.securities(parameters.get("market")), parameters
+                )
+
+            case "securitiesdetails":
+                repeated_info = self._fixture.securities_details(
+                    parameters.get("market"), parameters.get("symbol")
+                )
+                page = self._paginate(repeated_info, parameters)
+                page["data"] = [
+                    {
+                        "RType": "y",
+                        "ReportDate": date.today().strftime("%d/%m/%Y"),
+                        "TotalNoSym": str(len(page["data"])),
+                        "RepeatedInfo": page["data"],
+                    }
+                ]
+                return page
+
+            case "dailystockprice":
+                from_date, to_date = self._parse_date_range(parameters)
+                return self._paginate(
+                    self._fixture.daily_stock_price(
+                        parameters.get("symbol"),
+                        parameters.get("market"),
+                        from_date,
+                        to_date,
+                    ),
+                    parameters,
+                )
+
+            case "dailyohlc":
+                from_date, to_date = self._parse_date_range(parameters, MAX_DAILY_OHLC_DAYS)
+                return self._paginate(
+                    self._order(
+                        self._fixture.daily_ohlc(
+                            self._require(parameters, "symbol"), from_date, to_date
+                        ),
+                        parameters,
+                    ),
+                    parameters,
+                )
+
+            case "intradayohlc":
+                from_date, to_date = self._parse_date_range(parameters, MAX_DAILY_OHLC_DAYS)
+                return self._paginate(
+                    self._order(
+                        self._fixture.intraday_ohlc(
+                            self._require(parameters, "symbol"),
+                            from_date,
+                            to_date,
+                            int(parameters.get("resollution") or 1),
+                        ),
+                        parameters,
+                    ),
+                    parameters,
+                )
+
+            case "dailyindex":
+                from_date, to_date = self._parse_date_range(parameters)
+                return self._paginate(
+                    self._order(
+                        self._fixture.daily_index(
+                            self._require(parameters, "indexid"), from_date, to_date
+                        ),
+                        parameters,
+                    ),
+                    parameters,
+                )
+
+            case _:
+                return self._build_response(None, 404, "Not found")
+
+    def _create_access_token(self, handler: BaseHTTPRequestHandler) -> Dict:
+        content_length = int(handler.headers.get("Content-Length") or 0)
+
+        try:
+            body = json.loads(handler.rfile.read(content_length) or b"{}")
+
+        except ValueError:
+            body = {}
+
+        if not body.get("consumerID") or not body.get("consumerSecret"):
+            return self._build_response(None, 401, "Invalid consumer")
+
+        # The client reads the expiry from the payload of the JWT, decoding it
+        # with the standard base64 alphabet.
+        payload = base64.b64encode(
+            json.dumps(
+                {
+                    "consumerID": body["consumerID"],
+                    "exp": int((datetime.now() + ACCESS_TOKEN_LIFETIME).timestamp()),
+                    "nonce": secrets.token_hex(8),
+                }
+            ).encode()
+        ).decode()
+        access_token = f"simulator.{payload.rstrip("=")}.signature"
+
+        return self._build_response({"accessToken": access_token}, 200, "Success")
+
+    def _consume_token(self, access_token: str) -> bool:
+        if not self._rate_limit_per_second:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(
+                access_token, (self._rate_limit_per_second, now)
+            )
+            tokens = min(
+                self._rate_limit_per_second,
+                tokens + (now - last_refill) * self._rate_limit_per_second,
+            )
+
+            if tokens < 1:
+                self._buckets[access_token] = (tokens, now)
+                return False
+
+            self._buckets[access_token] = (tokens - 1, now)
+            return True
+
+    def _paginate(self, rows: List[Dict], parameters: Dict[str, str]) -> Dict:
+        page_index = int(parameters.get("pageindex") or 1)
+        page_size = int(parameters.get("pagesize") or MAX_PAGE_SIZE)
+
+        if not 1 <= page_index <= MAX_PAGE_INDEX:
+            raise ValueError(
+                f"pageIndex must be between 1 and {MAX_PAGE_INDEX}, got {page_index}."
+            )
+
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(
+                f"pageSize must be between 1 and {MAX_PAGE_SIZE}, got {page_size}."
+            )
+
+        start = (page_index - 1) * page_size
+
+        return self._build_response(
+            rows[start : start + page_size], 200, "Success", len(rows)
+        )
+
+    @staticmethod
+    def _order(rows: List[Dict], parameters: Dict[str, str]) -> List[Dict]:
+        if (parameters.get("ascending") or "true").lower() == "false":
+            return list(reversed(rows))
+
+        return rows
+
+    @staticmethod
+    def _parse_date_range(
+        parameters: Dict[str, str], max_days: int = None
+    ) -> Tuple[date, date]:
+        try:
+            from_date = datetime.strptime(
+                SsiApiSimulator._require(parameters, "fromdate"), "%d/%m/%Y"
+            ).date()
+            to_date = datetime.strptime(
+                SsiApiSimulator._require(parameters, "todate"), "%d/%m/%Y"
+            ).date()
+
+        except ValueError as e:
+            raise ValueError(f"Invalid date range. {e}")
+
+        if from_date > to_date:
+            raise ValueError("fromDate must not be after toDate.")
+
+        if max_days and (to_date - from_date).days > max_days:
+            raise ValueError(f"The date range must not exceed {max_days} days.")
+
+        return from_date, to_date
+
+    @staticmethod
+    def _require(parameters: Dict[str, str], name: str) -> str:
+        value = parameters.get(name)
+        if not value:
+            raise ValueError(f"Missing parameter: {name}.")
+
+        return value
+
+    @staticmethod
+    def _build_response(
+        data: Optional[object], status: int, message: str, total_record: int = 0
+    ) -> Dict:
+        return {
+            "message": message,
+            "status": status,
+            "totalRecord": total_record,
+            "data": data,
+        }
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, response: Dict, http_status: int = 200):
+        body = json.dumps(response).encode()
+
+        handler.send_response(http_status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    # endregion
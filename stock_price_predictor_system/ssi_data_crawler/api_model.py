@@ -57,8 +57,8 @@ class SecuritiesOutputModel(BaseOutputModel):
 # GET SecuritiesDetails Models
 @dataclass
 class SecuritiesDetailsInputModel(BaseInputModel):
-    market: int
-    symbol: str
+    market: Optional[str] = None
+    symbol: Optional[str] = None
 
 
 @dataclass
@@ -252,7 +252,7 @@ class DailyStockPriceInputModel(BaseInputModel):
     symbol: str
     fromDate: Union[str, datetime]
     toDate: Union[str, datetime]
-    market: int
+    market: Optional[str] = None
 
     def __post_init__(self):
         # Handle `fromDate`
@@ -272,7 +272,7 @@ class DailyStockPriceInputModel(BaseInputModel):
             self.toDate = self.toDate.strftime("%d/%m/%Y")
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStockPriceDataModel:
     symbol: str
     tradingDate: datetime
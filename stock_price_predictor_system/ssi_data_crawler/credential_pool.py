@@ -0,0 +1,116 @@
+import contextvars
+import threading
+from collections import deque
+from ssi_fc_data.fc_md_client import MarketDataClient
+from typing import Any, Callable, Deque, List
+
+from .rate_controller import AimdRateController
+
+from ..config_helper.model import SsiCrawlerInfoConfig
+
+from ..logger.logger import Logger
+
+
+class CrawlerCredential:
+    """One FastConnect consumer with its own client and rate controller."""
+
+    def __init__(
+        self,
+        index: int,
+        config: SsiCrawlerInfoConfig,
+        client: MarketDataClient,
+        rate_controller: AimdRateController,
+    ):
+        self.index = index
+        self.config = config
+        self.client = client
+        self.rate_controller = rate_controller
+
+
+class CredentialPool:
+    """Shards work over FastConnect credentials, one thread each, with work stealing."""
+
+    def __init__(self, _logger: Logger, credentials: List[CrawlerCredential]):
+        if not credentials:
+            raise ValueError("Invalid credentials. At least one is required.")
+
+        self._logger = _logger
+        self._credentials = credentials
+        self._current_credential = contextvars.ContextVar(
+            "current_credential", default=None
+        )
+
+        self._number_of_stolen_item = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._credentials)
+
+    @property
+    def credentials(self) -> List[CrawlerCredential]:
+        return self._credentials
+
+    @property
+    def current(self) -> CrawlerCredential:
+        """Credential of the calling worker, or None outside of `run`."""
+        return self._current_credential.get()
+
+    @property
+    def number_of_stolen_item(self) -> int:
+        return self._number_of_stolen_item
+
+    def run(self, items: List[Any], function: Callable[[Any], bool]) -> bool:
+        """Call `function` on every item until all succeed or one fails."""
+        shards: List[Deque[Any]] = [
+            deque(items[index :: self.size]) for index in range(self.size)
+        ]
+        lock = threading.Lock()
+        failed = threading.Event()
+        self._number_of_stolen_item = 0
+
+        def work(credential: CrawlerCredential):
+            self._current_credential.set(credential)
+
+            while not failed.is_set():
+                with lock:
+                    shard = shards[credential.index]
+
+                    if not shard:
+                        shard = max(shards, key=len)
+                        if not shard:
+                            return
+
+                        item = shard.pop()
+                        self._number_of_stolen_item += 1
+                    else:
+                        item = shard.popleft()
+
+                try:
+                    successful = function(item)
+
+                except Exception as e:
+                    print(
+                        f"\nCredential {credential.index} failed to process {item}. Error: {e}"
+                    )
+                    self._logger.log_error(
+                        f"Credential {credential.index} failed to process {item}. Error: {e}"
+                    )
+                    successful = False
+
+                if not successful:
+                    failed.set()
+
+        threads = [
+            threading.Thread(
+                target=work, args=(credential,), name=f"credential-{credential.index}"
+            )
+            for credential in self._credentials
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return not failed.is_set()
@@ -54,6 +54,41 @@ class CrawlCheckpoint:
     ID: int
     CurrentStartInterval: datetime
     CurrentSymbol: str
+    CurrentEndInterval: Optional[datetime] = None
+
+    @classmethod
+    def get_key_list(cls):
+        return [field.name for field in cls.__dataclass_fields__.values()]
+
+
+@dataclass(kw_only=True)
+class MarketCrawlCheckpoint:
+    ID: int
+    Market_ID: int
+    LastCrawledDate: datetime
+
+    @classmethod
+    def get_key_list(cls):
+        return [field.name for field in cls.__dataclass_fields__.values()]
+
+
+@dataclass(kw_only=True)
+class SymbolWatermark:
+    ID: int
+    Symbol: str
+    LastTradingDate: datetime
+    UpdateDate: Optional[datetime] = None
+
+    @classmethod
+    def get_key_list(cls):
+        return [field.name for field in cls.__dataclass_fields__.values()]
+
+
+@dataclass(kw_only=True)
+class TradingHoliday:
+    ID: int
+    HolidayDate: datetime
+    IsHoliday: int
 
     @classmethod
     def get_key_list(cls):
@@ -34,3 +34,12 @@ class TradingSession(Enum):
     C = "Market Close"
     BREAK = "Lunch Break"
     HALT = "Market Halt"
+
+
+class TimeSeriesCrawlMode(Enum):
+    SERIAL = "Serial"
+    ASYNC = "Asynchronous"
+    MARKET_WIDE = "Market-wide"
+    INCREMENTAL = "Incremental"
+    PIPELINE = "Pipeline"
+    SHARDED = "Sharded"
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+from ..constant import *
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSchema:
+    key: str  # key in the API response
+    name: str  # field in the time series database
+    dataType: type
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointSchema:
+    """How the rows of one FastConnect endpoint are stored as points."""
+
+    endpoint: str
+    measurement: str
+    tagKey: str
+    tagName: str
+    timeKeys: Tuple[str, ...]
+    timeFormat: str
+    fields: Tuple[FieldSchema, ...]
+
+
+def _fields(*fields: Tuple[str, str, type]) -> Tuple[FieldSchema, ...]:
+    return tuple(
+        FieldSchema(key=key, name=name, dataType=data_type)
+        for key, name, data_type in fields
+    )
+
+
+# Every endpoint ingested into the time series database. A converter is
+# compiled from each entry when the crawler starts.
+FIELD_SCHEMAS: Dict[str, EndpointSchema] = {
+    schema.endpoint: schema
+    for schema in (
+        EndpointSchema(
+            endpoint="daily_stock_price",
+            measurement=MEASUREMENT_NAME,
+            tagKey="Symbol",
+            tagName="symbol",
+            timeKeys=("TradingDate",),
+            timeFormat="%d/%m/%Y",
+            fields=_fields(
+                ("PriceChange", "price_change", np.int64),
+                ("PerPriceChange", "per_price_change", np.float64),
+                ("CeilingPrice", "ceiling_price", np.int64),
+                ("FloorPrice", "floor_price", np.int64),
+                ("RefPrice", "ref_price", np.int64),
+                ("OpenPrice", "open_price", np.int64),
+                ("HighestPrice", "highest_price", np.int64),
+                ("LowestPrice", "lowest_price", np.int64),
+                ("ClosePrice", "close_price", np.int64),
+                ("AveragePrice", "average_price", np.int64),
+                ("ClosePriceAdjusted", "close_price_adjusted", np.int64),
+                ("TotalMatchVol", "total_match_vol", np.int64),
+                ("TotalMatchVal", "total_match_val", np.int64),
+                ("TotalDealVal", "total_deal_val", np.int64),
+                ("TotalDealVol", "total_deal_vol", np.int64),
+                ("ForeignBuyVolTotal", "foreign_buy_vol_total", np.int64),
+                ("ForeignCurrentRoom", "foreign_current_room", np.int64),
+                ("ForeignSellVolTotal", "foreign_sell_vol_total", np.int64),
+                ("ForeignBuyValTotal", "foreign_buy_val_total", np.int64),
+                ("ForeignSellValTotal", "foreign_sell_val_total", np.int64),
+                ("TotalBuyTrade", "total_buy_trade", np.int64),
+                ("TotalBuyTradeVol", "total_buy_trade_vol", np.int64),
+                ("TotalSellTrade", "total_sell_trade", np.int64),
+                ("TotalSellTradeVol", "total_sell_trade_vol", np.int64),
+                ("NetBuySellVol", "net_buy_sell_vol", np.int64),
+                ("NetBuySellVal", "net_buy_sell_val", np.int64),
+                ("TotalTradedVol", "total_traded_vol", np.int64),
+                ("TotalTradedValue", "total_traded_value", np.int64),
+            ),
+        ),
+    )
+}
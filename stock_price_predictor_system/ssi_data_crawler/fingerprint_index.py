@@ -0,0 +1,193 @@
+import os
+import shutil
+import threading
+from typing import Dict, Set, Tuple
+
+import numpy as np
+
+from ..logger.logger import Logger
+from ..time_series_database_driver.model import PointBatch
+
+# 64-bit FNV-1a parameters
+FNV_OFFSET_BASIS = np.uint64(0xCBF29CE484222325)
+FNV_PRIME = np.uint64(0x100000001B3)
+
+
+class FingerprintIndex:
+    """Fingerprints of written points per tag value and time, to skip unchanged ones."""
+
+    _ENTRY_DTYPE = np.dtype([("time", "datetime64[s]"), ("fingerprint", np.uint64)])
+
+    def __init__(self, _logger: Logger, directory: str):
+        self._logger = _logger
+        self._directory = directory
+
+        self._entries: Dict[str, np.ndarray] = {}
+        self._dirty_tag_values: Set[str] = set()
+        self._number_of_checked_point = 0
+        self._number_of_skipped_point = 0
+        self._lock = threading.Lock()
+
+    # region Public methods
+
+    @property
+    def number_of_checked_point(self) -> int:
+        return self._number_of_checked_point
+
+    @property
+    def number_of_skipped_point(self) -> int:
+        return self._number_of_skipped_point
+
+    def find_changed(self, point_batch: PointBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """Mask of new or changed points, and the fingerprints to pass to `add`."""
+        fingerprints = self.fingerprint(point_batch.fields)
+        changed = np.ones(len(point_batch), dtype=bool)
+
+        with self._lock:
+            for tag_value, indexes in self._group_by_tag_value(point_batch):
+                entries = self._load(tag_value)
+                if not len(entries):
+                    continue
+
+                times = point_batch.times[indexes]
+                positions = np.minimum(
+                    np.searchsorted(entries["time"], times), len(entries) - 1
+                )
+                changed[indexes] = (entries["time"][positions] != times) | (
+                    entries["fingerprint"][positions] != fingerprints[indexes]
+                )
+
+            self._number_of_checked_point += len(point_batch)
+            self._number_of_skipped_point += int(len(point_batch) - changed.sum())
+
+        return changed, fingerprints
+
+    def add(self, point_batch: PointBatch, fingerprints: np.ndarray):
+        """Record the fingerprints of written points."""
+        with self._lock:
+            for tag_value, indexes in self._group_by_tag_value(point_batch):
+                new_entries = np.empty(len(indexes), dtype=self._ENTRY_DTYPE)
+                new_entries["time"] = point_batch.times[indexes]
+                new_entries["fingerprint"] = fingerprints[indexes]
+
+                # The newest fingerprint of a time wins
+                entries = np.concatenate([self._load(tag_value), new_entries])
+                entries = entries[np.argsort(entries["time"], kind="stable")]
+                is_last = np.append(entries["time"][1:] != entries["time"][:-1], True)
+
+                self._entries[tag_value] = entries[is_last]
+                self._dirty_tag_values.add(tag_value)
+
+    def discard(self, tag_value: str, dates: np.ndarray):
+        """Forget the fingerprints of the days in `dates`, so that their points are written again."""
+        with self._lock:
+            entries = self._load(tag_value)
+            kept = ~np.isin(
+                entries["time"].astype("datetime64[D]"), dates.astype("datetime64[D]")
+            )
+            if kept.all():
+                return
+
+            self._entries[tag_value] = entries[kept]
+            self._dirty_tag_values.add(tag_value)
+
+    def clear(self) -> bool:
+        with self._lock:
+            self._entries.clear()
+            self._dirty_tag_values.clear()
+
+            try:
+                shutil.rmtree(self._directory)
+
+            except FileNotFoundError:
+                pass
+
+            except OSError as e:
+                print(f"\nCannot delete fingerprint index. Error: {e}.")
+                self._logger.log_error(f"Cannot delete fingerprint index. Error: {e}.")
+                return False
+
+        return True
+
+    def flush(self) -> bool:
+        with self._lock:
+            dirty_tag_values = list(self._dirty_tag_values)
+            self._dirty_tag_values.clear()
+
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+
+                for tag_value in dirty_tag_values:
+                    path = self._get_path(tag_value)
+
+                    # Write to a temporary file first, so that a reader never
+                    # sees half of an index.
+                    temporary_path = f"{path}.{os.getpid()}.tmp"
+                    with open(temporary_path, "wb") as file:
+                        np.save(file, self._entries[tag_value])
+
+                    os.replace(temporary_path, path)
+
+            except OSError as e:
+                print(f"\nCannot write fingerprint index. Error: {e}.")
+                self._logger.log_error(f"Cannot write fingerprint index. Error: {e}.")
+                return False
+
+        return True
+
+    @staticmethod
+    def fingerprint(fields: np.ndarray) -> np.ndarray:
+        """64-bit FNV-1a hash of every row of a structured array, one word at a time."""
+        rows = np.ascontiguousarray(fields).view(np.uint8).reshape(len(fields), -1)
+
+        padding = -rows.shape[1] % 8
+        if padding:
+            rows = np.pad(rows, ((0, 0), (0, padding)))
+
+        fingerprints = np.full(len(fields), FNV_OFFSET_BASIS, dtype=np.uint64)
+        for word in np.ascontiguousarray(rows).view(np.uint64).T:
+            fingerprints ^= word
+            fingerprints *= FNV_PRIME
+
+        return fingerprints
+
+    # endregion
+
+    # region Private methods
+
+    @staticmethod
+    def _group_by_tag_value(point_batch: PointBatch):
+        tag_values, inverse, counts = np.unique(
+            point_batch.tag_values, return_inverse=True, return_counts=True
+        )
+        groups = np.split(
+            np.argsort(inverse.reshape(-1), kind="stable"), np.cumsum(counts)[:-1]
+        )
+
+        return zip(tag_values.tolist(), groups)
+
+    def _load(self, tag_value: str) -> np.ndarray:
+        entries = self._entries.get(tag_value)
+        if entries is not None:
+            return entries
+
+        entries = np.empty(0, dtype=self._ENTRY_DTYPE)
+        path = self._get_path(tag_value)
+
+        if os.path.exists(path):
+            try:
+                entries = np.load(path)
+
+            # A corrupt index only costs rewrites
+            except (OSError, ValueError) as e:
+                self._logger.log_warning(
+                    f"Cannot read fingerprint index {path}. Error: {e}."
+                )
+
+        self._entries[tag_value] = entries
+        return entries
+
+    def _get_path(self, tag_value: str) -> str:
+        return os.path.join(self._directory, f"{tag_value}.npy")
+
+    # endregion
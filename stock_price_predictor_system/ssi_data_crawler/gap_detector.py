@@ -0,0 +1,53 @@
+from datetime import date
+from typing import Iterable, List, Tuple
+
+from ..trading_calendar.trading_calendar import TradingCalendar
+
+
+class GapDetector:
+    """Finds the sessions missing between the first and last stored bars."""
+
+    def __init__(self, trading_calendar: TradingCalendar, max_session_per_request: int):
+        if max_session_per_request < 1:
+            raise ValueError(
+                f"Invalid max session per request: {max_session_per_request}. Must be at least 1."
+            )
+
+        self._trading_calendar = trading_calendar
+        self._max_session_per_request = max_session_per_request
+
+    def find_missing_sessions(self, stored_dates: Iterable[date]) -> List[date]:
+        stored_dates = set(stored_dates)
+        if not stored_dates:
+            return []
+
+        first_date = min(stored_dates)
+        last_date = max(stored_dates)
+
+        # A complete series needs no scan of its sessions
+        if len(stored_dates) == self._trading_calendar.expected_bar_count(
+            first_date, last_date
+        ) and all(self._trading_calendar.is_session(day) for day in stored_dates):
+            return []
+
+        return [
+            session
+            for session in self._trading_calendar.sessions(first_date, last_date)
+            if session not in stored_dates
+        ]
+
+    def group_into_ranges(self, missing_sessions: List[date]) -> List[Tuple[date, date]]:
+        """Merge missing sessions into ranges, each fitting one page of sessions."""
+        ranges: List[Tuple[date, date]] = []
+
+        for session in missing_sessions:
+            if ranges and (
+                self._trading_calendar.count_sessions(ranges[-1][0], session)
+                <= self._max_session_per_request
+            ):
+                ranges[-1] = (ranges[-1][0], session)
+                continue
+
+            ranges.append((session, session))
+
+        return ranges
@@ -0,0 +1,63 @@
+import threading
+from datetime import timedelta
+
+
+class AdaptiveIntervalPlanner:
+    """Sizes crawl windows to fill calls close to `target_number_of_record` rows."""
+
+    MAX_GROWTH_FACTOR = 4
+
+    def __init__(
+        self,
+        initial_interval: timedelta,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        target_number_of_record: int,
+    ):
+        if min_interval > max_interval:
+            raise ValueError(
+                f"Invalid interval bounds: {min_interval} is greater than {max_interval}."
+            )
+
+        if target_number_of_record < 1:
+            raise ValueError(
+                f"Invalid target number of record: {target_number_of_record}. Must be at least 1."
+            )
+
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._target_number_of_record = target_number_of_record
+        self._interval = self._clamp(initial_interval)
+
+        self._max_number_of_record = 0
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> timedelta:
+        return self._interval
+
+    def observe(self, number_of_record: int):
+        with self._lock:
+            self._max_number_of_record = max(
+                self._max_number_of_record, number_of_record
+            )
+
+    def next_interval(self) -> timedelta:
+        with self._lock:
+            if self._max_number_of_record == 0:
+                scale = self.MAX_GROWTH_FACTOR
+            else:
+                scale = min(
+                    self.MAX_GROWTH_FACTOR,
+                    self._target_number_of_record / self._max_number_of_record,
+                )
+
+            self._interval = self._clamp(
+                timedelta(days=max(1, int(self._interval.days * scale)))
+            )
+            self._max_number_of_record = 0
+
+            return self._interval
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        return min(max(interval, self._min_interval), self._max_interval)
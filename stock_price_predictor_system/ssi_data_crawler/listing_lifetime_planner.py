@@ -0,0 +1,65 @@
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+
+class ListingLifetimePlanner:
+    """Trims requests to the listing lifetime of their security."""
+
+    def __init__(self):
+        self._lifetimes: Dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
+
+        self._number_of_planned_call = 0
+        self._number_of_eliminated_call = 0
+        self._lock = threading.Lock()
+
+    @property
+    def number_of_security(self) -> int:
+        return len(self._lifetimes)
+
+    @property
+    def number_of_planned_call(self) -> int:
+        return self._number_of_planned_call
+
+    @property
+    def number_of_eliminated_call(self) -> int:
+        return self._number_of_eliminated_call
+
+    def set_lifetime(
+        self,
+        symbol: str,
+        first_trading_date: Optional[datetime],
+        last_trading_date: Optional[datetime],
+    ):
+        if not first_trading_date and not last_trading_date:
+            return
+
+        self._lifetimes[symbol] = (first_trading_date, last_trading_date)
+
+    def plan(
+        self, symbol: str, start_interval: datetime, end_interval: datetime
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Return the interval to request, or None when no request is needed."""
+        first_trading_date, last_trading_date = self._lifetimes.get(
+            symbol, (None, None)
+        )
+
+        if first_trading_date and first_trading_date > start_interval:
+            start_interval = first_trading_date
+
+        if last_trading_date and last_trading_date < end_interval:
+            end_interval = last_trading_date
+
+        with self._lock:
+            self._number_of_planned_call += 1
+
+            if start_interval > end_interval:
+                self._number_of_eliminated_call += 1
+                return None
+
+        return start_interval, end_interval
+
+    def reset_statistics(self):
+        with self._lock:
+            self._number_of_planned_call = 0
+            self._number_of_eliminated_call = 0
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+
+from ..time_series_database_driver.model import PointBatch
+
+
+@dataclass
+class DailyStockPriceWorkItem:
+    sequence: int
+    symbol: str
+    start_interval: datetime
+    end_interval: datetime
+    data: List[Dict] = None
+    point_batch: PointBatch = None
@@ -0,0 +1,213 @@
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from typing import Dict, List
+
+from .rate_limiter import SharedTokenBucketRateLimiter
+from .ssi_data_crawler import SsiDataCrawler
+
+from ..config_helper.model import ConfigModel, SsiCrawlerInfoConfig
+from ..logger.logger import Logger
+from ..relational_database_driver.model import SqlServerAuthentication
+from ..relational_database_driver.sql_server_driver import SqlServerDriver
+from ..time_series_database_driver.influxdb_driver import InfluxdbDriver
+from ..time_series_database_driver.model import InfluxdbAuthentication
+from ..constant import *
+
+def run_backfill_worker(
+    worker_index: int,
+    config: ConfigModel,
+    crawler_config: SsiCrawlerInfoConfig,
+    rate_limiter: SharedTokenBucketRateLimiter,
+    symbols: List[str],
+    progress_queue: multiprocessing.Queue,
+):
+    """Entry point of one backfill process."""
+    _logger = Logger(f"parallel_backfill_worker_{worker_index}")
+
+    # Only the parent prints progress
+    sys.stdout = open(os.devnull, "w")
+
+    relational_database_driver = SqlServerDriver(_logger)
+    time_series_database_driver = InfluxdbDriver(_logger)
+
+    successful = relational_database_driver.open_connection(
+        SqlServerAuthentication(
+            server=config.relational_database.server_name,
+            login=config.relational_database.login,
+            password=config.relational_database.password,
+        )
+    )
+    successful &= time_series_database_driver.open_connection(
+        InfluxdbAuthentication(
+            url=config.time_series_database.url,
+            org=config.time_series_database.org,
+            token=config.time_series_database.token,
+        )
+    )
+
+    if successful:
+        ssi_data_crawler = SsiDataCrawler(_logger)
+        ssi_data_crawler.add_crawler_config(crawler_config)
+        ssi_data_crawler.share_api_rate_budget(rate_limiter)
+        ssi_data_crawler.add_relational_database_driver(relational_database_driver)
+        ssi_data_crawler.add_time_series_database_driver(time_series_database_driver)
+
+        successful = ssi_data_crawler.backfill_securities_history(
+            symbols,
+            lambda symbol, number_of_point: progress_queue.put(
+                ("progress", worker_index, symbol, number_of_point)
+            ),
+        )
+
+    progress_queue.put(("done", worker_index, successful))
+
+
+class ParallelBackfill:
+    """Backfills securities dealt round-robin to processes sharing the rate limit."""
+
+    def __init__(
+        self,
+        _logger: Logger,
+        config: ConfigModel,
+        number_of_process: int = PARALLEL_BACKFILL_PROCESSES,
+    ):
+        self._logger = _logger
+        self._config = config
+        self._number_of_process = max(1, number_of_process)
+
+        # Fork would copy the locks and connections of the parent
+        self._context = multiprocessing.get_context("spawn")
+
+    # region Public methods
+
+    def run(self, symbols: List[str]) -> bool:
+        if not symbols:
+            print("\nNo securities to backfill.")
+            self._logger.log_warning("No securities to backfill.")
+            return True
+
+        number_of_process = min(self._number_of_process, len(symbols))
+        crawler_configs = [
+            self._config.ssi_crawler_info
+        ] + self._config.additional_ssi_crawler_info
+
+        # One bucket per credential, shared by its processes and endpoints
+        rate_limiters = [
+            SharedTokenBucketRateLimiter(
+                self._context, API_RATE_LIMIT_PER_SECOND, API_RATE_LIMIT_BURST
+            )
+            for _ in crawler_configs
+        ]
+
+        print(
+            f"\nBackfilling {len(symbols)} securities in {number_of_process} processes with {len(crawler_configs)} credentials."
+        )
+        self._logger.log_info(
+            f"Backfilling {len(symbols)} securities in {number_of_process} processes with {len(crawler_configs)} credentials."
+        )
+
+        progress_queue = self._context.Queue()
+        processes: Dict[int, multiprocessing.Process] = {}
+
+        for worker_index in range(number_of_process):
+            credential_index = worker_index % len(crawler_configs)
+
+            process = self._context.Process(
+                target=run_backfill_worker,
+                args=(
+                    worker_index,
+                    self._config,
+                    crawler_configs[credential_index],
+                    rate_limiters[credential_index],
+                    symbols[worker_index::number_of_process],
+                    progress_queue,
+                ),
+                name=f"parallel-backfill-{worker_index}",
+            )
+            process.start()
+            processes[worker_index] = process
+
+        successful = self._collect_progress(progress_queue, processes, len(symbols))
+
+        for process in processes.values():
+            process.join()
+
+        return successful
+
+    # endregion
+
+    # region Private methods
+
+    def _collect_progress(
+        self,
+        progress_queue: multiprocessing.Queue,
+        processes: Dict[int, multiprocessing.Process],
+        number_of_security: int,
+    ) -> bool:
+        successful = True
+        running_workers = set(processes)
+        number_of_finished_security = 0
+        number_of_point = 0
+        start_time = time.monotonic()
+
+        while running_workers:
+            try:
+                message = progress_queue.get(timeout=1)
+
+            except queue.Empty:
+                # A process that died without reporting would be waited for forever
+                for worker_index in list(running_workers):
+                    if not processes[worker_index].is_alive():
+                        print(
+                            f"\nBackfill process {worker_index} exited with code {processes[worker_index].exitcode}."
+                        )
+                        self._logger.log_error(
+                            f"Backfill process {worker_index} exited with code {processes[worker_index].exitcode}."
+                        )
+                        running_workers.discard(worker_index)
+                        successful = False
+
+                continue
+
+            match (message[0]):
+
+                case "progress":
+                    _, _, _, number_of_saved_point = message
+                    number_of_finished_security += 1
+                    number_of_point += number_of_saved_point
+
+                    elapsed_time = max(time.monotonic() - start_time, 1e-9)
+                    print(
+                        f"\rBackfilled {number_of_finished_security}/{number_of_security} securities, "
+                        f"{number_of_point} points ({number_of_point / elapsed_time:.2f} points/s).",
+                        end="",
+                        flush=True,
+                    )
+
+                case "done":
+                    _, worker_index, worker_successful = message
+                    running_workers.discard(worker_index)
+
+                    if not worker_successful:
+                        print(f"\nBackfill process {worker_index} failed.")
+                        self._logger.log_error(f"Backfill process {worker_index} failed.")
+                        successful = False
+
+                case _:
+                    self._logger.log_warning(f"Unknown backfill message: {message}.")
+
+        elapsed_time = time.monotonic() - start_time
+
+        print(
+            f"\nBackfilled {number_of_finished_security}/{number_of_security} securities and {number_of_point} points in {elapsed_time:.2f} s."
+        )
+        self._logger.log_info(
+            f"Backfilled {number_of_finished_security}/{number_of_security} securities and {number_of_point} points in {elapsed_time:.2f} s."
+        )
+
+        return successful
+
+    # endregion
@@ -0,0 +1,169 @@
+import queue
+import threading
+from typing import Any, Callable, Dict, List
+
+from ..logger.logger import Logger
+
+
+class PipelineStage:
+    """`number_of_worker` threads applying `function`; False fails the pipeline."""
+
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[Any], Any],
+        number_of_worker: int,
+        queue_size: int,
+        finalize: Callable[[], bool] = None,
+    ):
+        if number_of_worker < 1:
+            raise ValueError(
+                f"Invalid number of worker of stage {name}: {number_of_worker}. Must be at least 1."
+            )
+
+        self.name = name
+        self.function = function
+        self.number_of_worker = number_of_worker
+        self.finalize = finalize
+
+        self.input_queue = queue.Queue(maxsize=queue_size)
+        self.number_of_processed_item = 0
+        self.number_of_running_worker = 0
+
+
+class Pipeline:
+    """Stages connected by bounded queues, so a slow stage applies backpressure."""
+
+    _STOP = object()
+
+    def __init__(self, _logger: Logger):
+        self._logger = _logger
+
+        self._stages: List[PipelineStage] = []
+        self._threads: List[threading.Thread] = []
+        self._failed = threading.Event()
+        self._condition = threading.Condition()
+
+    # region Public methods
+
+    @property
+    def failed(self) -> bool:
+        return self._failed.is_set()
+
+    @property
+    def queue_depths(self) -> Dict[str, int]:
+        return {stage.name: stage.input_queue.qsize() for stage in self._stages}
+
+    def add_stage(
+        self,
+        name: str,
+        function: Callable[[Any], Any],
+        number_of_worker: int,
+        queue_size: int,
+        finalize: Callable[[], bool] = None,
+    ):
+        if self._threads:
+            raise RuntimeError("Cannot add a stage to a started pipeline.")
+
+        self._stages.append(
+            PipelineStage(name, function, number_of_worker, queue_size, finalize)
+        )
+
+    def start(self):
+        for index, stage in enumerate(self._stages):
+            stage.number_of_running_worker = stage.number_of_worker
+
+            for worker_index in range(stage.number_of_worker):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(index,),
+                    name=f"{stage.name}-{worker_index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def put(self, item: Any):
+        """Feed the first stage, blocking while its queue is full."""
+        self._stages[0].input_queue.put(item)
+
+    def wait_until_processed(self, stage_name: str, number_of_item: int):
+        """Block until `stage_name` has processed `number_of_item` items in total."""
+        stage = next(stage for stage in self._stages if stage.name == stage_name)
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: stage.number_of_processed_item >= number_of_item
+                or self.failed
+            )
+
+    def close(self) -> bool:
+        """Drain every stage, stop the workers and return whether all items succeeded."""
+        for _ in range(self._stages[0].number_of_worker):
+            self._stages[0].input_queue.put(self._STOP)
+
+        for thread in self._threads:
+            thread.join()
+
+        self._threads = []
+
+        return not self.failed
+
+    # endregion
+
+    # region Private methods
+
+    def _run_worker(self, stage_index: int):
+        stage = self._stages[stage_index]
+        next_stage = (
+            self._stages[stage_index + 1]
+            if stage_index + 1 < len(self._stages)
+            else None
+        )
+
+        while True:
+            item = stage.input_queue.get()
+            if item is self._STOP:
+                break
+
+            # After a failure the remaining items are drained, not processed,
+            # so that no producer stays blocked on a full queue.
+            if not self.failed:
+                try:
+                    result = stage.function(item)
+
+                except Exception as e:
+                    print(f"\nPipeline stage {stage.name} failed. Error: {e}")
+                    self._logger.log_error(
+                        f"Pipeline stage {stage.name} failed. Error: {e}"
+                    )
+                    result = False
+
+                if result is False:
+                    self._failed.set()
+
+                elif next_stage:
+                    next_stage.input_queue.put(result)
+
+            with self._condition:
+                stage.number_of_processed_item += 1
+                self._condition.notify_all()
+
+        with self._condition:
+            stage.number_of_running_worker -= 1
+            is_last_worker = stage.number_of_running_worker == 0
+
+        if not is_last_worker:
+            return
+
+        if stage.finalize and not stage.finalize():
+            self._failed.set()
+
+        if next_stage:
+            for _ in range(next_stage.number_of_worker):
+                next_stage.input_queue.put(self._STOP)
+
+        with self._condition:
+            self._condition.notify_all()
+
+    # endregion
@@ -0,0 +1,91 @@
+from datetime import datetime
+from itertools import batched, chain
+from operator import itemgetter
+from typing import Dict, Iterable, List
+
+import numpy as np
+from numpy.lib.recfunctions import unstructured_to_structured
+
+from .field_schema import EndpointSchema
+
+from ..time_series_database_driver.model import PointBatch
+
+
+class PointBatchConverter:
+    """Converts the rows of one endpoint into a `PointBatch`, as its schema says."""
+
+    def __init__(self, schema: EndpointSchema):
+        self._schema = schema
+
+        self._get_values = itemgetter(*(field.key for field in schema.fields))
+        self._get_tag = itemgetter(schema.tagKey)
+        self._get_time = (
+            itemgetter(schema.timeKeys[0])
+            if len(schema.timeKeys) == 1
+            else lambda row: " ".join(map(row.__getitem__, schema.timeKeys))
+        )
+        self._number_of_field = len(schema.fields)
+        self._dtype = np.dtype(
+            [(field.name, field.dataType) for field in schema.fields]
+        )
+
+    @property
+    def schema(self) -> EndpointSchema:
+        return self._schema
+
+    def convert(self, data: List[Dict]) -> PointBatch:
+        if data:
+            values = np.fromiter(
+                map(float, chain.from_iterable(map(self._get_values, data))),
+                dtype=np.float64,
+                count=len(data) * self._number_of_field,
+            ).reshape(len(data), self._number_of_field)
+            fields = unstructured_to_structured(
+                values, dtype=self._dtype, casting="unsafe"
+            )
+
+        else:
+            fields = np.empty(0, dtype=self._dtype)
+
+        times, inverse = np.unique(
+            np.array(list(map(self._get_time, data)), dtype=np.str_),
+            return_inverse=True,
+        )
+        parsed_times = np.array(
+            [
+                datetime.strptime(time, self._schema.timeFormat)
+                for time in times.tolist()
+            ],
+            dtype="datetime64[s]",
+        )
+
+        return PointBatch(
+            measurement=self._schema.measurement,
+            tag_key=self._schema.tagName,
+            tag_values=np.array(list(map(self._get_tag, data)), dtype=np.str_),
+            times=parsed_times[inverse].reshape(-1),
+            fields=fields,
+        )
+
+    def convert_iter(self, rows: Iterable[Dict], batch_size: int) -> PointBatch:
+        """Convert rows as they are produced, holding at most `batch_size` of them."""
+        point_batches = [
+            self.convert(list(batch)) for batch in batched(rows, batch_size)
+        ]
+
+        if not point_batches:
+            return self.convert([])
+
+        if len(point_batches) == 1:
+            return point_batches[0]
+
+        return PointBatch.concatenate(point_batches)
+
+
+def compile_converters(
+    schemas: Dict[str, EndpointSchema],
+) -> Dict[str, PointBatchConverter]:
+    """Compile one converter per endpoint of `schemas`."""
+    return {
+        endpoint: PointBatchConverter(schema) for endpoint, schema in schemas.items()
+    }
@@ -0,0 +1,134 @@
+import threading
+import time
+from typing import Dict
+
+from .rate_limiter import TokenBucketRateLimiter
+
+
+class EndpointRateStatistics:
+    """Calls made to one endpoint, to report the rate it actually ran at."""
+
+    def __init__(self):
+        self.number_of_call = 0
+        self.number_of_throttled_call = 0
+        self.first_call_time: float = None
+        self.last_call_time: float = None
+
+    @property
+    def effective_rate(self) -> float:
+        """Successful calls per second between the first and the last call."""
+        number_of_successful_call = self.number_of_call - self.number_of_throttled_call
+
+        if number_of_successful_call < 2 or self.last_call_time <= self.first_call_time:
+            return 0.0
+
+        return (number_of_successful_call - 1) / (
+            self.last_call_time - self.first_call_time
+        )
+
+
+class AimdRateController:
+    """AIMD control of the request rate of one FastConnect consumer, shared by every endpoint."""
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        additive_increase: float,
+        multiplicative_decrease: float,
+        capacity: int = 1,
+        rate_limiter: TokenBucketRateLimiter = None,
+    ):
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError(
+                f"Invalid rates: {min_rate} <= {initial_rate} <= {max_rate} must hold and be greater than 0."
+            )
+
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError(
+                f"Invalid multiplicative decrease: {multiplicative_decrease}. Must be between 0 and 1."
+            )
+
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._additive_increase = additive_increase
+        self._multiplicative_decrease = multiplicative_decrease
+
+        # The quota is per consumer, so every endpoint draws from one bucket
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=initial_rate, capacity=capacity
+        )
+        self._last_decrease_time = 0.0
+        self._is_limited = False
+        self._statistics: Dict[str, EndpointRateStatistics] = {}
+        self._lock = threading.Lock()
+
+    # region Public methods
+
+    @property
+    def rate(self) -> float:
+        """Current target rate, shared by every endpoint."""
+        return self._rate_limiter.rate
+
+    @property
+    def statistics(self) -> Dict[str, EndpointRateStatistics]:
+        return self._statistics
+
+    def acquire(self, endpoint: str) -> float:
+        """Block until `endpoint` may be called; return the send time."""
+        self._is_limited = self._rate_limiter.acquire() > 0
+        return time.monotonic()
+
+    async def acquire_async(self, endpoint: str) -> float:
+        self._is_limited = await self._rate_limiter.acquire_async() > 0
+        return time.monotonic()
+
+    def on_success(self, endpoint: str, send_time: float):
+        with self._lock:
+            self._record_call(endpoint, send_time, throttled=False)
+
+            # A rate the caller does not reach says nothing about the quota
+            if not self._is_limited:
+                return
+
+            self._rate_limiter.set_rate(
+                min(self._max_rate, self._rate_limiter.rate + self._additive_increase)
+            )
+
+    def on_throttle(self, endpoint: str, send_time: float) -> bool:
+        """Back off, unless the rate already dropped after `send_time`. Return whether it did."""
+        with self._lock:
+            self._record_call(endpoint, send_time, throttled=True)
+
+            if send_time < self._last_decrease_time:
+                return False
+
+            self._rate_limiter.set_rate(
+                max(
+                    self._min_rate,
+                    self._rate_limiter.rate * self._multiplicative_decrease,
+                )
+            )
+            self._last_decrease_time = time.monotonic()
+
+            return True
+
+    # endregion
+
+    # region Private methods
+
+    def _record_call(self, endpoint: str, send_time: float, throttled: bool):
+        statistics = self._statistics.setdefault(endpoint, EndpointRateStatistics())
+        statistics.number_of_call += 1
+
+        if throttled:
+            statistics.number_of_throttled_call += 1
+            return
+
+        if statistics.first_call_time is None:
+            statistics.first_call_time = send_time
+
+        statistics.last_call_time = max(statistics.last_call_time or send_time, send_time)
+
+    # endregion
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """Token bucket shared by every caller of the SSI FastConnect API."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}. Must be greater than 0.")
+
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be at least 1.")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def set_rate(self, rate: float):
+        """Change the refill rate. Tokens earned so far are kept."""
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}. Must be greater than 0.")
+
+        with self._lock:
+            self._refill()
+            self._rate = rate
+
+    def acquire(self) -> float:
+        """Block the calling thread until one token is available. Return the wait in seconds."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Suspend the calling coroutine until one token is available. Return the wait in seconds."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self._rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+
+class SharedTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """Token bucket in shared memory, drawn from by several processes."""
+
+    # Indexes in the shared state
+    _RATE = 0
+    _TOKENS = 1
+    _LAST_REFILL = 2
+
+    def __init__(self, context, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}. Must be greater than 0.")
+
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be at least 1.")
+
+        self._capacity = capacity
+        self._state = context.Array("d", [rate, float(capacity), time.monotonic()])
+
+    @property
+    def rate(self) -> float:
+        return self._state[self._RATE]
+
+    def set_rate(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}. Must be greater than 0.")
+
+        with self._state.get_lock():
+            self._refill()
+            self._state[self._RATE] = rate
+
+    def _reserve(self) -> float:
+        with self._state.get_lock():
+            self._refill()
+            self._state[self._TOKENS] -= 1
+
+            if self._state[self._TOKENS] >= 0:
+                return 0.0
+
+            return -self._state[self._TOKENS] / self._state[self._RATE]
+
+    def _refill(self):
+        now = time.monotonic()
+        self._state[self._TOKENS] = min(
+            self._capacity,
+            self._state[self._TOKENS]
+            + (now - self._state[self._LAST_REFILL]) * self._state[self._RATE],
+        )
+        self._state[self._LAST_REFILL] = now
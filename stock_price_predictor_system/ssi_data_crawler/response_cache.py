@@ -0,0 +1,112 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from ..logger.logger import Logger
+
+
+class ResponseCache:
+    """Content-addressed cache of FastConnect responses, as gzip JSON files."""
+
+    def __init__(
+        self, _logger: Logger, directory: str, ttls: Dict[str, timedelta]
+    ):
+        self._logger = _logger
+        self._directory = directory
+        self._ttls = ttls
+
+        self._number_of_hit = 0
+        self._number_of_miss = 0
+        self._lock = threading.Lock()
+
+    @property
+    def number_of_hit(self) -> int:
+        return self._number_of_hit
+
+    @property
+    def number_of_miss(self) -> int:
+        return self._number_of_miss
+
+    def get(self, endpoint: str, input_model) -> Optional[Dict]:
+        if not self._is_cacheable(endpoint):
+            return None
+
+        entry = self._read_entry(self._get_path(endpoint, input_model))
+
+        if entry is not None and not entry["immutable"]:
+            created_date = datetime.fromisoformat(entry["createdDate"])
+            if datetime.now() - created_date > self._ttls[endpoint]:
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self._number_of_miss += 1
+                return None
+
+            self._number_of_hit += 1
+
+        return entry["response"]
+
+    def put(self, endpoint: str, input_model, response: Dict, immutable: bool = False):
+        # Errors and rejected requests are worth retrying, not caching
+        if not self._is_cacheable(endpoint) or response.get("status") != 200:
+            return
+
+        path = self._get_path(endpoint, input_model)
+        entry = {
+            "createdDate": datetime.now().isoformat(),
+            "immutable": immutable,
+            "response": response,
+        }
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # Write to a temporary file first, so that a reader never sees
+            # half of an entry. Processes may share the cache directory.
+            temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(temporary_path, "wt", encoding="utf-8") as cache_file:
+                json.dump(entry, cache_file, default=str)
+
+            os.replace(temporary_path, path)
+
+        except OSError as e:
+            print(f"\nCannot write response cache entry {path}. Error: {e}")
+            self._logger.log_warning(
+                f"Cannot write response cache entry {path}. Error: {e}"
+            )
+
+    def _is_cacheable(self, endpoint: str) -> bool:
+        ttl = self._ttls.get(endpoint)
+        return ttl is not None and ttl > timedelta(0)
+
+    def _get_path(self, endpoint: str, input_model) -> str:
+        # Unset parameters are not sent, so they must not change the key either
+        parameters = {
+            key: value for key, value in asdict(input_model).items() if value is not None
+        }
+        key = hashlib.sha256(
+            f"{endpoint}\n{json.dumps(parameters, sort_keys=True, default=str)}".encode()
+        ).hexdigest()
+
+        return os.path.join(self._directory, endpoint, key[:2], f"{key}.json.gz")
+
+    def _read_entry(self, path: str) -> Optional[Dict]:
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+
+        except (OSError, ValueError) as e:
+            print(f"\nIgnore unreadable response cache entry {path}. Error: {e}")
+            self._logger.log_warning(
+                f"Ignore unreadable response cache entry {path}. Error: {e}"
+            )
+            return None
@@ -1,10 +1,17 @@
+import asyncio
 import datetime
+from datetime import date
 from ssi_fc_data.fc_md_client import MarketDataClient
 import math
-import time
+import numpy as np
+import requests
+import threading
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
 
 from .api_model import *
 
+from .model import *
+
 from .database_model import *
 
 from ..logger.logger import Logger
@@ -25,37 +32,154 @@ from ..helper.helper import Helper
 
 from .enum import *
 
+from .rate_controller import AimdRateController
+
+from .rate_limiter import TokenBucketRateLimiter
+
+from .interval_planner import AdaptiveIntervalPlanner
+
+from .watermark_store import WatermarkStore
+
+from .listing_lifetime_planner import ListingLifetimePlanner
+
+from .gap_detector import GapDetector
+
+from .field_schema import FIELD_SCHEMAS
+
+from .point_batch_converter import compile_converters
+
+from .streaming_client import StreamingMarketDataClient
+
+from .pipeline import Pipeline
+
+from .credential_pool import CrawlerCredential, CredentialPool
+
+from .response_cache import ResponseCache
+
+from .fingerprint_index import FingerprintIndex
+
+from ..trading_calendar.trading_calendar import TradingCalendar
+
 from ..constant import *
 
 
 class SsiDataCrawler(Helper):
 
-    def __init__(self, _logger: Logger):
+    def __init__(
+        self,
+        _logger: Logger,
+        enable_response_cache: bool = ENABLE_RESPONSE_CACHE,
+        enable_change_detection: bool = ENABLE_CHANGE_DETECTION,
+    ):
         self._logger = _logger
 
         self._config: SsiCrawlerInfoConfig = None
         self._client: MarketDataClient = None
+        self._initial_api_rate = API_RATE_LIMIT_PER_SECOND
+        self._max_api_rate = API_MAX_RATE_LIMIT_PER_SECOND
+        self._rate_controller = self._create_rate_controller()
+        self._credential_pool: CredentialPool = None
+        self._response_cache = (
+            ResponseCache(self._logger, RESPONSE_CACHE_DIRECTORY, RESPONSE_CACHE_TTLS)
+            if enable_response_cache
+            else None
+        )
+        self._fingerprint_index = (
+            FingerprintIndex(self._logger, FINGERPRINT_INDEX_DIRECTORY)
+            if enable_change_detection
+            else None
+        )
 
         self._relational_database_driver: RelationalDatabaseDriver = None
+        self._watermark_store: WatermarkStore = None
+        self._listing_lifetime_planner = ListingLifetimePlanner()
+        self._trading_calendar = TradingCalendar()
+        self._converters = compile_converters(FIELD_SCHEMAS)
+        self._number_of_non_session_call = 0
+        self._number_of_saved_point = 0
+        self._statistics_lock = threading.Lock()
         self._time_series_database_driver: TimeSeriesDatabaseDriver = None
 
     # region Public methods
 
-    def add_crawler_config(self, add_crawler_config: SsiCrawlerInfoConfig):
+    def add_crawler_config(
+        self,
+        add_crawler_config: SsiCrawlerInfoConfig,
+        additional_crawler_configs: List[SsiCrawlerInfoConfig] = None,
+    ):
         self._config = add_crawler_config
-        self._client = MarketDataClient(self._config)
+        self._client = StreamingMarketDataClient(self._config)
+
+        # Every credential has its own quota, hence its own rate controller
+        credentials = [
+            CrawlerCredential(0, self._config, self._client, self._rate_controller)
+        ]
+        for index, crawler_config in enumerate(additional_crawler_configs or [], 1):
+            credentials.append(
+                CrawlerCredential(
+                    index,
+                    crawler_config,
+                    StreamingMarketDataClient(crawler_config),
+                    self._create_rate_controller(),
+                )
+            )
+
+        self._credential_pool = CredentialPool(self._logger, credentials)
+
+        print(f"\nLoaded {self._credential_pool.size} SSI FastConnect credentials.")
+        self._logger.log_info(
+            f"Loaded {self._credential_pool.size} SSI FastConnect credentials."
+        )
+
+    def set_api_rate_limit(
+        self, initial_rate: float, max_rate: float = API_MAX_RATE_LIMIT_PER_SECOND
+    ):
+        """Restart the rate controller of every credential, e.g. for benchmarks."""
+        self._initial_api_rate = initial_rate
+        self._max_api_rate = max(initial_rate, max_rate)
+        self._rate_controller = self._create_rate_controller()
+
+        if self._credential_pool:
+            for credential in self._credential_pool.credentials:
+                credential.rate_controller = (
+                    self._rate_controller
+                    if credential.index == 0
+                    else self._create_rate_controller()
+                )
+
+    def share_api_rate_budget(self, rate_limiter: TokenBucketRateLimiter):
+        """Draw calls from a token bucket shared with other processes."""
+        self._rate_controller = AimdRateController(
+            initial_rate=self._initial_api_rate,
+            min_rate=min(API_MIN_RATE_LIMIT_PER_SECOND, self._initial_api_rate),
+            max_rate=self._max_api_rate,
+            additive_increase=API_RATE_ADDITIVE_INCREASE,
+            multiplicative_decrease=API_RATE_MULTIPLICATIVE_DECREASE,
+            capacity=API_RATE_LIMIT_BURST,
+            rate_limiter=rate_limiter,
+        )
+
+        if self._credential_pool:
+            self._credential_pool.credentials[0].rate_controller = self._rate_controller
 
     def add_relational_database_driver(
         self,
         relational_database_driver: RelationalDatabaseDriver,
     ):
         self._relational_database_driver = relational_database_driver
+        self._watermark_store = WatermarkStore(
+            self._logger, self._relational_database_driver
+        )
 
     def add_time_series_database_driver(
         self, time_series_database_driver: TimeSeriesDatabaseDriver
     ):
         self._time_series_database_driver = time_series_database_driver
 
+    @property
+    def trading_calendar(self) -> TradingCalendar:
+        return self._trading_calendar
+
     def crawl_relational_data(self) -> bool:
         if not self._is_initialized():
             print(
@@ -89,9 +213,14 @@ class SsiDataCrawler(Helper):
             self._logger.log_error("Cannot crawl all securities data.")
             return False
 
+        self._report_response_cache()
+        self._report_api_rates()
+
         return True
 
-    def crawl_time_series_data(self) -> bool:
+    def crawl_time_series_data(
+        self, crawl_mode: TimeSeriesCrawlMode = TIME_SERIES_CRAWL_MODE
+    ) -> bool:
         if not self._is_initialized():
             print(
                 "\nClient is not initialized. Cannot crawl data. Double check configuration and try again."
@@ -101,210 +230,1747 @@ class SsiDataCrawler(Helper):
             )
             return False
 
-        if not isinstance(self._time_series_database_driver, TimeSeriesDatabaseDriver):
-            print('\nInvalid "_time_series_database_driver".')
-            self._logger.log_error('Invalid "_time_series_database_driver".')
-            return False
+        if not isinstance(self._time_series_database_driver, TimeSeriesDatabaseDriver):
+            print('\nInvalid "_time_series_database_driver".')
+            self._logger.log_error('Invalid "_time_series_database_driver".')
+            return False
+
+        if not self._watermark_store.load():
+            return False
+
+        if ENABLE_LISTING_LIFETIME_PLANNER:
+            self._listing_lifetime_planner.reset_statistics()
+            self._load_listing_lifetimes()
+
+        self._load_trading_holidays()
+        self._number_of_non_session_call = 0
+
+        print(f"\nCrawl mode: {crawl_mode.value}.")
+        self._logger.log_info(f"Crawl mode: {crawl_mode.value}.")
+
+        match (crawl_mode):
+
+            case TimeSeriesCrawlMode.SERIAL:
+                successful = self._crawl_time_series_data_serially()
+
+            case TimeSeriesCrawlMode.ASYNC:
+                successful = asyncio.run(self._crawl_time_series_data_async())
+
+            case TimeSeriesCrawlMode.MARKET_WIDE:
+                successful = self._crawl_time_series_data_market_wide()
+
+            case TimeSeriesCrawlMode.INCREMENTAL:
+                successful = self._crawl_time_series_data_incrementally()
+
+            case TimeSeriesCrawlMode.PIPELINE:
+                successful = self._crawl_time_series_data_pipelined()
+
+            case TimeSeriesCrawlMode.SHARDED:
+                successful = self._crawl_time_series_data_sharded()
+
+            case _:
+                print(f"\nUnsupported crawl mode: {crawl_mode}.")
+                self._logger.log_error(f"Unsupported crawl mode: {crawl_mode}.")
+                return False
+
+        # Keep the watermarks of whatever was saved, even after a failure
+        successful &= self._watermark_store.flush()
+        successful &= self._flush_fingerprint_index()
+        successful &= self._save_trading_holidays()
+
+        if ENABLE_LISTING_LIFETIME_PLANNER:
+            print(
+                f"\nListing lifetime planner eliminated {self._listing_lifetime_planner.number_of_eliminated_call} of {self._listing_lifetime_planner.number_of_planned_call} planned calls."
+            )
+            self._logger.log_info(
+                f"Listing lifetime planner eliminated {self._listing_lifetime_planner.number_of_eliminated_call} of {self._listing_lifetime_planner.number_of_planned_call} planned calls."
+            )
+
+        print(
+            f"\nTrading calendar skipped {self._number_of_non_session_call} calls without a trading session."
+        )
+        self._logger.log_info(
+            f"Trading calendar skipped {self._number_of_non_session_call} calls without a trading session."
+        )
+
+        self._report_response_cache()
+        self._report_change_detection()
+        self._report_api_rates()
+
+        return successful
+
+    def backfill_time_series_data(self) -> bool:
+        """Request only the trading sessions missing between stored bars."""
+        if not self._is_initialized():
+            print(
+                "\nClient is not initialized. Cannot backfill data. Double check configuration and try again."
+            )
+            self._logger.log_error(
+                "Client is not initialized. Cannot backfill data. Double check configuration and try again."
+            )
+            return False
+
+        if not isinstance(self._time_series_database_driver, TimeSeriesDatabaseDriver):
+            print('\nInvalid "_time_series_database_driver".')
+            self._logger.log_error('Invalid "_time_series_database_driver".')
+            return False
+
+        if not self._watermark_store.load():
+            return False
+
+        if ENABLE_LISTING_LIFETIME_PLANNER:
+            self._listing_lifetime_planner.reset_statistics()
+            self._load_listing_lifetimes()
+
+        self._load_trading_holidays()
+        self._number_of_non_session_call = 0
+
+        backfill_ranges = self._plan_backfill_ranges()
+        if backfill_ranges is None:
+            return False
+
+        successful = True
+
+        for symbol, date_ranges in backfill_ranges.items():
+            for start_date, end_date in date_ranges:
+                if not self._crawl_daily_stock_price(
+                    None,
+                    symbol,
+                    datetime.combine(start_date, datetime.min.time()),
+                    datetime.combine(end_date, datetime.min.time()),
+                ):
+                    successful = False
+                    break
+
+            if not successful:
+                break
+
+        successful &= self._watermark_store.flush()
+        successful &= self._flush_fingerprint_index()
+        successful &= self._save_trading_holidays()
+
+        self._report_response_cache()
+        self._report_change_detection()
+        self._report_api_rates()
+
+        return successful
+
+    def clear_fingerprint_index(self) -> bool:
+        fingerprint_index = self._fingerprint_index or FingerprintIndex(
+            self._logger, FINGERPRINT_INDEX_DIRECTORY
+        )
+
+        if not fingerprint_index.clear():
+            return False
+
+        print("\nCleared the fingerprint index of written points.")
+        self._logger.log_info("Cleared the fingerprint index of written points.")
+
+        return True
+
+    def get_all_security_symbols(self) -> List[str]:
+        return [security.Symbol for security in self._retrieve_all_security_data()]
+
+    def backfill_securities_history(
+        self,
+        symbols: List[str],
+        on_progress: Callable[[str, int], None] = None,
+    ) -> bool:
+        """Crawl every security from its watermark up to today, one after another."""
+        if not self._is_initialized():
+            print(
+                "\nClient is not initialized. Cannot backfill data. Double check configuration and try again."
+            )
+            self._logger.log_error(
+                "Client is not initialized. Cannot backfill data. Double check configuration and try again."
+            )
+            return False
+
+        if not isinstance(self._time_series_database_driver, TimeSeriesDatabaseDriver):
+            print('\nInvalid "_time_series_database_driver".')
+            self._logger.log_error('Invalid "_time_series_database_driver".')
+            return False
+
+        if not self._watermark_store.load():
+            return False
+
+        if ENABLE_LISTING_LIFETIME_PLANNER:
+            self._listing_lifetime_planner.reset_statistics()
+            self._load_listing_lifetimes()
+
+        self._load_trading_holidays()
+        self._number_of_non_session_call = 0
+
+        successful = True
+
+        for symbol in symbols:
+            number_of_saved_point = self._number_of_saved_point
+
+            if not self._crawl_security_history(symbol):
+                successful = False
+                break
+
+            if on_progress:
+                on_progress(symbol, self._number_of_saved_point - number_of_saved_point)
+
+        successful &= self._watermark_store.flush()
+        successful &= self._flush_fingerprint_index()
+        successful &= self._save_trading_holidays()
+
+        self._report_response_cache()
+        self._report_change_detection()
+        self._report_api_rates()
+
+        return successful
+
+    # endregion
+
+    # region Private methods
+
+    def _plan_backfill_ranges(self) -> Dict[str, List[Tuple[date, date]]]:
+        stored_timestamps = self._time_series_database_driver.read_timestamps(
+            ReadComponent(
+                bucket=BUCKET_NAME,
+                start_time=DEFAULT_CRAWL_DATA_START_DATE,
+                end_time=datetime.now(),
+                measurement=MEASUREMENT_NAME,
+            ),
+            field=BACKFILL_TIMESTAMP_FIELD,
+            tag_key="symbol",
+        )
+
+        if stored_timestamps is None:
+            print("\nCannot read stored timestamps. Cannot plan backfill.")
+            self._logger.log_error(
+                "Cannot read stored timestamps. Cannot plan backfill."
+            )
+            return None
+
+        gap_detector = GapDetector(self._trading_calendar, DAILY_STOCK_PRICE_PAGE_SIZE)
+
+        backfill_ranges: Dict[str, List[Tuple[date, date]]] = {}
+        number_of_missing_session = 0
+
+        for symbol, timestamps in stored_timestamps.items():
+            missing_sessions = gap_detector.find_missing_sessions(
+                timestamp.date() for timestamp in timestamps
+            )
+            if not missing_sessions:
+                continue
+
+            number_of_missing_session += len(missing_sessions)
+            backfill_ranges[symbol] = gap_detector.group_into_ranges(missing_sessions)
+
+            # The bars are missing from the bucket, whatever the index says
+            if self._fingerprint_index:
+                self._fingerprint_index.discard(
+                    symbol, np.array(missing_sessions, dtype="datetime64[D]")
+                )
+
+        number_of_request = sum(len(ranges) for ranges in backfill_ranges.values())
+        print(
+            f"\nFound {number_of_missing_session} missing sessions of {len(backfill_ranges)} securities, grouped into {number_of_request} requests."
+        )
+        self._logger.log_info(
+            f"Found {number_of_missing_session} missing sessions of {len(backfill_ranges)} securities, grouped into {number_of_request} requests."
+        )
+
+        return backfill_ranges
+
+    def _is_initialized(self) -> bool:
+        return (
+            self._config
+            and self._client
+            and isinstance(self._config, SsiCrawlerInfoConfig)
+            and isinstance(self._client, MarketDataClient)
+        )
+
+    def _load_time_series_crawl_state(
+        self,
+    ) -> Tuple[List[str], datetime, str, timedelta]:
+        all_securities = self._retrieve_all_security_data()
+
+        all_security_symbols = [security.Symbol for security in all_securities]
+
+        start_interval = DEFAULT_CRAWL_DATA_START_DATE
+        checkpoint_symbol = None
+        initial_interval = CRAWL_DATA_TIME_INTERVAL
+
+        crawl_checkpoint = self._get_time_series_data_crawl_checkpoint()
+
+        if (
+            crawl_checkpoint
+            and crawl_checkpoint.CurrentStartInterval
+            and crawl_checkpoint.CurrentSymbol in all_security_symbols
+        ):
+            start_interval = crawl_checkpoint.CurrentStartInterval
+            checkpoint_symbol = crawl_checkpoint.CurrentSymbol
+
+            # Resume with the interval that was being crawled, so that its
+            # windows line up with those of the symbols already crawled
+            if crawl_checkpoint.CurrentEndInterval:
+                initial_interval = (
+                    crawl_checkpoint.CurrentEndInterval
+                    - crawl_checkpoint.CurrentStartInterval
+                    + timedelta(days=1)
+                )
+
+        return all_security_symbols, start_interval, checkpoint_symbol, initial_interval
+
+    def _skip_ingested_days(
+        self, symbol: str, start_interval: datetime, end_interval: datetime
+    ) -> datetime:
+        """Start of the interval of `symbol` after the days it already has."""
+        watermark = self._watermark_store.get(symbol)
+
+        # Only an interrupted crawl of the interval leaves a watermark inside
+        # it, one past the interval was set by another crawl
+        if watermark and start_interval <= watermark <= end_interval:
+            return watermark + timedelta(days=1)
+
+        return start_interval
+
+    def _create_interval_planner(
+        self, initial_interval: timedelta, min_interval: timedelta
+    ) -> AdaptiveIntervalPlanner:
+        return AdaptiveIntervalPlanner(
+            initial_interval=initial_interval,
+            min_interval=min_interval,
+            max_interval=MAX_CRAWL_DATA_TIME_INTERVAL,
+            target_number_of_record=int(
+                DAILY_STOCK_PRICE_PAGE_SIZE * ADAPTIVE_INTERVAL_TARGET_FILL
+            ),
+        )
+
+    def _crawl_time_series_data_serially(self) -> bool:
+        all_security_symbols, start_interval, checkpoint_symbol, initial_interval = (
+            self._load_time_series_crawl_state()
+        )
+        found_checkpoint_symbol = False
+
+        interval_planner = self._create_interval_planner(
+            initial_interval, MIN_CRAWL_DATA_TIME_INTERVAL
+        )
+
+        while start_interval < datetime.now():
+            end_interval = start_interval + interval_planner.interval - timedelta(days=1)
+
+            print(
+                f"\nCrawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_info(
+                f"Crawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+
+            for symbol in all_security_symbols:
+                if (
+                    checkpoint_symbol
+                    and symbol != checkpoint_symbol
+                    and not found_checkpoint_symbol
+                ):
+                    continue
+
+                found_checkpoint_symbol = True
+
+                if not self._crawl_daily_stock_price(
+                    interval_planner,
+                    symbol,
+                    self._skip_ingested_days(symbol, start_interval, end_interval),
+                    end_interval,
+                ):
+                    return False
+
+                self._save_crawl_progress(
+                    lambda: self._set_time_series_data_crawl_checkpoint(
+                        start_interval, end_interval, symbol
+                    )
+                )
+
+            start_interval = end_interval + timedelta(days=1)
+            interval_planner.next_interval()
+
+        return True
+
+    async def _crawl_time_series_data_async(self) -> bool:
+        all_security_symbols, start_interval, checkpoint_symbol, initial_interval = (
+            self._load_time_series_crawl_state()
+        )
+
+        interval_planner = self._create_interval_planner(
+            initial_interval, MIN_CRAWL_DATA_TIME_INTERVAL
+        )
+
+        # The semaphore bounds how many requests are in flight, the rate
+        # limiter bounds how often a new one may start.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_CALL)
+
+        while start_interval < datetime.now():
+            end_interval = start_interval + interval_planner.interval - timedelta(days=1)
+
+            print(
+                f"\nCrawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_info(
+                f"Crawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+
+            symbols = all_security_symbols
+            if checkpoint_symbol:
+                symbols = symbols[symbols.index(checkpoint_symbol) :]
+                checkpoint_symbol = None
+
+            tasks = [
+                asyncio.create_task(
+                    self._crawl_daily_stock_price_async(
+                        semaphore,
+                        interval_planner,
+                        symbol,
+                        self._skip_ingested_days(symbol, start_interval, end_interval),
+                        end_interval,
+                    )
+                )
+                for symbol in symbols
+            ]
+
+            if not await self._await_and_checkpoint(
+                tasks, symbols, start_interval, end_interval
+            ):
+                return False
+
+            start_interval = end_interval + timedelta(days=1)
+            interval_planner.next_interval()
+
+        return True
+
+    async def _await_and_checkpoint(
+        self,
+        tasks: List[asyncio.Task],
+        symbols: List[str],
+        start_interval: datetime,
+        end_interval: datetime,
+    ) -> bool:
+        """Checkpoint the longest completed prefix of `symbols`, off the event loop."""
+
+        def save_checkpoint(symbol: str):
+            self._save_crawl_progress(
+                lambda: self._set_time_series_data_crawl_checkpoint(
+                    start_interval, end_interval, symbol
+                )
+            )
+
+        task_indices = {task: index for index, task in enumerate(tasks)}
+        completed = [False] * len(tasks)
+        next_index = 0
+        saved_index = 0
+        pending = set(tasks)
+        checkpoint_task = None
+
+        try:
+            while pending or checkpoint_task:
+                done, _ = await asyncio.wait(
+                    pending | {checkpoint_task} if checkpoint_task else pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    if task is checkpoint_task:
+                        checkpoint_task = None
+                        continue
+
+                    pending.discard(task)
+                    if not task.result():
+                        return False
+
+                    completed[task_indices[task]] = True
+
+                while next_index < len(completed) and completed[next_index]:
+                    next_index += 1
+
+                # Completions during a checkpoint write are coalesced into the next one
+                if checkpoint_task is None and next_index > saved_index:
+                    saved_index = next_index
+                    checkpoint_task = asyncio.create_task(
+                        asyncio.to_thread(save_checkpoint, symbols[next_index - 1])
+                    )
+
+            return True
+
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            # A write cannot be interrupted once in its thread, so it is waited
+            # for, then the symbols completed since it started are saved
+            if checkpoint_task:
+                await asyncio.wait({checkpoint_task})
+            if next_index > saved_index:
+                await asyncio.to_thread(save_checkpoint, symbols[next_index - 1])
+
+    def _crawl_time_series_data_pipelined(self) -> bool:
+        """Crawl like the serial mode, as stages of a `Pipeline`."""
+        all_security_symbols, start_interval, checkpoint_symbol, initial_interval = (
+            self._load_time_series_crawl_state()
+        )
+
+        interval_planner = self._create_interval_planner(
+            initial_interval, MIN_CRAWL_DATA_TIME_INTERVAL
+        )
+
+        pipeline = Pipeline(self._logger)
+
+        # Work items complete out of order, the checkpoint only advances over
+        # the longest prefix of sequences that has completed.
+        completed_work_items: Dict[int, DailyStockPriceWorkItem] = {}
+        checkpoint_state = {"next_sequence": 0, "work_item": None, "saved": True}
+
+        def fetch(work_item: DailyStockPriceWorkItem) -> DailyStockPriceWorkItem:
+            work_item.data = []
+
+            # A streamed response is converted while it downloads, which
+            # leaves nothing to the parse stage.
+            planned_interval = self._plan_daily_stock_price_interval(
+                work_item.symbol,
+                self._skip_ingested_days(
+                    work_item.symbol, work_item.start_interval, work_item.end_interval
+                ),
+                work_item.end_interval,
+            )
+
+            if planned_interval:
+                print(f"\nCrawling data for security: {work_item.symbol}")
+                self._logger.log_info(
+                    f"Crawling data for security: {work_item.symbol}"
+                )
+
+                if ENABLE_STREAMING_DECODE:
+                    work_item.point_batch = self._stream_daily_stock_price_point_batch(
+                        work_item.symbol, *planned_interval
+                    )
+                    work_item.data = None
+
+                else:
+                    work_item.data = self._get_all_daily_stock_price_pages(
+                        work_item.symbol, *planned_interval
+                    )
+
+            interval_planner.observe(
+                len(work_item.data)
+                if work_item.data is not None
+                else len(work_item.point_batch)
+            )
+            return work_item
+
+        def parse(work_item: DailyStockPriceWorkItem) -> DailyStockPriceWorkItem:
+            if work_item.data is not None:
+                work_item.point_batch = self._converters["daily_stock_price"].convert(
+                    work_item.data
+                )
+                work_item.data = None
+
+            return work_item
+
+        def write(work_item: DailyStockPriceWorkItem) -> DailyStockPriceWorkItem:
+            if len(work_item.point_batch) and not (
+                self._save_daily_stock_price(work_item.point_batch)
+            ):
+                print(
+                    f"\nCannot save daily stock price. Stock: {work_item.symbol}. Interval: {work_item.start_interval.strftime("%d/%m/%Y")} - {work_item.end_interval.strftime("%d/%m/%Y")}."
+                )
+                self._logger.log_error(
+                    f"Cannot save daily stock price. Stock: {work_item.symbol}. Interval: {work_item.start_interval.strftime("%d/%m/%Y")} - {work_item.end_interval.strftime("%d/%m/%Y")}."
+                )
+                return False
+
+            work_item.point_batch = None
+            return work_item
+
+        def save_checkpoint() -> bool:
+            if checkpoint_state["saved"]:
+                return True
+
+            work_item = checkpoint_state["work_item"]
+            checkpoint_state["saved"] = True
+
+            return self._save_crawl_progress(
+                lambda: self._set_time_series_data_crawl_checkpoint(
+                    work_item.start_interval, work_item.end_interval, work_item.symbol
+                )
+            )
+
+        def checkpoint(work_item: DailyStockPriceWorkItem) -> DailyStockPriceWorkItem:
+            completed_work_items[work_item.sequence] = work_item
+
+            while checkpoint_state["next_sequence"] in completed_work_items:
+                checkpoint_state["work_item"] = completed_work_items.pop(
+                    checkpoint_state["next_sequence"]
+                )
+                checkpoint_state["next_sequence"] += 1
+                checkpoint_state["saved"] = False
+
+            # Coalesce checkpoint writes while more completions are queued
+            if pipeline.queue_depths["checkpoint"] == 0:
+                save_checkpoint()
+
+            return work_item
+
+        pipeline.add_stage("fetch", fetch, PIPELINE_FETCH_WORKERS, PIPELINE_QUEUE_SIZE)
+        pipeline.add_stage("parse", parse, PIPELINE_PARSE_WORKERS, PIPELINE_QUEUE_SIZE)
+        pipeline.add_stage("write", write, PIPELINE_WRITE_WORKERS, PIPELINE_QUEUE_SIZE)
+        pipeline.add_stage(
+            "checkpoint", checkpoint, 1, PIPELINE_QUEUE_SIZE, save_checkpoint
+        )
+        pipeline.start()
+
+        number_of_work_item = 0
+
+        while start_interval < datetime.now() and not pipeline.failed:
+            end_interval = start_interval + interval_planner.interval - timedelta(days=1)
+
+            print(
+                f"\nCrawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_info(
+                f"Crawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+
+            symbols = all_security_symbols
+            if checkpoint_symbol:
+                symbols = symbols[symbols.index(checkpoint_symbol) :]
+                checkpoint_symbol = None
+
+            for symbol in symbols:
+                if pipeline.failed:
+                    break
+
+                pipeline.put(
+                    DailyStockPriceWorkItem(
+                        sequence=number_of_work_item,
+                        symbol=symbol,
+                        start_interval=start_interval,
+                        end_interval=end_interval,
+                    )
+                )
+                number_of_work_item += 1
+
+            queue_depths = ", ".join(
+                f"{name}: {depth}" for name, depth in pipeline.queue_depths.items()
+            )
+            print(f"\nPipeline queue depths: {queue_depths}.")
+            self._logger.log_info(f"Pipeline queue depths: {queue_depths}.")
+
+            # The next interval is sized from every fetch of this one
+            pipeline.wait_until_processed("fetch", number_of_work_item)
+
+            start_interval = end_interval + timedelta(days=1)
+            interval_planner.next_interval()
+
+        return pipeline.close()
+
+    def _crawl_time_series_data_sharded(self) -> bool:
+        all_security_symbols = self.get_all_security_symbols()
+
+        print(
+            f"\nSharding {len(all_security_symbols)} securities across {self._credential_pool.size} credentials."
+        )
+        self._logger.log_info(
+            f"Sharding {len(all_security_symbols)} securities across {self._credential_pool.size} credentials."
+        )
+
+        successful = self._credential_pool.run(
+            all_security_symbols, self._crawl_security_history
+        )
+
+        print(
+            f"\nCredentials stole {self._credential_pool.number_of_stolen_item} securities from other shards."
+        )
+        self._logger.log_info(
+            f"Credentials stole {self._credential_pool.number_of_stolen_item} securities from other shards."
+        )
+
+        return successful
+
+    def _crawl_security_history(self, symbol: str) -> bool:
+        """Crawl one security from its watermark up to today."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        watermark = self._watermark_store.get(symbol)
+        start_interval = (
+            watermark + timedelta(days=1) if watermark else DEFAULT_CRAWL_DATA_START_DATE
+        )
+
+        interval_planner = self._create_interval_planner(
+            CRAWL_DATA_TIME_INTERVAL, MIN_CRAWL_DATA_TIME_INTERVAL
+        )
+
+        while start_interval <= today:
+            end_interval = min(
+                start_interval + interval_planner.interval - timedelta(days=1), today
+            )
+
+            if not self._crawl_daily_stock_price(
+                interval_planner, symbol, start_interval, end_interval
+            ):
+                return False
+
+            start_interval = end_interval + timedelta(days=1)
+            interval_planner.next_interval()
+
+        return self._watermark_store.flush()
+
+    def _crawl_time_series_data_market_wide(self) -> bool:
+        all_security_symbols = {
+            security.Symbol for security in self._retrieve_all_security_data()
+        }
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        for market in MARKET_WIDE_CRAWL_MARKETS:
+            start_interval = DEFAULT_CRAWL_DATA_START_DATE
+
+            market_crawl_checkpoint = self._get_market_crawl_checkpoint(market)
+            if market_crawl_checkpoint and market_crawl_checkpoint.LastCrawledDate:
+                start_interval = market_crawl_checkpoint.LastCrawledDate + timedelta(
+                    days=1
+                )
+
+            print(
+                f"\nCrawling market-wide data of {market.name} from {start_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_info(
+                f"Crawling market-wide data of {market.name} from {start_interval.strftime("%d/%m/%Y")}."
+            )
+
+            # A whole market trades several hundred securities a day, so the
+            # window starts at a single trading day and grows from there.
+            interval_planner = self._create_interval_planner(
+                timedelta(days=1), timedelta(days=1)
+            )
+
+            while start_interval <= today:
+                end_interval = min(
+                    start_interval + interval_planner.interval - timedelta(days=1),
+                    today,
+                )
+
+                session_interval = self._trading_calendar.align_interval(
+                    start_interval, end_interval
+                )
+
+                if session_interval:
+                    if not self._crawl_market_daily_stock_price(
+                        interval_planner,
+                        market,
+                        *session_interval,
+                        all_security_symbols,
+                    ):
+                        return False
+                else:
+                    self._number_of_non_session_call += 1
+
+                # Bars of today are not final yet, leave them to the next run
+                last_crawled_date = min(end_interval, today - timedelta(days=1))
+                if last_crawled_date >= start_interval:
+                    self._save_crawl_progress(
+                        lambda: self._set_market_crawl_checkpoint(
+                            market, last_crawled_date
+                        )
+                    )
+
+                start_interval = end_interval + timedelta(days=1)
+                interval_planner.next_interval()
+
+        return True
+
+    def _crawl_market_daily_stock_price(
+        self,
+        interval_planner: Optional[AdaptiveIntervalPlanner],
+        market: MarketCode,
+        start_interval: datetime,
+        end_interval: datetime,
+        all_security_symbols: Set[str],
+    ) -> bool:
+        print(
+            f"\nCrawling market-wide data of {market.name} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+        )
+        self._logger.log_info(
+            f"Crawling market-wide data of {market.name} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+        )
+
+        try:
+            point_batch = self._get_daily_stock_price_point_batch(
+                "", start_interval, end_interval, market=market.name
+            )
+
+        except (RuntimeError, ValueError, requests.RequestException) as e:
+            print(
+                f"\nCannot crawl market-wide daily stock price. Market: {market.name}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            self._logger.log_error(
+                f"Cannot crawl market-wide daily stock price. Market: {market.name}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            return False
+
+        if interval_planner:
+            interval_planner.observe(len(point_batch))
+
+        if LEARN_TRADING_HOLIDAYS:
+            self._learn_trading_holidays(
+                market, point_batch, start_interval, end_interval
+            )
+
+        # Fan the market-wide rows out to the securities being tracked
+        point_batch = point_batch.select(
+            np.isin(point_batch.tag_values, list(all_security_symbols))
+        )
+
+        if not len(point_batch):
+            print(
+                f"\nNo records of {market.name} were found in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Skip to next interval."
+            )
+            self._logger.log_info(
+                f"No records of {market.name} were found in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Skip to next interval."
+            )
+            return True
+
+        if not self._save_daily_stock_price(point_batch):
+            print(
+                f"\nCannot save market-wide daily stock price. Market: {market.name}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_error(
+                f"Cannot save market-wide daily stock price. Market: {market.name}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            return False
+
+        number_of_security = len(np.unique(point_batch.tag_values))
+        print(
+            f"\nSaved {len(point_batch)} records of {number_of_security} securities of {market.name} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+        )
+        self._logger.log_info(
+            f"Saved {len(point_batch)} records of {number_of_security} securities of {market.name} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+        )
+
+        return True
+
+    def _crawl_time_series_data_incrementally(self) -> bool:
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Securities of one market that share a watermark need the same delta,
+        # which a single market-wide query can serve.
+        delta_groups: Dict[Tuple[int, datetime], List[str]] = {}
+
+        for security in self._retrieve_all_security_data():
+            watermark = self._watermark_store.get(security.Symbol)
+            start_interval = (
+                watermark + timedelta(days=1)
+                if watermark
+                else DEFAULT_CRAWL_DATA_START_DATE
+            )
+
+            if start_interval > today:
+                continue
+
+            delta_groups.setdefault((security.Market_ID, start_interval), []).append(
+                security.Symbol
+            )
+
+        number_of_security = sum(len(symbols) for symbols in delta_groups.values())
+        print(
+            f"\n{number_of_security} securities have new data to crawl, grouped into {len(delta_groups)} deltas."
+        )
+        self._logger.log_info(
+            f"{number_of_security} securities have new data to crawl, grouped into {len(delta_groups)} deltas."
+        )
+
+        market_wide_market_ids = {market.value for market in MARKET_WIDE_CRAWL_MARKETS}
+
+        for (market_id, start_interval), symbols in delta_groups.items():
+            session_interval = self._trading_calendar.align_interval(
+                start_interval, today
+            )
+            if not session_interval:
+                self._number_of_non_session_call += 1
+                continue
+
+            start_interval, end_date = session_interval
+
+            if (
+                len(symbols) >= INCREMENTAL_MARKET_WIDE_THRESHOLD
+                and market_id in market_wide_market_ids
+                and today - start_interval < INCREMENTAL_MARKET_WIDE_MAX_DELTA
+            ):
+                if not self._crawl_market_daily_stock_price(
+                    None, MarketCode(market_id), start_interval, end_date, set(symbols)
+                ):
+                    return False
+
+                self._watermark_store.flush()
+                continue
+
+            for symbol in symbols:
+                if not self._crawl_daily_stock_price_delta(
+                    symbol, start_interval, end_date
+                ):
+                    return False
+
+                self._watermark_store.flush()
+
+        return True
+
+    def _crawl_daily_stock_price_delta(
+        self, symbol: str, start_interval: datetime, end_date: datetime
+    ) -> bool:
+        while start_interval <= end_date:
+            end_interval = min(
+                start_interval + MAX_CRAWL_DATA_TIME_INTERVAL - timedelta(days=1),
+                end_date,
+            )
+
+            if not self._crawl_daily_stock_price(
+                None, symbol, start_interval, end_interval
+            ):
+                return False
+
+            start_interval = end_interval + timedelta(days=1)
+
+        return True
+
+    def _plan_daily_stock_price_interval(
+        self, symbol: str, start_interval: datetime, end_interval: datetime
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Trim an interval to the listing lifetime, then to its first and last sessions."""
+        planned_interval = self._listing_lifetime_planner.plan(
+            symbol, start_interval, end_interval
+        )
+        if not planned_interval:
+            return None
+
+        session_interval = self._trading_calendar.align_interval(*planned_interval)
+        if not session_interval:
+            # Pipeline fetch workers plan intervals concurrently
+            with self._statistics_lock:
+                self._number_of_non_session_call += 1
+
+        return session_interval
+
+    def _build_daily_stock_price_input_model(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        market: str = None,
+        page_index: int = 1,
+    ) -> DailyStockPriceInputModel:
+        return DailyStockPriceInputModel(
+            symbol=symbol,
+            fromDate=start_interval,
+            toDate=end_interval,
+            market=market,
+            pageIndex=page_index,
+            pageSize=DAILY_STOCK_PRICE_PAGE_SIZE,
+        )
+
+    def _get_number_of_page(self, total_record: int, description: str) -> Optional[int]:
+        """Return None if the records do not fit in `MAX_PAGE_INDEX` pages."""
+        number_of_page = math.ceil(total_record / DAILY_STOCK_PRICE_PAGE_SIZE)
+
+        if number_of_page > MAX_PAGE_INDEX:
+            print(
+                f"\n{description} has {total_record} records, more than {MAX_PAGE_INDEX} pages. Split the interval in halves."
+            )
+            self._logger.log_warning(
+                f"{description} has {total_record} records, more than {MAX_PAGE_INDEX} pages. Split the interval in halves."
+            )
+            return None
+
+        return number_of_page
+
+    def _split_interval(
+        self, start_interval: datetime, end_interval: datetime, description: str
+    ) -> List[Tuple[datetime, datetime]]:
+        if start_interval >= end_interval:
+            print(
+                f"\n{description} cannot be split, its records of a single day do not fit in {MAX_PAGE_INDEX} pages."
+            )
+            self._logger.log_error(
+                f"{description} cannot be split, its records of a single day do not fit in {MAX_PAGE_INDEX} pages."
+            )
+            raise ValueError(f"{description} does not fit in {MAX_PAGE_INDEX} pages.")
+
+        middle_interval = start_interval + timedelta(
+            days=(end_interval - start_interval).days // 2
+        )
+
+        return [
+            (start_interval, middle_interval),
+            (middle_interval + timedelta(days=1), end_interval),
+        ]
+
+    def _check_response_status(self, response: Dict, description: str):
+        if response.get("status") == 200:
+            return
+
+        print(
+            f"\n{description} failed. Status: {response.get("status")}. Reason: {response.get("message")}"
+        )
+        self._logger.log_error(
+            f"{description} failed. Status: {response.get("status")}. Reason: {response.get("message")}"
+        )
+        raise RuntimeError(f"{description} failed with status {response.get("status")}.")
+
+    def _check_page_size(
+        self, number_of_row: int, total_record: int, page_index: int, description: str
+    ):
+        """Raise if page `page_index` holds fewer rows than its share of `total_record`."""
+        expected_number_of_row = min(
+            DAILY_STOCK_PRICE_PAGE_SIZE,
+            total_record - (page_index - 1) * DAILY_STOCK_PRICE_PAGE_SIZE,
+        )
+        if number_of_row >= expected_number_of_row:
+            return
+
+        print(
+            f"\n{description} page {page_index} is truncated. Rows: {number_of_row}. Expected: {expected_number_of_row}."
+        )
+        self._logger.log_error(
+            f"{description} page {page_index} is truncated. Rows: {number_of_row}. Expected: {expected_number_of_row}."
+        )
+        raise RuntimeError(f"{description} page {page_index} is truncated.")
+
+    def _get_all_daily_stock_price_pages(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        market: str = None,
+    ) -> List[Dict]:
+        """Read `totalRecord` from the first page, then fetch every remaining page."""
+        description = f"DailyStockPrice of {symbol or market} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}"
+
+        response = self._get_daily_stock_price(
+            self._build_daily_stock_price_input_model(
+                symbol, start_interval, end_interval, market
+            )
+        )
+        self._check_response_status(response, description)
+        daily_stock_price_output_model = DailyStockPriceOutputModel(**response)
+
+        if daily_stock_price_output_model.totalRecord == 0:
+            return []
+
+        data = list(daily_stock_price_output_model.data)
+
+        number_of_page = self._get_number_of_page(
+            daily_stock_price_output_model.totalRecord, description
+        )
+
+        # Request every half again rather than drop the records past the last page
+        if number_of_page is None:
+            return [
+                row
+                for half_interval in self._split_interval(
+                    start_interval, end_interval, description
+                )
+                for row in self._get_all_daily_stock_price_pages(
+                    symbol, *half_interval, market
+                )
+            ]
+
+        self._check_page_size(
+            len(data), daily_stock_price_output_model.totalRecord, 1, description
+        )
+
+        for page_index in range(2, number_of_page + 1):
+            response = self._get_daily_stock_price(
+                self._build_daily_stock_price_input_model(
+                    symbol, start_interval, end_interval, market, page_index
+                )
+            )
+            self._check_response_status(response, description)
+            page_data = DailyStockPriceOutputModel(**response).data
+
+            self._check_page_size(
+                len(page_data),
+                daily_stock_price_output_model.totalRecord,
+                page_index,
+                description,
+            )
+            data.extend(page_data)
+
+        return data
+
+    def _get_daily_stock_price_point_batch(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        market: str = None,
+    ) -> PointBatch:
+        if ENABLE_STREAMING_DECODE:
+            return self._stream_daily_stock_price_point_batch(
+                symbol, start_interval, end_interval, market
+            )
+
+        return self._converters["daily_stock_price"].convert(
+            self._get_all_daily_stock_price_pages(
+                symbol, start_interval, end_interval, market
+            )
+        )
+
+    def _stream_daily_stock_price_point_batch(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        market: str = None,
+    ) -> PointBatch:
+        return self._converters["daily_stock_price"].convert_iter(
+            self._stream_all_daily_stock_price_pages(
+                symbol, start_interval, end_interval, market
+            ),
+            STREAMING_BATCH_SIZE,
+        )
+
+    def _stream_all_daily_stock_price_pages(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        market: str = None,
+    ) -> Iterator[Dict]:
+        """Like `_get_all_daily_stock_price_pages`, but yield rows as they are decoded."""
+        description = f"DailyStockPrice of {symbol or market} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}"
+
+        header, rows = self._stream_daily_stock_price(
+            self._build_daily_stock_price_input_model(
+                symbol, start_interval, end_interval, market
+            )
+        )
+
+        # Members after the rows are only known once the rows are consumed, and
+        # no row may be yielded before the interval is known not to be split
+        if "status" not in header or "totalRecord" not in header:
+            rows = list(rows)
+
+        self._check_response_status(header, description)
+
+        if not header.get("totalRecord"):
+            yield from rows
+            return
+
+        number_of_page = self._get_number_of_page(header["totalRecord"], description)
+
+        if number_of_page is None:
+            if hasattr(rows, "close"):
+                rows.close()
+
+            for half_interval in self._split_interval(
+                start_interval, end_interval, description
+            ):
+                yield from self._stream_all_daily_stock_price_pages(
+                    symbol, *half_interval, market
+                )
+            return
+
+        total_record = header["totalRecord"]
+
+        for page_index in range(1, number_of_page + 1):
+            if page_index > 1:
+                header, rows = self._stream_daily_stock_price(
+                    self._build_daily_stock_price_input_model(
+                        symbol, start_interval, end_interval, market, page_index
+                    )
+                )
+
+            number_of_row = 0
+            for row in rows:
+                number_of_row += 1
+                yield row
+
+            # A failed page has no rows, its status is complete once they are read
+            self._check_response_status(header, description)
+            self._check_page_size(number_of_row, total_record, page_index, description)
+
+    async def _get_all_daily_stock_price_pages_async(
+        self,
+        semaphore: asyncio.Semaphore,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+    ) -> List[Dict]:
+        description = f"DailyStockPrice of {symbol} in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}"
+
+        async def get_page(
+            page_index: int, total_record: int = None
+        ) -> DailyStockPriceOutputModel:
+            async with semaphore:
+                response = await self._get_daily_stock_price_async(
+                    self._build_daily_stock_price_input_model(
+                        symbol, start_interval, end_interval, page_index=page_index
+                    )
+                )
+                self._check_response_status(response, description)
+                output_model = DailyStockPriceOutputModel(**response)
+
+                if total_record is not None:
+                    self._check_page_size(
+                        len(output_model.data), total_record, page_index, description
+                    )
+                return output_model
+
+        daily_stock_price_output_model = await get_page(1)
+
+        if daily_stock_price_output_model.totalRecord == 0:
+            return []
+
+        data = list(daily_stock_price_output_model.data)
+
+        number_of_page = self._get_number_of_page(
+            daily_stock_price_output_model.totalRecord, description
+        )
+
+        if number_of_page is None:
+            return [
+                row
+                for half_data in await asyncio.gather(
+                    *(
+                        self._get_all_daily_stock_price_pages_async(
+                            semaphore, symbol, *half_interval
+                        )
+                        for half_interval in self._split_interval(
+                            start_interval, end_interval, description
+                        )
+                    )
+                )
+                for row in half_data
+            ]
+
+        total_record = daily_stock_price_output_model.totalRecord
+        self._check_page_size(len(data), total_record, 1, description)
+
+        # The remaining pages are independent, request them concurrently
+        for output_model in await asyncio.gather(
+            *(
+                get_page(page_index, total_record)
+                for page_index in range(2, number_of_page + 1)
+            )
+        ):
+            data.extend(output_model.data)
+
+        return data
+
+    def _crawl_daily_stock_price(
+        self,
+        interval_planner: Optional[AdaptiveIntervalPlanner],
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+    ) -> bool:
+        planned_interval = self._plan_daily_stock_price_interval(
+            symbol, start_interval, end_interval
+        )
+        if not planned_interval:
+            return True
+
+        start_interval, end_interval = planned_interval
+
+        print(f"\nCrawling data for security: {symbol}")
+        self._logger.log_info(f"Crawling data for security: {symbol}")
+
+        try:
+            point_batch = self._get_daily_stock_price_point_batch(
+                symbol, start_interval, end_interval
+            )
+
+        except (RuntimeError, ValueError, requests.RequestException) as e:
+            print(
+                f"\nCannot crawl daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            self._logger.log_error(
+                f"Cannot crawl daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            return False
+
+        if interval_planner:
+            interval_planner.observe(len(point_batch))
+
+        return self._process_daily_stock_price_data(
+            symbol, start_interval, end_interval, point_batch
+        )
+
+    async def _crawl_daily_stock_price_async(
+        self,
+        semaphore: asyncio.Semaphore,
+        interval_planner: AdaptiveIntervalPlanner,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+    ) -> bool:
+        planned_interval = self._plan_daily_stock_price_interval(
+            symbol, start_interval, end_interval
+        )
+        if not planned_interval:
+            return True
+
+        start_interval, end_interval = planned_interval
+
+        print(f"\nCrawling data for security: {symbol}")
+        self._logger.log_info(f"Crawling data for security: {symbol}")
+
+        try:
+            data = await self._get_all_daily_stock_price_pages_async(
+                semaphore, symbol, start_interval, end_interval
+            )
+
+        except (RuntimeError, ValueError, requests.RequestException) as e:
+            print(
+                f"\nCannot crawl daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            self._logger.log_error(
+                f"Cannot crawl daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}. Error: {e}"
+            )
+            return False
+
+        interval_planner.observe(len(data))
+
+        # Parse and write in a worker thread so that the event loop can keep
+        # sending requests.
+        return await asyncio.to_thread(
+            self._process_daily_stock_price_data,
+            symbol,
+            start_interval,
+            end_interval,
+            data,
+        )
+
+    def _process_daily_stock_price_data(
+        self,
+        symbol: str,
+        start_interval: datetime,
+        end_interval: datetime,
+        data: List[Dict] | PointBatch,
+    ) -> bool:
+        # Process if no records were found
+        if not len(data):
+            print(
+                f"\nSuccessfully crawl daily stock price data of {symbol} from {start_interval.strftime("%d/%m/%Y")} to {end_interval.strftime("%d/%m/%Y")} but no records were found. Skip to next stock."
+            )
+            self._logger.log_info(
+                f"Successfully crawl daily stock price data of {symbol} from {start_interval.strftime("%d/%m/%Y")} to {end_interval.strftime("%d/%m/%Y")} but no records were found. Skip to next stock."
+            )
+            return True
+
+        point_batch = (
+            data
+            if isinstance(data, PointBatch)
+            else self._converters["daily_stock_price"].convert(data)
+        )
+
+        if not self._save_daily_stock_price(point_batch):
+            print(
+                f"\nCannot save daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_error(
+                f"Cannot save daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            return False
+
+        return True
+
+    def _load_listing_lifetimes(self) -> bool:
+        print("\nLoading listing lifetimes of all securities.")
+        self._logger.log_info("Loading listing lifetimes of all securities.")
+
+        try:
+            page_index = 1
+            number_of_page = 1
+
+            while page_index <= number_of_page:
+                response = self._get_securities_details(
+                    SecuritiesDetailsInputModel(
+                        pageIndex=page_index, pageSize=SECURITIES_DETAILS_PAGE_SIZE
+                    )
+                )
+                securities_details_output_model = SecuritiesDetailsOutputModel(
+                    **response
+                )
+
+                if securities_details_output_model.totalRecord == 0:
+                    break
+
+                for securities_details_data_model in securities_details_output_model.data:
+                    for repeated_info in securities_details_data_model["RepeatedInfo"]:
+                        self._listing_lifetime_planner.set_lifetime(
+                            repeated_info["Symbol"],
+                            self._parse_api_date(repeated_info["FirstTradingDate"]),
+                            self._parse_api_date(repeated_info["LastTradingDate"]),
+                        )
+
+                if page_index == 1:
+                    number_of_page = min(
+                        math.ceil(
+                            securities_details_output_model.totalRecord
+                            / SECURITIES_DETAILS_PAGE_SIZE
+                        ),
+                        MAX_PAGE_INDEX,
+                    )
+
+                page_index += 1
+
+        except Exception as e:
+            print(
+                f"\nCannot load listing lifetimes, every interval will be requested. Error: {e}"
+            )
+            self._logger.log_warning(
+                f"Cannot load listing lifetimes, every interval will be requested. Error: {e}"
+            )
+            return False
+
+        print(
+            f"\nLoaded listing lifetimes of {self._listing_lifetime_planner.number_of_security} securities."
+        )
+        self._logger.log_info(
+            f"Loaded listing lifetimes of {self._listing_lifetime_planner.number_of_security} securities."
+        )
+
+        return True
+
+    def _learn_trading_holidays(
+        self,
+        market: MarketCode,
+        point_batch: PointBatch,
+        start_interval: datetime,
+        end_interval: datetime,
+    ):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Only a complete market-wide response of finished days tells which
+        # weekdays had no session.
+        end_interval = min(end_interval, today - timedelta(days=1))
+        if not len(point_batch) or start_interval > end_interval:
+            return
+
+        observed_sessions = set(
+            np.unique(point_batch.times).astype("datetime64[us]").tolist()
+        )
+
+        number_of_change = self._trading_calendar.learn_from_sessions(
+            observed_sessions,
+            start_interval,
+            end_interval,
+            market.name,
+            {market.name for market in MARKET_WIDE_CRAWL_MARKETS},
+        )
+
+        if number_of_change:
+            print(
+                f"\nLearned {number_of_change} trading calendar changes in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+            self._logger.log_info(
+                f"Learned {number_of_change} trading calendar changes in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            )
+
+    @staticmethod
+    def _parse_api_date(value: str) -> Optional[datetime]:
+        if not value:
+            return None
+
+        for date_format in ("%d/%m/%Y", "%d/%m/%Y %H:%M:%S"):
+            try:
+                return datetime.strptime(value, date_format)
+            except ValueError:
+                continue
+
+        return None
+
+    # Wrapper
+    def _get_current_credential(
+        self,
+    ) -> Tuple[SsiCrawlerInfoConfig, MarketDataClient, AimdRateController]:
+        """Credential of the calling shard worker, or the primary one."""
+        credential = self._credential_pool.current if self._credential_pool else None
+
+        if credential:
+            return credential.config, credential.client, credential.rate_controller
+
+        return self._config, self._client, self._rate_controller
+
+    def _create_rate_controller(self) -> AimdRateController:
+        return AimdRateController(
+            initial_rate=self._initial_api_rate,
+            min_rate=min(API_MIN_RATE_LIMIT_PER_SECOND, self._initial_api_rate),
+            max_rate=self._max_api_rate,
+            additive_increase=API_RATE_ADDITIVE_INCREASE,
+            multiplicative_decrease=API_RATE_MULTIPLICATIVE_DECREASE,
+            capacity=API_RATE_LIMIT_BURST,
+        )
+
+    def _call_api(self, endpoint: str, input_model, immutable: bool = False) -> Dict:
+        """Call `endpoint` through the response cache and rate controller, retrying."""
+        if self._response_cache:
+            response = self._response_cache.get(endpoint, input_model)
+            if response is not None:
+                return response
+
+        config, client, rate_controller = self._get_current_credential()
+
+        for attempt in range(MAX_API_RETRY + 1):
+            send_time = rate_controller.acquire(endpoint)
+
+            try:
+                response = getattr(client, endpoint)(config, input_model)
+
+            # Overloaded gateways answer with errors or HTML instead of JSON
+            except (requests.RequestException, ValueError) as e:
+                if attempt == MAX_API_RETRY:
+                    raise
+
+                self._back_off(rate_controller, endpoint, send_time, str(e))
+                continue
+
+            if not self._is_throttled(response) or attempt == MAX_API_RETRY:
+                break
+
+            self._back_off(rate_controller, endpoint, send_time, response["message"])
+
+        return self._finish_api_call(
+            rate_controller, endpoint, send_time, input_model, response, immutable
+        )
+
+    async def _call_api_async(
+        self, endpoint: str, input_model, immutable: bool = False
+    ) -> Dict:
+        if self._response_cache:
+            response = self._response_cache.get(endpoint, input_model)
+            if response is not None:
+                return response
+
+        config, client, rate_controller = self._get_current_credential()
+
+        for attempt in range(MAX_API_RETRY + 1):
+            send_time = await rate_controller.acquire_async(endpoint)
+
+            try:
+                response = await asyncio.to_thread(
+                    getattr(client, endpoint), config, input_model
+                )
+
+            except (requests.RequestException, ValueError) as e:
+                if attempt == MAX_API_RETRY:
+                    raise
+
+                self._back_off(rate_controller, endpoint, send_time, str(e))
+                continue
+
+            if not self._is_throttled(response) or attempt == MAX_API_RETRY:
+                break
+
+            self._back_off(rate_controller, endpoint, send_time, response["message"])
+
+        return self._finish_api_call(
+            rate_controller, endpoint, send_time, input_model, response, immutable
+        )
+
+    def _call_api_stream(
+        self, endpoint: str, input_model, immutable: bool = False
+    ) -> Tuple[Dict, Iterator[Dict]]:
+        """Like `_call_api`, but return the header and an iterator of the rows."""
+        if self._response_cache:
+            response = self._response_cache.get(endpoint, input_model)
+            if response is not None:
+                header = {key: value for key, value in response.items() if key != "data"}
+                return header, iter(response.get("data") or [])
+
+        config, client, rate_controller = self._get_current_credential()
+
+        for attempt in range(MAX_API_RETRY + 1):
+            send_time = rate_controller.acquire(endpoint)
+
+            try:
+                response = getattr(client, f"{endpoint}_stream")(config, input_model)
+                header = response.read_header()
 
-        all_securities = self._retrieve_all_security_data()
+            except (requests.RequestException, ValueError) as e:
+                if attempt == MAX_API_RETRY:
+                    raise
 
-        all_security_symbols = [security.Symbol for security in all_securities]
+                self._back_off(rate_controller, endpoint, send_time, str(e))
+                continue
 
-        start_interval = DEFAULT_CRAWL_DATA_START_DATE
-        checkpoint_symbol = None
-        found_checkpoint_symbol = False
+            if not self._is_throttled(header):
+                break
 
-        crawl_checkpoint = self._get_time_series_data_crawl_checkpoint()
+            response.close()
 
-        if (
-            crawl_checkpoint
-            and crawl_checkpoint.CurrentStartInterval
-            and crawl_checkpoint.CurrentSymbol in all_security_symbols
-        ):
-            start_interval = crawl_checkpoint.CurrentStartInterval
-            checkpoint_symbol = crawl_checkpoint.CurrentSymbol
+            if attempt == MAX_API_RETRY:
+                self._finish_api_call(
+                    rate_controller, endpoint, send_time, input_model, header, immutable
+                )
 
-        while start_interval < datetime.now():
-            end_interval = start_interval + CRAWL_DATA_TIME_INTERVAL - timedelta(days=1)
+            self._back_off(rate_controller, endpoint, send_time, header["message"])
+
+        rate_controller.on_success(endpoint, send_time)
+
+        if self._response_cache:
+            return header, self._cache_streamed_rows(
+                endpoint, input_model, header, response.rows(), immutable
+            )
+
+        return header, response.rows()
+
+    def _cache_streamed_rows(
+        self,
+        endpoint: str,
+        input_model,
+        header: Dict,
+        rows: Iterator[Dict],
+        immutable: bool,
+    ) -> Iterator[Dict]:
+        """Pass the rows through, then cache the whole response once they are read."""
+        data = []
+
+        for row in rows:
+            data.append(row)
+            yield row
+
+        self._response_cache.put(
+            endpoint, input_model, {**header, "data": data}, immutable
+        )
 
+    @staticmethod
+    def _is_throttled(response: Dict) -> bool:
+        return response.get("status") in API_THROTTLED_STATUSES
+
+    def _back_off(
+        self,
+        rate_controller: AimdRateController,
+        endpoint: str,
+        send_time: float,
+        reason: str,
+    ):
+        if rate_controller.on_throttle(endpoint, send_time):
             print(
-                f"\nCrawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+                f"\nAPI {endpoint} is throttled, lower the rate to {rate_controller.rate:.2f} calls/s. Reason: {reason}"
             )
-            self._logger.log_info(
-                f"Crawling data in interval {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
+            self._logger.log_warning(
+                f"API {endpoint} is throttled, lower the rate to {rate_controller.rate:.2f} calls/s. Reason: {reason}"
             )
 
-            for symbol in all_security_symbols:
-                if (
-                    checkpoint_symbol
-                    and symbol != checkpoint_symbol
-                    and not found_checkpoint_symbol
-                ):
-                    continue
-
-                found_checkpoint_symbol = True
+    def _finish_api_call(
+        self,
+        rate_controller: AimdRateController,
+        endpoint: str,
+        send_time: float,
+        input_model,
+        response: Dict,
+        immutable: bool,
+    ) -> Dict:
+        if self._is_throttled(response):
+            rate_controller.on_throttle(endpoint, send_time)
 
-                print(f"\nCrawling data for security: {symbol}")
-                self._logger.log_info(f"Crawling data for security: {symbol}")
+            print(
+                f"\nAPI {endpoint} is still throttled after {MAX_API_RETRY} retries. Reason: {response["message"]}"
+            )
+            self._logger.log_error(
+                f"API {endpoint} is still throttled after {MAX_API_RETRY} retries. Reason: {response["message"]}"
+            )
 
-                daily_stock_price_input_model = DailyStockPriceInputModel(
-                    symbol=symbol,
-                    fromDate=start_interval,
-                    toDate=end_interval,
-                    market=None,
-                    pageIndex=1,
-                    pageSize=50,
-                )
+            # Treating the response as empty would move checkpoints past rows
+            # that were never read
+            raise RuntimeError(
+                f"API {endpoint} is still throttled after {MAX_API_RETRY} retries."
+            )
 
-                response = self._get_daily_stock_price(daily_stock_price_input_model)
-                daily_stock_price_output_model = DailyStockPriceOutputModel(**response)
+        rate_controller.on_success(endpoint, send_time)
 
-                # Process if no records were found
-                if daily_stock_price_output_model.totalRecord == 0:
-                    print(
-                        f"\nSuccessfully crawl daily stock price data from {start_interval.strftime("%d/%m/%Y")} to {end_interval.strftime("%d/%m/%Y")} but no records were found. Skip to next stock."
-                    )
-                    self._logger.log_info(
-                        f"Successfully crawl daily stock price data from {start_interval.strftime("%d/%m/%Y")} to {end_interval.strftime("%d/%m/%Y")} but no records were found. Skip to next stock."
-                    )
+        if self._response_cache:
+            self._response_cache.put(endpoint, input_model, response, immutable)
 
-                    self._set_time_series_data_crawl_checkpoint(start_interval, symbol)
-                    continue
+        return response
 
-                daily_stock_price_data_model_list = [
-                    DailyStockPriceDataModel(
-                        symbol=daily_stock_price_data_model["Symbol"],
-                        tradingDate=datetime.strptime(
-                            daily_stock_price_data_model["TradingDate"], "%d/%m/%Y"
-                        ),
-                        time=daily_stock_price_data_model[
-                            "Time"
-                        ],  # Assuming `Time` is None
-                        priceChange=int(
-                            float(daily_stock_price_data_model["PriceChange"])
-                        ),
-                        perPriceChange=float(
-                            daily_stock_price_data_model["PerPriceChange"]
-                        ),
-                        ceilingPrice=int(
-                            float(daily_stock_price_data_model["CeilingPrice"])
-                        ),
-                        floorPrice=int(
-                            float(daily_stock_price_data_model["FloorPrice"])
-                        ),
-                        refPrice=int(float(daily_stock_price_data_model["RefPrice"])),
-                        openPrice=int(float(daily_stock_price_data_model["OpenPrice"])),
-                        highestPrice=int(
-                            float(daily_stock_price_data_model["HighestPrice"])
-                        ),
-                        lowestPrice=int(
-                            float(daily_stock_price_data_model["LowestPrice"])
-                        ),
-                        closePrice=int(
-                            float(daily_stock_price_data_model["ClosePrice"])
-                        ),
-                        averagePrice=int(
-                            float(daily_stock_price_data_model["AveragePrice"])
-                        ),
-                        closePriceAdjusted=int(
-                            float(daily_stock_price_data_model["ClosePriceAdjusted"])
-                        ),
-                        totalMatchVol=int(
-                            float(daily_stock_price_data_model["TotalMatchVol"])
-                        ),
-                        totalMatchVal=int(
-                            float(daily_stock_price_data_model["TotalMatchVal"])
-                        ),
-                        totalDealVal=int(
-                            float(daily_stock_price_data_model["TotalDealVal"])
-                        ),
-                        totalDealVol=int(
-                            float(daily_stock_price_data_model["TotalDealVol"])
-                        ),
-                        foreignBuyVolTotal=int(
-                            float(daily_stock_price_data_model["ForeignBuyVolTotal"])
-                        ),
-                        foreignCurrentRoom=int(
-                            float(daily_stock_price_data_model["ForeignCurrentRoom"])
-                        ),
-                        foreignSellVolTotal=int(
-                            float(daily_stock_price_data_model["ForeignSellVolTotal"])
-                        ),
-                        foreignBuyValTotal=int(
-                            float(daily_stock_price_data_model["ForeignBuyValTotal"])
-                        ),
-                        foreignSellValTotal=int(
-                            float(daily_stock_price_data_model["ForeignSellValTotal"])
-                        ),
-                        totalBuyTrade=int(
-                            float(daily_stock_price_data_model["TotalBuyTrade"])
-                        ),
-                        totalBuyTradeVol=int(
-                            float(daily_stock_price_data_model["TotalBuyTradeVol"])
-                        ),
-                        totalSellTrade=int(
-                            float(daily_stock_price_data_model["TotalSellTrade"])
-                        ),
-                        totalSellTradeVol=int(
-                            float(daily_stock_price_data_model["TotalSellTradeVol"])
-                        ),
-                        netBuySellVol=int(
-                            float(daily_stock_price_data_model["NetBuySellVol"])
-                        ),
-                        netBuySellVal=int(
-                            float(daily_stock_price_data_model["NetBuySellVal"])
-                        ),
-                        totalTradedVol=int(
-                            float(daily_stock_price_data_model["TotalTradedVol"])
-                        ),
-                        totalTradedValue=int(
-                            float(daily_stock_price_data_model["TotalTradedValue"])
-                        ),
-                    )
-                    for daily_stock_price_data_model in daily_stock_price_output_model.data
-                ]
+    def _is_closed_interval(self, end_date: str) -> bool:
+        """Whether bars up to `end_date` are settled and can no longer change."""
+        end_interval = self._parse_api_date(end_date)
 
-                if not self._save_daily_stock_price(daily_stock_price_data_model_list):
-                    print(
-                        f"\nCannot save daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
-                    )
-                    self._logger.log_error(
-                        f"Cannot save daily stock price. Stock: {symbol}. Interval: {start_interval.strftime("%d/%m/%Y")} - {end_interval.strftime("%d/%m/%Y")}."
-                    )
-                    return False
+        return (
+            end_interval is not None
+            and end_interval < datetime.now() - RESPONSE_CACHE_SETTLEMENT_DELAY
+        )
 
-                self._set_time_series_data_crawl_checkpoint(start_interval, symbol)
+    def _report_response_cache(self):
+        if not self._response_cache:
+            return
 
-            start_interval += CRAWL_DATA_TIME_INTERVAL
+        print(
+            f"\nResponse cache served {self._response_cache.number_of_hit} calls, {self._response_cache.number_of_miss} calls went to the API."
+        )
+        self._logger.log_info(
+            f"Response cache served {self._response_cache.number_of_hit} calls, {self._response_cache.number_of_miss} calls went to the API."
+        )
 
-        return True
+    def _flush_fingerprint_index(self) -> bool:
+        if not self._fingerprint_index:
+            return True
 
-    # endregion
+        return self._fingerprint_index.flush()
 
-    # region Private methods
+    def _report_change_detection(self):
+        if not self._fingerprint_index:
+            return
 
-    def _is_initialized(self) -> bool:
-        return (
-            self._config
-            and self._client
-            and isinstance(self._config, SsiCrawlerInfoConfig)
-            and isinstance(self._client, MarketDataClient)
+        print(
+            f"\nChange detection skipped {self._fingerprint_index.number_of_skipped_point} of {self._fingerprint_index.number_of_checked_point} unchanged points."
+        )
+        self._logger.log_info(
+            f"Change detection skipped {self._fingerprint_index.number_of_skipped_point} of {self._fingerprint_index.number_of_checked_point} unchanged points."
         )
 
-    # Wrapper
+    def _report_api_rates(self):
+        if not self._credential_pool:
+            return
+
+        for credential in self._credential_pool.credentials:
+            for endpoint, statistics in credential.rate_controller.statistics.items():
+                print(
+                    f"\nCredential {credential.index} called {endpoint} {statistics.number_of_call} times at {statistics.effective_rate:.2f} calls/s, {statistics.number_of_throttled_call} calls were throttled. Current rate: {credential.rate_controller.rate:.2f} calls/s."
+                )
+                self._logger.log_info(
+                    f"Credential {credential.index} called {endpoint} {statistics.number_of_call} times at {statistics.effective_rate:.2f} calls/s, {statistics.number_of_throttled_call} calls were throttled. Current rate: {credential.rate_controller.rate:.2f} calls/s."
+                )
+
     def _get_securities(self, securities_input_model: SecuritiesInputModel):
-        result = self._client.securities(self._config, securities_input_model)
-        time.sleep(COOL_DOWN_BETWEEN_API_CALL)
-        return result
+        return self._call_api("securities", securities_input_model)
+
+    def _get_securities_details(
+        self, securities_details_input_model: SecuritiesDetailsInputModel
+    ):
+        return self._call_api("securities_details", securities_details_input_model)
 
     def _get_daily_stock_price(
         self, daily_stock_price_input_model: DailyStockPriceInputModel
     ):
-        result = self._client.daily_stock_price(
-            self._config, daily_stock_price_input_model
+        return self._call_api(
+            "daily_stock_price",
+            daily_stock_price_input_model,
+            self._is_closed_interval(daily_stock_price_input_model.toDate),
+        )
+
+    def _stream_daily_stock_price(
+        self, daily_stock_price_input_model: DailyStockPriceInputModel
+    ) -> Tuple[Dict, Iterator[Dict]]:
+        return self._call_api_stream(
+            "daily_stock_price",
+            daily_stock_price_input_model,
+            self._is_closed_interval(daily_stock_price_input_model.toDate),
+        )
+
+    async def _get_daily_stock_price_async(
+        self, daily_stock_price_input_model: DailyStockPriceInputModel
+    ):
+        return await self._call_api_async(
+            "daily_stock_price",
+            daily_stock_price_input_model,
+            self._is_closed_interval(daily_stock_price_input_model.toDate),
         )
-        time.sleep(COOL_DOWN_BETWEEN_API_CALL)
-        return result
 
     def _retrieve_all_market_data(self):
         return self._relational_database_driver.select(
@@ -790,43 +2456,32 @@ class SsiDataCrawler(Helper):
             ]
 
             # Insert data to temp security table
-            security_record_list = [
-                Record(
-                    [
-                        DataModel(
-                            columnName="Symbol",
-                            dataType=DataType.NVARCHAR,
-                            value=security.symbol,
-                        ),
-                        DataModel(
-                            columnName="Name",
-                            dataType=DataType.NVARCHAR,
-                            value=security.stockName,
-                        ),
-                        DataModel(
-                            columnName="EnName",
-                            dataType=DataType.NVARCHAR,
-                            value=security.stockEnName,
-                        ),
-                        DataModel(
-                            columnName="Market_ID",
-                            dataType=DataType.INT,
-                            value=security.market,
-                        ),
-                        DataModel(
-                            columnName="CreateDate",
-                            dataType=DataType.DATETIME,
-                            value=self.get_current_timestamp(),
-                        ),
-                    ]
-                )
-                for security in securities_data_model
-            ]
+            create_date = self.get_current_timestamp()
+            security_record_batch = RecordBatch(
+                columnNameList=["Symbol", "Name", "EnName", "Market_ID", "CreateDate"],
+                dataTypeList=[
+                    DataType.NVARCHAR,
+                    DataType.NVARCHAR,
+                    DataType.NVARCHAR,
+                    DataType.INT,
+                    DataType.DATETIME,
+                ],
+                valueList=[
+                    (
+                        security.symbol,
+                        security.stockName,
+                        security.stockEnName,
+                        security.market,
+                        create_date,
+                    )
+                    for security in securities_data_model
+                ],
+            )
 
-            self._relational_database_driver.insert(
+            self._relational_database_driver.bulk_insert(
                 database_name=RELATIONAL_DATABASE_NAME,
                 table_name="TempSecurity",
-                records=security_record_list,
+                records=security_record_batch,
             )
 
         # Merge temp security table to security table
@@ -883,78 +2538,105 @@ class SsiDataCrawler(Helper):
             dataType=DataType.RAW,
         )
 
-        security_list = self._relational_database_driver.select(
+        securities = self._relational_database_driver.select_iter(
             database_name=RELATIONAL_DATABASE_NAME,
             table_name="Security",
             condition_list=not_delisted_condition,
+            row_type=Security,
         )
 
-        return [
-            Security(**dict(zip(Security.get_key_list(), row))) for row in security_list
-        ]
+        if securities is None:
+            return []
 
-    def _save_daily_stock_price(
-        self, daily_stock_price_data_model_list: List[DailyStockPriceDataModel]
-    ) -> bool:
-        if not daily_stock_price_data_model_list:
-            print('\nInvalid "daily_stock_price_data_model_list". Cannot save data.')
-            self._logger.log_error(
-                'Invalid "daily_stock_price_data_model_list". Cannot save data.'
-            )
+        return list(securities)
+
+    def _save_daily_stock_price(self, point_batch: PointBatch) -> bool:
+        if not len(point_batch):
+            print('\nInvalid "point_batch". Cannot save data.')
+            self._logger.log_error('Invalid "point_batch". Cannot save data.')
             return False
 
-        point_component_list = [
-            PointComponent(
-                measurement=MEASUREMENT_NAME,
-                tags={"symbol": daily_stock_price_data_model.symbol},
-                fields={
-                    "price_change": daily_stock_price_data_model.priceChange,
-                    "per_price_change": daily_stock_price_data_model.perPriceChange,
-                    "ceiling_price": daily_stock_price_data_model.ceilingPrice,
-                    "floor_price": daily_stock_price_data_model.floorPrice,
-                    "ref_price": daily_stock_price_data_model.refPrice,
-                    "open_price": daily_stock_price_data_model.openPrice,
-                    "highest_price": daily_stock_price_data_model.highestPrice,
-                    "lowest_price": daily_stock_price_data_model.lowestPrice,
-                    "close_price": daily_stock_price_data_model.closePrice,
-                    "average_price": daily_stock_price_data_model.averagePrice,
-                    "close_price_adjusted": daily_stock_price_data_model.closePriceAdjusted,
-                    "total_match_vol": daily_stock_price_data_model.totalMatchVol,
-                    "total_match_val": daily_stock_price_data_model.totalMatchVal,
-                    "total_deal_val": daily_stock_price_data_model.totalDealVal,
-                    "total_deal_vol": daily_stock_price_data_model.totalDealVol,
-                    "foreign_buy_vol_total": daily_stock_price_data_model.foreignBuyVolTotal,
-                    "foreign_current_room": daily_stock_price_data_model.foreignCurrentRoom,
-                    "foreign_sell_vol_total": daily_stock_price_data_model.foreignSellVolTotal,
-                    "foreign_buy_val_total": daily_stock_price_data_model.foreignBuyValTotal,
-                    "foreign_sell_val_total": daily_stock_price_data_model.foreignSellValTotal,
-                    "total_buy_trade": daily_stock_price_data_model.totalBuyTrade,
-                    "total_buy_trade_vol": daily_stock_price_data_model.totalBuyTradeVol,
-                    "total_sell_trade": daily_stock_price_data_model.totalSellTrade,
-                    "total_sell_trade_vol": daily_stock_price_data_model.totalSellTradeVol,
-                    "net_buy_sell_vol": daily_stock_price_data_model.netBuySellVol,
-                    "net_buy_sell_val": daily_stock_price_data_model.netBuySellVal,
-                    "total_traded_vol": daily_stock_price_data_model.totalTradedVol,
-                    "total_traded_value": daily_stock_price_data_model.totalTradedValue,
-                },
-                time=daily_stock_price_data_model.tradingDate,
-            )
-            for daily_stock_price_data_model in daily_stock_price_data_model_list
-        ]
+        # Points that were written before with the same values are skipped
+        changed_point_batch = point_batch
+        if self._fingerprint_index:
+            changed, fingerprints = self._fingerprint_index.find_changed(point_batch)
+            changed_point_batch = point_batch.select(changed)
+
+        if len(changed_point_batch):
+            write_component = WriteComponent(
+                bucket=BUCKET_NAME, point_component_list=changed_point_batch
+            )
+
+            if not self._time_series_database_driver.write(write_component):
+                print(f"\nCannot write points to bucket {BUCKET_NAME}.")
+                self._logger.log_error(f"Cannot write points to bucket {BUCKET_NAME}.")
+                return False
+
+            if self._fingerprint_index:
+                self._fingerprint_index.add(changed_point_batch, fingerprints[changed])
+
+        with self._statistics_lock:
+            self._number_of_saved_point += len(changed_point_batch)
+
+        # A bar on a holiday proves the day was a session after all
+        if LEARN_TRADING_HOLIDAYS:
+            number_of_change = self._trading_calendar.observe_sessions(
+                np.unique(point_batch.times).astype("datetime64[us]").tolist()
+            )
+
+            if number_of_change:
+                print(f"\nRevoked {number_of_change} holidays on which bars were saved.")
+                self._logger.log_info(
+                    f"Revoked {number_of_change} holidays on which bars were saved."
+                )
 
-        write_component = WriteComponent(
-            bucket=BUCKET_NAME, point_component_list=point_component_list
+        # Bars of today are not final yet, so they do not move the watermark
+        is_final = point_batch.times < np.datetime64(datetime.now().date())
+        symbols, inverse = np.unique(
+            point_batch.tag_values[is_final], return_inverse=True
+        )
+        last_trading_dates = np.zeros(len(symbols), dtype=point_batch.times.dtype)
+        np.maximum.at(
+            last_trading_dates, inverse.reshape(-1), point_batch.times[is_final]
         )
 
-        if not self._time_series_database_driver.write(write_component):
-            print(f"\nCannot write points to bucket {BUCKET_NAME}.")
-            self._logger.log_error(f"Cannot write points to bucket {BUCKET_NAME}.")
-            return False
+        self._watermark_store.advance_all(
+            zip(symbols.tolist(), last_trading_dates.astype("datetime64[us]").tolist())
+        )
 
         return True
 
+    def _save_crawl_progress(self, set_checkpoint: Callable[[], bool]) -> bool:
+        """Move a crawl checkpoint and flush the watermarks in one unit of work."""
+        committed = False
+
+        # The points are already in the time series database. A checkpoint
+        # saved without the watermarks of its points, or the reverse, would
+        # resume from a state that never existed.
+        try:
+            with self._relational_database_driver.unit_of_work() as unit_of_work:
+                if not set_checkpoint() or not self._watermark_store.flush():
+                    unit_of_work.failed = True
+
+            committed = unit_of_work.committed
+
+        except RuntimeError as e:
+            print(f"\nCannot save crawl progress. Error: {e}")
+            self._logger.log_error(f"Cannot save crawl progress. Error: {e}")
+
+        if not committed:
+            print("\nCannot save crawl progress. Reload the stored watermarks.")
+            self._logger.log_error(
+                "Cannot save crawl progress. Reload the stored watermarks."
+            )
+
+            # Watermarks flushed in a unit that was rolled back are not stored
+            self._watermark_store.load()
+
+        return committed
+
     def _set_time_series_data_crawl_checkpoint(
-        self, start_interval: datetime, symbol: str
+        self, start_interval: datetime, end_interval: datetime, symbol: str
     ) -> bool:
 
         record = Record(
@@ -964,6 +2646,11 @@ class SsiDataCrawler(Helper):
                     value=start_interval,
                     dataType=DataType.DATETIME,
                 ),
+                DataModel(
+                    columnName="CurrentEndInterval",
+                    value=end_interval,
+                    dataType=DataType.DATETIME,
+                ),
                 DataModel(
                     columnName="CurrentSymbol", value=symbol, dataType=DataType.NVARCHAR
                 ),
@@ -971,22 +2658,22 @@ class SsiDataCrawler(Helper):
         )
 
         if not self._get_time_series_data_crawl_checkpoint():
-            self._relational_database_driver.insert(
+            return self._relational_database_driver.insert(
                 database_name=RELATIONAL_DATABASE_NAME,
                 table_name="CrawlCheckpoint",
                 records=[record],
             )
-        else:
-            condition = Condition(
-                column="ID", operator=Operator.EQUAL_TO, value=1, dataType=DataType.INT
-            )
 
-            self._relational_database_driver.update(
-                database_name=RELATIONAL_DATABASE_NAME,
-                table_name="CrawlCheckpoint",
-                record=record,
-                condition_list=[condition],
-            )
+        condition = Condition(
+            column="ID", operator=Operator.EQUAL_TO, value=1, dataType=DataType.INT
+        )
+
+        return self._relational_database_driver.update(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name="CrawlCheckpoint",
+            record=record,
+            condition_list=[condition],
+        )
 
     def _get_time_series_data_crawl_checkpoint(self) -> CrawlCheckpoint:
         condition = Condition(
@@ -1006,4 +2693,153 @@ class SsiDataCrawler(Helper):
 
         return None
 
+    def _set_market_crawl_checkpoint(
+        self, market: MarketCode, last_crawled_date: datetime
+    ) -> bool:
+
+        record = Record(
+            [
+                DataModel(
+                    columnName="Market_ID", value=market.value, dataType=DataType.INT
+                ),
+                DataModel(
+                    columnName="LastCrawledDate",
+                    value=last_crawled_date,
+                    dataType=DataType.DATETIME,
+                ),
+            ]
+        )
+
+        if not self._get_market_crawl_checkpoint(market):
+            return self._relational_database_driver.insert(
+                database_name=RELATIONAL_DATABASE_NAME,
+                table_name="MarketCrawlCheckpoint",
+                records=[record],
+            )
+
+        condition = Condition(
+            column="Market_ID",
+            operator=Operator.EQUAL_TO,
+            value=market.value,
+            dataType=DataType.INT,
+        )
+
+        return self._relational_database_driver.update(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name="MarketCrawlCheckpoint",
+            record=record,
+            condition_list=[condition],
+        )
+
+    def _get_market_crawl_checkpoint(self, market: MarketCode) -> MarketCrawlCheckpoint:
+        condition = Condition(
+            column="Market_ID",
+            operator=Operator.EQUAL_TO,
+            value=market.value,
+            dataType=DataType.INT,
+        )
+
+        result = self._relational_database_driver.select(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name="MarketCrawlCheckpoint",
+            condition_list=[condition],
+        )
+
+        if result:
+            return MarketCrawlCheckpoint(
+                **dict(zip(MarketCrawlCheckpoint.get_key_list(), result[0]))
+            )
+
+        return None
+
+    def _load_trading_holidays(self) -> bool:
+        trading_holidays = self._relational_database_driver.select_iter(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name="TradingHoliday",
+            row_type=TradingHoliday,
+        )
+
+        if trading_holidays is None:
+            print("\nCannot load trading holidays. Use the built-in calendar.")
+            self._logger.log_warning(
+                "Cannot load trading holidays. Use the built-in calendar."
+            )
+            return False
+
+        trading_holidays = list(trading_holidays)
+
+        self._trading_calendar.add_holidays(
+            trading_holiday.HolidayDate
+            for trading_holiday in trading_holidays
+            if trading_holiday.IsHoliday
+        )
+        self._trading_calendar.remove_holidays(
+            trading_holiday.HolidayDate
+            for trading_holiday in trading_holidays
+            if not trading_holiday.IsHoliday
+        )
+
+        return True
+
+    def _save_trading_holidays(self) -> bool:
+        learned_holidays, unlearned_holidays = (
+            self._trading_calendar.pop_learned_changes()
+        )
+
+        records: List[Record] = []
+        successful = True
+
+        for holiday_date, is_holiday in [
+            *((holiday, 1) for holiday in learned_holidays),
+            *((session, 0) for session in unlearned_holidays),
+        ]:
+            holiday_date = datetime.combine(holiday_date, datetime.min.time())
+
+            condition = Condition(
+                column="HolidayDate",
+                operator=Operator.EQUAL_TO,
+                value=holiday_date,
+                dataType=DataType.DATETIME,
+            )
+
+            successful &= bool(
+                self._relational_database_driver.delete(
+                    database_name=RELATIONAL_DATABASE_NAME,
+                    table_name="TradingHoliday",
+                    condition_list=[condition],
+                )
+            )
+
+            records.append(
+                Record(
+                    [
+                        DataModel(
+                            columnName="HolidayDate",
+                            value=holiday_date,
+                            dataType=DataType.DATETIME,
+                        ),
+                        DataModel(
+                            columnName="IsHoliday",
+                            value=is_holiday,
+                            dataType=DataType.INT,
+                        ),
+                    ]
+                )
+            )
+
+        if records:
+            successful &= bool(
+                self._relational_database_driver.insert(
+                    database_name=RELATIONAL_DATABASE_NAME,
+                    table_name="TradingHoliday",
+                    records=records,
+                )
+            )
+
+        if not successful:
+            print("\nCannot save learned trading holidays.")
+            self._logger.log_error("Cannot save learned trading holidays.")
+
+        return successful
+
     # endregion
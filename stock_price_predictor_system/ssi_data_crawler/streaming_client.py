@@ -0,0 +1,49 @@
+from dataclasses import asdict
+
+import requests
+from ssi_fc_data.fc_md_client import MarketDataClient
+from ssi_fc_data.model import api
+
+from .streaming_json import StreamingJsonResponse
+
+from ..constant import *
+
+
+class StreamingMarketDataClient(MarketDataClient):
+    """`MarketDataClient` whose paged endpoints can also be read as a stream."""
+
+    # region Public methods
+
+    def daily_stock_price_stream(self, _input_data, _object) -> StreamingJsonResponse:
+        return self._make_streaming_get_request(api.MD_DAILY_STOCK_PRICE, _object)
+
+    def daily_ohlc_stream(self, _input_data, _object) -> StreamingJsonResponse:
+        return self._make_streaming_get_request(api.MD_DAILY_OHLC, _object)
+
+    def intraday_ohlc_stream(self, _input_data, _object) -> StreamingJsonResponse:
+        return self._make_streaming_get_request(api.MD_INTRADAY_OHLC, _object)
+
+    def daily_index_stream(self, _input_data, _object) -> StreamingJsonResponse:
+        return self._make_streaming_get_request(api.MD_DAILY_INDEX, _object)
+
+    # endregion
+
+    # region Private methods
+
+    def _make_streaming_get_request(
+        self, _url: str, req: object
+    ) -> StreamingJsonResponse:
+        # The header of the base class is shared, do not write to it
+        _header = dict(self._header)
+        _header["Authorization"] = "Bearer " + self._get_access_token()
+
+        _response_obj = requests.get(
+            self._config.url + _url, params=asdict(req), headers=_header, stream=True
+        )
+
+        return StreamingJsonResponse(
+            _response_obj.iter_content(chunk_size=STREAMING_CHUNK_SIZE),
+            _response_obj.close,
+        )
+
+    # endregion
@@ -0,0 +1,162 @@
+import codecs
+import json
+from typing import Callable, Dict, Iterable, Iterator
+
+
+class StreamingJsonResponse:
+    """Decodes a FastConnect response body while it downloads."""
+
+    # Consumed text is dropped from the buffer once it is this long
+    _MAX_CONSUMED_LENGTH = 1 << 16
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        close: Callable[[], None] = None,
+        array_key: str = "data",
+    ):
+        self._chunks = iter(chunks)
+        self._close = close
+        self._array_key = array_key
+
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+
+        self._header: Dict = {}
+        self._is_header_read = False
+        self._is_in_array = False
+
+    # region Public methods
+
+    @property
+    def header(self) -> Dict:
+        return self._header
+
+    def read_header(self) -> Dict:
+        """Decode the members before the array, or the whole body if it has none."""
+        if not self._is_header_read:
+            self._is_header_read = True
+            self._expect("{")
+            self._decode_members()
+
+        return self._header
+
+    def rows(self) -> Iterator[Dict]:
+        self.read_header()
+
+        try:
+            while self._is_in_array:
+                character = self._peek()
+
+                if character == "]":
+                    self._position += 1
+                    self._is_in_array = False
+                    self._decode_members()
+                    break
+
+                if character == ",":
+                    self._position += 1
+                    continue
+
+                yield self._decode_value()
+
+        finally:
+            self.close()
+
+    def close(self):
+        if self._close:
+            self._close()
+            self._close = None
+
+    # endregion
+
+    # region Private methods
+
+    def _decode_members(self):
+        """Decode members into `header` until the array starts or the object ends."""
+        while True:
+            character = self._peek()
+
+            if character == "}":
+                self._position += 1
+                return
+
+            if character == ",":
+                self._position += 1
+                continue
+
+            key = self._decode_value()
+            self._expect(":")
+
+            if key == self._array_key and self._peek() == "[":
+                self._position += 1
+                self._is_in_array = True
+                return
+
+            self._header[key] = self._decode_value()
+
+    def _decode_value(self):
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+
+                continue
+
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read_more():
+                continue
+
+            self._position = end
+            return value
+
+    def _expect(self, character: str):
+        if self._peek() != character:
+            raise ValueError(
+                f"Expecting {character!r} at position {self._position} of the response body."
+            )
+
+        self._position += 1
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the body."""
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position].isspace()
+            ):
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._read_more():
+                return ""
+
+    def _read_more(self) -> bool:
+        if self._is_exhausted:
+            return False
+
+        if self._position > self._MAX_CONSUMED_LENGTH:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+        chunk = next(self._chunks, None)
+
+        if chunk is None:
+            self._is_exhausted = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+            return False
+
+        self._buffer += self._text_decoder.decode(chunk)
+        return True
+
+    # endregion
@@ -0,0 +1,182 @@
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from .database_model import SymbolWatermark
+
+from ..logger.logger import Logger
+
+from ..relational_database_driver.relational_database_driver import (
+    RelationalDatabaseDriver,
+)
+from ..relational_database_driver.model import *
+
+from ..constant import COMMIT_BATCH_SIZE, RELATIONAL_DATABASE_NAME
+
+
+class WatermarkStore:
+    """In-memory view of the SymbolWatermark table, written back by `flush`."""
+
+    TABLE_NAME = "SymbolWatermark"
+
+    def __init__(
+        self, _logger: Logger, relational_database_driver: RelationalDatabaseDriver
+    ):
+        self._logger = _logger
+        self._relational_database_driver = relational_database_driver
+
+        self._watermarks: Dict[str, datetime] = {}
+        self._stored_symbols = set()
+        self._dirty_symbols = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def load(self) -> bool:
+        watermarks = self._relational_database_driver.select_iter(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name=self.TABLE_NAME,
+            row_type=SymbolWatermark,
+        )
+
+        if watermarks is None:
+            print("\nCannot load symbol watermarks.")
+            self._logger.log_error("Cannot load symbol watermarks.")
+            return False
+
+        watermarks = {
+            watermark.Symbol: watermark.LastTradingDate for watermark in watermarks
+        }
+
+        with self._lock:
+            self._watermarks = watermarks
+            self._stored_symbols = set(self._watermarks)
+            self._dirty_symbols = set()
+
+        print(f"\nLoaded watermarks of {len(watermarks)} securities.")
+        self._logger.log_info(f"Loaded watermarks of {len(watermarks)} securities.")
+
+        return True
+
+    def get(self, symbol: str) -> datetime:
+        with self._lock:
+            return self._watermarks.get(symbol)
+
+    def advance(self, symbol: str, trading_date: datetime):
+        with self._lock:
+            watermark = self._watermarks.get(symbol)
+
+            if watermark is None or trading_date > watermark:
+                self._watermarks[symbol] = trading_date
+                self._dirty_symbols.add(symbol)
+
+    def advance_all(self, trading_dates: Iterable[Tuple[str, datetime]]):
+        """Advance the watermarks of many `(symbol, trading_date)` pairs."""
+        for symbol, trading_date in trading_dates:
+            self.advance(symbol, trading_date)
+
+    def flush(self) -> bool:
+        # Shard workers flush concurrently, but share one database connection
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self) -> bool:
+        with self._lock:
+            dirty_watermarks = {
+                symbol: self._watermarks[symbol] for symbol in self._dirty_symbols
+            }
+            self._dirty_symbols = set()
+
+        if not dirty_watermarks:
+            return True
+
+        update_date = datetime.now().replace(microsecond=0)
+
+        new_records = RecordBatch(
+            columnNameList=["Symbol", "LastTradingDate", "UpdateDate"],
+            dataTypeList=[DataType.NVARCHAR, DataType.DATETIME, DataType.DATETIME],
+            valueList=[],
+        )
+        successful = True
+        inserted = False
+        committed = False
+
+        # The updates and the insert are committed together, in batches. No
+        # statement runs if the transaction cannot begin.
+        try:
+            with self._relational_database_driver.unit_of_work(
+                commit_batch_size=COMMIT_BATCH_SIZE
+            ) as unit_of_work:
+                for symbol, last_trading_date in dirty_watermarks.items():
+                    if symbol not in self._stored_symbols:
+                        new_records.valueList.append(
+                            (symbol, last_trading_date, update_date)
+                        )
+                        continue
+
+                    record = Record(
+                        [
+                            DataModel(
+                                columnName="Symbol",
+                                value=symbol,
+                                dataType=DataType.NVARCHAR,
+                            ),
+                            DataModel(
+                                columnName="LastTradingDate",
+                                value=last_trading_date,
+                                dataType=DataType.DATETIME,
+                            ),
+                            DataModel(
+                                columnName="UpdateDate",
+                                value=update_date,
+                                dataType=DataType.DATETIME,
+                            ),
+                        ]
+                    )
+
+                    condition = Condition(
+                        column="Symbol",
+                        operator=Operator.EQUAL_TO,
+                        value=symbol,
+                        dataType=DataType.NVARCHAR,
+                    )
+
+                    successful &= bool(
+                        self._relational_database_driver.update(
+                            database_name=RELATIONAL_DATABASE_NAME,
+                            table_name=self.TABLE_NAME,
+                            record=record,
+                            condition_list=[condition],
+                        )
+                    )
+
+                if new_records:
+                    inserted = bool(
+                        self._relational_database_driver.insert(
+                            database_name=RELATIONAL_DATABASE_NAME,
+                            table_name=self.TABLE_NAME,
+                            records=new_records,
+                        )
+                    )
+                    successful &= inserted
+
+            committed = unit_of_work.committed
+
+        except RuntimeError as e:
+            print(f"\nCannot write symbol watermarks. Error: {e}")
+            self._logger.log_error(f"Cannot write symbol watermarks. Error: {e}")
+
+        successful &= committed
+
+        # Symbols are only updated once their inserted rows are committed
+        if inserted and committed:
+            self._stored_symbols.update(values[0] for values in new_records.valueList)
+
+        if not successful:
+            # Keep the watermarks that failed to be written for the next flush
+            with self._lock:
+                self._dirty_symbols.update(dirty_watermarks)
+
+            print("\nCannot flush symbol watermarks.")
+            self._logger.log_error("Cannot flush symbol watermarks.")
+
+        return successful
@@ -7,7 +7,7 @@ from .logger.logger import Logger
 from .helper.helper import Helper
 
 from .config_helper.config_helper import ConfigHelper
-from .config_helper.model import ConfigModel
+from .config_helper.model import ConfigModel, SsiCrawlerInfoConfig
 
 from .relational_database_driver.relational_database_driver import (
     RelationalDatabaseDriver,
@@ -22,6 +22,7 @@ from .time_series_database_driver.influxdb_driver import InfluxdbDriver
 from .time_series_database_driver.model import *
 
 from .ssi_data_crawler.ssi_data_crawler import SsiDataCrawler
+from .ssi_data_crawler.parallel_backfill import ParallelBackfill
 
 from .constant import *
 
@@ -238,6 +239,11 @@ Created by Trung Ly Duc
                     dataType=DataType.NVARCHAR(12),
                     nullable=False,
                 ),
+                Column(
+                    columnName="CurrentEndInterval",
+                    dataType=DataType.DATETIME(),
+                    nullable=True,
+                ),
             ]
 
             self._relational_database_driver.create_table(
@@ -248,6 +254,78 @@ Created by Trung Ly Duc
             )
             # endregion
 
+            # region Create SymbolWatermark Table
+            symbol_watermark_table_columns: List[Column] = [
+                Column(columnName="ID", dataType=DataType.INT(), nullable=False),
+                Column(
+                    columnName="Symbol",
+                    dataType=DataType.NVARCHAR(12),
+                    nullable=False,
+                    unique=True,
+                ),
+                Column(
+                    columnName="LastTradingDate",
+                    dataType=DataType.DATETIME(),
+                    nullable=False,
+                ),
+                Column(
+                    columnName="UpdateDate", dataType=DataType.DATETIME(), nullable=True
+                ),
+            ]
+
+            self._relational_database_driver.create_table(
+                database_name=RELATIONAL_DATABASE_NAME,
+                table_name="SymbolWatermark",
+                columns=symbol_watermark_table_columns,
+                key_column_name="ID",
+            )
+            # endregion
+
+            # region Create MarketCrawlCheckpoint Table
+            market_crawl_checkpoint_table_columns: List[Column] = [
+                Column(columnName="ID", dataType=DataType.INT(), nullable=False),
+                Column(columnName="Market_ID", dataType=DataType.INT(), nullable=False),
+                Column(
+                    columnName="LastCrawledDate",
+                    dataType=DataType.DATETIME(),
+                    nullable=False,
+                ),
+            ]
+
+            market_crawl_checkpoint_table_foreign_keys: List[ForeignKey] = [
+                ForeignKey(name="Market_ID", tableToRefer="Market", columnToRefer="ID"),
+            ]
+
+            self._relational_database_driver.create_table(
+                database_name=RELATIONAL_DATABASE_NAME,
+                table_name="MarketCrawlCheckpoint",
+                columns=market_crawl_checkpoint_table_columns,
+                key_column_name="ID",
+                foreign_keys=market_crawl_checkpoint_table_foreign_keys,
+            )
+            # endregion
+
+            # region Create TradingHoliday Table
+            trading_holiday_table_columns: List[Column] = [
+                Column(columnName="ID", dataType=DataType.INT(), nullable=False),
+                Column(
+                    columnName="HolidayDate",
+                    dataType=DataType.DATETIME(),
+                    nullable=False,
+                ),
+                Column(
+                    columnName="IsHoliday", dataType=DataType.INT(), nullable=False
+                ),
+            ]
+
+            self._relational_database_driver.create_table(
+                database_name=RELATIONAL_DATABASE_NAME,
+                table_name="TradingHoliday",
+                columns=trading_holiday_table_columns,
+                key_column_name="ID",
+            )
+            # endregion
+
             return True
 
         except Exception as e:
@@ -272,8 +350,11 @@ Created by Trung Ly Duc
         api_crawler_config: SsiDataCrawler,
         relational_database_driver: RelationalDatabaseDriver,
         time_series_database_driver: TimeSeriesDatabaseDriver,
+        additional_api_crawler_configs: List[SsiCrawlerInfoConfig] = None,
     ):
-        self._ssi_data_crawler.add_crawler_config(api_crawler_config)
+        self._ssi_data_crawler.add_crawler_config(
+            api_crawler_config, additional_api_crawler_configs
+        )
         self._ssi_data_crawler.add_relational_database_driver(
             relational_database_driver
         )
@@ -301,21 +382,21 @@ Created by Trung Ly Duc
 
         return True
 
-    def _crawl_data(self):
+    def _prepare_crawler(self) -> bool:
         self._config = self._load_config()
 
         if not self._config:
-            return
+            return False
 
         print("Successfully loaded .config configuration file.")
 
         if not self._validate_config(self._config):
-            return
+            return False
 
         print("\nSuccessfully validated .config configuration file.")
 
         if not self._create_database_schemas():
-            return
+            return False
 
         print("\nSuccessfully created all database schemas.")
 
@@ -323,8 +404,15 @@ Created by Trung Ly Duc
             api_crawler_config=self._config.ssi_crawler_info,
             relational_database_driver=self._relational_database_driver,
             time_series_database_driver=self._time_series_database_driver,
+            additional_api_crawler_configs=self._config.additional_ssi_crawler_info,
         )
 
+        return True
+
+    def _crawl_data(self):
+        if not self._prepare_crawler():
+            return
+
         print(
             f'\n"ENABLE_CRAWL_RELATIONAL_DATABASE" is {ENABLE_CRAWL_RELATIONAL_DATABASE}.'
         )
@@ -345,6 +433,40 @@ Created by Trung Ly Duc
 
         print("\nCrawling data has been completed.")
 
+    def _backfill_data(self):
+        if not self._prepare_crawler():
+            return
+
+        print("\nStart backfilling missing trading days. Please wait...")
+        self._logger.log_info("Start backfilling missing trading days. Please wait...")
+        if not self._ssi_data_crawler.backfill_time_series_data():
+            print("\nCannot backfill missing trading days.")
+            self._logger.log_error("Cannot backfill missing trading days.")
+            return
+
+        print("\nBackfilling data has been completed.")
+
+    def _backfill_data_in_parallel(self):
+        if not self._prepare_crawler():
+            return
+
+        print(
+            f"\nStart backfilling full history in {PARALLEL_BACKFILL_PROCESSES} processes. Please wait..."
+        )
+        self._logger.log_info(
+            f"Start backfilling full history in {PARALLEL_BACKFILL_PROCESSES} processes. Please wait..."
+        )
+
+        parallel_backfill = ParallelBackfill(
+            self._logger, self._config, PARALLEL_BACKFILL_PROCESSES
+        )
+        if not parallel_backfill.run(self._ssi_data_crawler.get_all_security_symbols()):
+            print("\nCannot backfill full history.")
+            self._logger.log_error("Cannot backfill full history.")
+            return
+
+        print("\nBackfilling data has been completed.")
+
     def _confirm_action(self) -> bool:
         self._clear_console()
         print(
@@ -388,6 +510,36 @@ Created by Trung Ly Duc
 
         return True
 
+    def _purge_time_series_data(self):
+        if not self._confirm_action():
+            return
+
+        self._clear_console()
+        print("Start purging all time series data...")
+        self._logger.log_info("Start purging all time series data...")
+
+        self._time_series_database_driver.delete(
+            bucket_name=BUCKET_NAME, measurement=MEASUREMENT_NAME
+        )
+
+        # Without the points, the crawl state and the fingerprints of the
+        # written points would keep them from being crawled again
+        self._relational_database_driver.delete(
+            database_name=RELATIONAL_DATABASE_NAME, table_name="CrawlCheckpoint"
+        )
+        self._relational_database_driver.delete(
+            database_name=RELATIONAL_DATABASE_NAME, table_name="MarketCrawlCheckpoint"
+        )
+        self._relational_database_driver.delete(
+            database_name=RELATIONAL_DATABASE_NAME, table_name="SymbolWatermark"
+        )
+        self._ssi_data_crawler.clear_fingerprint_index()
+
+        print("Finish purging all time series data.")
+        self._logger.log_info("Finish purging all time series data.")
+
+        return True
+
     def _purge_all_data(self):
         self._config = self._load_config()
 
@@ -421,6 +573,7 @@ Created by Trung Ly Duc
                     break
 
                 case "2":
+                    self._purge_time_series_data()
                     break
 
                 case "0":
@@ -453,6 +606,8 @@ Created by Trung Ly Duc
         print("[2] Start crawling data")
         print("[3] Purge all data")
         print("[4] Predict stock prices")
+        print("[5] Backfill missing trading days")
+        print("[6] Backfill full history in parallel processes")
         print("[x] Exit")
 
     def run(self):
@@ -490,6 +645,16 @@ Created by Trung Ly Duc
                     self._clear_console()
                     self._purge_all_data()
 
+                case "5":
+                    self._clear_console()
+                    self._backfill_data()
+                    input("\nPress Enter to return to the menu...")
+
+                case "6":
+                    self._clear_console()
+                    self._backfill_data_in_parallel()
+                    input("\nPress Enter to return to the menu...")
+
                 case "x":
                     print("Exiting the system...")
                     break
@@ -0,0 +1,142 @@
+import threading
+from datetime import timezone
+from typing import Dict, List, Tuple
+
+from .time_series_database_driver import TimeSeriesDatabaseDriver
+from .model import *
+from ..logger.logger import Logger
+
+
+class InMemoryDriver(TimeSeriesDatabaseDriver):
+    """Time series database held in a dictionary, for benchmarks and offline runs."""
+
+    def __init__(self, _logger: Logger):
+        self._logger = _logger
+
+        self._buckets: Dict[str, Dict[Tuple, PointComponent]] = {}
+        self._number_of_written_point = 0
+        self._lock = threading.Lock()
+
+    # region Public methods
+
+    @property
+    def number_of_written_point(self) -> int:
+        return self._number_of_written_point
+
+    def create_bucket(self, bucket_name: str):
+        self._buckets.setdefault(bucket_name, {})
+
+    def open_connection(self, _authentication: InfluxdbAuthentication = None) -> bool:
+        return True
+
+    def close_connection(self) -> bool:
+        return True
+
+    def check_bucket_exist(self, bucket_name: str) -> bool:
+        return bucket_name in self._buckets
+
+    def write(self, write_component: WriteComponent) -> bool:
+        if not self.check_bucket_exist(write_component.bucket):
+            print(
+                f"\nCannot write to bucket {write_component.bucket} since it does not exist."
+            )
+            self._logger.log_error(
+                f"Cannot write to bucket {write_component.bucket} since it does not exist."
+            )
+            return False
+
+        point_component_list = write_component.point_component_list
+        if isinstance(point_component_list, PointComponent):
+            point_component_list = [point_component_list]
+
+        elif isinstance(point_component_list, PointBatch):
+            point_component_list = point_component_list.to_point_component_list()
+
+        if not point_component_list:
+            return False
+
+        with self._lock:
+            bucket = self._buckets[write_component.bucket]
+
+            for point_component in point_component_list:
+                bucket[self._get_point_key(point_component)] = point_component
+
+            self._number_of_written_point += len(point_component_list)
+
+        return True
+
+    def read(self, read_component: ReadComponent) -> List:
+        if not self.check_bucket_exist(read_component.bucket):
+            return False
+
+        with self._lock:
+            return [
+                point_component
+                for point_component in self._buckets[read_component.bucket].values()
+                if self._match(point_component, read_component)
+            ]
+
+    def read_timestamps(
+        self, read_component: ReadComponent, field: str, tag_key: str
+    ) -> Dict[str, List[datetime]]:
+        points = self.read(read_component)
+        if points is False:
+            return None
+
+        timestamps: Dict[str, List[datetime]] = {}
+        tag_values = (read_component.tags or {}).get(tag_key)
+
+        for point_component in points:
+            tag_value = point_component.tags.get(tag_key)
+
+            if field not in point_component.fields or (
+                tag_values and tag_value not in tag_values
+            ):
+                continue
+
+            # InfluxDB stores naive times as UTC
+            timestamps.setdefault(tag_value, []).append(
+                point_component.time.replace(tzinfo=timezone.utc)
+            )
+
+        return timestamps
+
+    def delete(self, bucket_name: str, measurement: str) -> bool:
+        if not self.check_bucket_exist(bucket_name):
+            return False
+
+        with self._lock:
+            bucket = self._buckets[bucket_name]
+            for point_key in [key for key in bucket if key[0] == measurement]:
+                del bucket[point_key]
+
+        return True
+
+    # endregion
+
+    # region Private methods
+
+    def _get_point_key(self, point_component: PointComponent) -> Tuple:
+        return (
+            point_component.measurement,
+            tuple(sorted(point_component.tags.items())),
+            point_component.time,
+        )
+
+    def _match(self, point_component: PointComponent, read_component: ReadComponent) -> bool:
+        if (
+            read_component.measurement
+            and point_component.measurement != read_component.measurement
+        ):
+            return False
+
+        if isinstance(read_component.start_time, datetime):
+            if point_component.time < read_component.start_time:
+                return False
+
+            if read_component.end_time and point_component.time >= read_component.end_time:
+                return False
+
+        return True
+
+    # endregion
@@ -1,7 +1,7 @@
-from datetime import timezone
+from datetime import datetime, timezone
 from influxdb_client import InfluxDBClient, WriteApi, QueryApi, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
-from typing import List
+from typing import Dict, List
 
 from .time_series_database_driver import TimeSeriesDatabaseDriver
 from .model import *
@@ -98,17 +98,20 @@ class InfluxdbDriver(TimeSeriesDatabaseDriver):
             self._logger.log_warning("Cannot write since Point list is empty.")
             return False
 
-        records = [
-            Point.from_dict(
-                {
-                    "measurement": point_component.measurement,
-                    "tags": point_component.tags,
-                    "fields": point_component.fields,
-                    "time": point_component.time,
-                }
-            )
-            for point_component in write_component.point_component_list
-        ]
+        if isinstance(write_component.point_component_list, PointBatch):
+            records = self._to_line_protocol(write_component.point_component_list)
+        else:
+            records = [
+                Point.from_dict(
+                    {
+                        "measurement": point_component.measurement,
+                        "tags": point_component.tags,
+                        "fields": point_component.fields,
+                        "time": point_component.time,
+                    }
+                )
+                for point_component in write_component.point_component_list
+            ]
 
         try:
             self._writer.write(bucket=write_component.bucket, record=records)
@@ -127,9 +130,6 @@ class InfluxdbDriver(TimeSeriesDatabaseDriver):
             return False
 
     def read(self, read_component: ReadComponent) -> List:
-        start_time = None
-        end_time = None
-
         if not self.check_bucket_exist(read_component.bucket):
             return False
 
@@ -138,25 +138,12 @@ class InfluxdbDriver(TimeSeriesDatabaseDriver):
             self._logger.log_error(f'"start_time" is invalid.')
             return []
 
-        if isinstance(read_component.start_time, TimeInterval):
-            start_time = read_component.start_time.format_time()
-
-        elif isinstance(read_component.start_time, datetime):
-            # Convert start_time and end_time to UTC
-            start_time = read_component.start_time.astimezone(timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%SZ"
-            )
-            end_time = read_component.end_time.astimezone(timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%SZ"
-            )
-
-        else:
-            print('\nUnsupport type of "start_time".')
-            self._logger.log_error('Unsupport type of "start_time".')
+        time_range = self._format_time_range(read_component)
+        if not time_range:
             return False
 
         query = f"""from(bucket: "{read_component.bucket}")
-  |> range(start: {start_time}{f", stop: {end_time}" if end_time else ""})
+  |> {time_range}
   |> filter(fn: (r) => r["_measurement"] == "{read_component.measurement}")"""
 
         try:
@@ -181,3 +168,146 @@ class InfluxdbDriver(TimeSeriesDatabaseDriver):
             print(f"\nCannot read query. Error: {e}")
             self._logger.log_error(f"Cannot read query. Error: {e}")
             return False
+
+    def read_timestamps(
+        self, read_component: ReadComponent, field: str, tag_key: str
+    ) -> Dict[str, List[datetime]]:
+        """Read the timestamps of `field` per value of `tag_key`, without the values."""
+        query = self._build_tag_query(read_component, field, tag_key)
+        if not query:
+            return None
+
+        query += f"""
+  |> keep(columns: ["_time", "{tag_key}"])"""
+
+        timestamps: Dict[str, List[datetime]] = {}
+
+        try:
+            for record in self._reader.query_stream(query=query):
+                timestamps.setdefault(record.values[tag_key], []).append(
+                    record.get_time()
+                )
+
+        except Exception as e:
+            print(f"\nCannot read timestamps. Error: {e}")
+            self._logger.log_error(f"Cannot read timestamps. Error: {e}")
+            return None
+
+        print(
+            f'\nSuccessfully read timestamps of {len(timestamps)} series from bucket: "{read_component.bucket}".'
+        )
+        self._logger.log_info(
+            f'Successfully read timestamps of {len(timestamps)} series from bucket: "{read_component.bucket}".'
+        )
+
+        return timestamps
+
+    def delete(self, bucket_name: str, measurement: str) -> bool:
+        if not self.check_bucket_exist(bucket_name):
+            return False
+
+        try:
+            self._client.delete_api().delete(
+                start=datetime(1970, 1, 1, tzinfo=timezone.utc),
+                stop=datetime.now(timezone.utc),
+                predicate=f'_measurement="{measurement}"',
+                bucket=bucket_name,
+                org=self._authentication.org,
+            )
+
+            print(
+                f'\nSuccessfully deleted measurement "{measurement}" from bucket: "{bucket_name}".'
+            )
+            self._logger.log_info(
+                f'Successfully deleted measurement "{measurement}" from bucket: "{bucket_name}".'
+            )
+            return True
+
+        except Exception as e:
+            print(f"\nCannot delete points. Error: {e}")
+            self._logger.log_error(f"Cannot delete points. Error: {e}")
+            return False
+
+    # endregion
+
+    # region Private methods
+
+    def _to_line_protocol(self, point_batch: PointBatch) -> List[str]:
+        """Format a batch as line protocol in one pass."""
+        field_formats = [
+            f"{self._escape_key(name)}={{}}{"i" if point_batch.fields.dtype[name].kind in "iu" else ""}"
+            for name in point_batch.fields.dtype.names
+        ]
+        line_format = f"{{}} {",".join(field_formats)} {{}}"
+
+        # Tag values repeat a lot, escape every distinct one only once
+        escaped_tag_values = {
+            tag_value: f"{self._escape_key(point_batch.measurement)},{self._escape_key(point_batch.tag_key)}={self._escape_key(tag_value)}"
+            for tag_value in set(point_batch.tag_values.tolist())
+        }
+
+        return [
+            line_format.format(escaped_tag_values[tag_value], *values, time)
+            for tag_value, values, time in zip(
+                point_batch.tag_values.tolist(),
+                point_batch.fields.tolist(),
+                point_batch.times.astype("datetime64[ns]").astype("int64").tolist(),
+            )
+        ]
+
+    @staticmethod
+    def _escape_key(value: str) -> str:
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace(",", "\\,")
+            .replace("=", "\\=")
+            .replace(" ", "\\ ")
+        )
+
+    def _format_time_range(self, read_component: ReadComponent) -> str:
+        start_time = None
+        end_time = None
+
+        if isinstance(read_component.start_time, TimeInterval):
+            start_time = read_component.start_time.format_time()
+
+        elif isinstance(read_component.start_time, datetime):
+            # Convert start_time and end_time to UTC
+            start_time = read_component.start_time.astimezone(timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+            end_time = read_component.end_time.astimezone(timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+
+        else:
+            print('\nUnsupport type of "start_time".')
+            self._logger.log_error('Unsupport type of "start_time".')
+            return None
+
+        return f"range(start: {start_time}{f", stop: {end_time}" if end_time else ""})"
+
+    def _build_tag_query(
+        self, read_component: ReadComponent, field: str, tag_key: str
+    ) -> str:
+        if not self.check_bucket_exist(read_component.bucket):
+            return None
+
+        time_range = self._format_time_range(read_component)
+        if not time_range:
+            return None
+
+        query = f"""from(bucket: "{read_component.bucket}")
+  |> {time_range}
+  |> filter(fn: (r) => r["_measurement"] == "{read_component.measurement}" and r["_field"] == "{field}")"""
+
+        # Only keep the series of the requested tag values
+        tag_values = (read_component.tags or {}).get(tag_key)
+        if tag_values:
+            query += f"""
+  |> filter(fn: (r) => contains(value: r["{tag_key}"], set: [{", ".join(f'"{tag_value}"' for tag_value in tag_values)}]))"""
+
+        return query
+
+    # endregion
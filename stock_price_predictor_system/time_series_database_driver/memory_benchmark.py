@@ -0,0 +1,132 @@
+"""Memory held by the time series point models, per row."""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from .model import PointBatch, PointComponent
+from ..constant import MEASUREMENT_NAME
+
+# Fields of a DailyStockPrice point
+NUMBER_OF_FIELD = 28
+
+
+def to_dict_backed(data_class: type) -> type:
+    """Same fields as `data_class`, without `__slots__`."""
+    return make_dataclass(
+        data_class.__name__, [(field.name, field.type) for field in fields(data_class)]
+    )
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, float]:
+    """Return the bytes held by the result of `build` and the seconds it took."""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    result = build()
+
+    elapsed_time = time.perf_counter() - start_time
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del result
+    return current, elapsed_time
+
+
+def build_columns(
+    number_of_security: int, number_of_day: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tag values, times and field values of one point per security and day."""
+    tag_values = np.repeat(
+        np.array([f"S{index:04d}" for index in range(number_of_security)]),
+        number_of_day,
+    )
+    start_date = np.datetime64(date.today() - timedelta(days=number_of_day), "s")
+    times = np.tile(
+        start_date + np.arange(number_of_day) * np.timedelta64(1, "D"),
+        number_of_security,
+    )
+    values = np.random.default_rng(0).integers(
+        0, 10**9, size=(len(times), NUMBER_OF_FIELD), dtype=np.int64
+    )
+
+    return tag_values, times, values
+
+
+def build_points(point_class: type, columns: Tuple) -> List:
+    tag_values, times, values = columns
+    field_names = [f"field_{index:02d}" for index in range(NUMBER_OF_FIELD)]
+
+    return [
+        point_class(
+            measurement=MEASUREMENT_NAME,
+            tags={"symbol": tag_value},
+            fields=dict(zip(field_names, field_values)),
+            time=point_time,
+        )
+        for tag_value, point_time, field_values in zip(
+            tag_values.tolist(),
+            times.astype("datetime64[us]").tolist(),
+            values.tolist(),
+        )
+    ]
+
+
+def build_point_batch(columns: Tuple) -> PointBatch:
+    tag_values, times, values = columns
+    dtype = np.dtype(
+        [(f"field_{index:02d}", np.int64) for index in range(NUMBER_OF_FIELD)]
+    )
+
+    return PointBatch(
+        measurement=MEASUREMENT_NAME,
+        tag_key="symbol",
+        tag_values=tag_values.copy(),
+        times=times.copy(),
+        fields=np.ascontiguousarray(values).view(dtype).reshape(-1).copy(),
+    )
+
+
+def report(title: str, number_of_row: int, results: List[Tuple[str, int, float]]):
+    baseline = results[0][1]
+
+    print(f"\n{title} ({number_of_row} rows)")
+    for name, size, elapsed_time in results:
+        print(
+            f"  {name:<28} {size / 2**20:>9.2f} MiB {size / number_of_row:>8.0f} B/row "
+            f"{baseline / size:>6.1f}x smaller {elapsed_time:>7.2f} s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the memory held by time series point representations."
+    )
+    parser.add_argument("--securities", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    arguments = parser.parse_args()
+
+    columns = build_columns(arguments.securities, arguments.days)
+    DictBackedPointComponent = to_dict_backed(PointComponent)
+
+    report(
+        "Time series points",
+        len(columns[1]),
+        [
+            (
+                "dict-backed PointComponent",
+                *measure(lambda: build_points(DictBackedPointComponent, columns)),
+            ),
+            ("slotted PointComponent", *measure(lambda: build_points(PointComponent, columns))),
+            ("PointBatch", *measure(lambda: build_point_batch(columns))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
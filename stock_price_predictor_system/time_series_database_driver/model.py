@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List
 
+import numpy as np
+
 from .enums import *
 
 
@@ -12,7 +14,7 @@ class InfluxdbAuthentication:
     token: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PointComponent:
     measurement: str
     tags: Dict
@@ -20,10 +22,64 @@ class PointComponent:
     time: datetime
 
 
+@dataclass
+class PointBatch:
+    """Columnar points of one measurement with a single tag."""
+
+    measurement: str
+    tag_key: str
+    tag_values: np.ndarray
+    times: np.ndarray
+    fields: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @classmethod
+    def concatenate(cls, point_batches: List["PointBatch"]) -> "PointBatch":
+        """Join batches of the same measurement, tag and fields."""
+        return cls(
+            measurement=point_batches[0].measurement,
+            tag_key=point_batches[0].tag_key,
+            tag_values=np.concatenate(
+                [point_batch.tag_values for point_batch in point_batches]
+            ),
+            times=np.concatenate([point_batch.times for point_batch in point_batches]),
+            fields=np.concatenate([point_batch.fields for point_batch in point_batches]),
+        )
+
+    def select(self, mask: np.ndarray) -> "PointBatch":
+        """Points where `mask` is true."""
+        return PointBatch(
+            measurement=self.measurement,
+            tag_key=self.tag_key,
+            tag_values=self.tag_values[mask],
+            times=self.times[mask],
+            fields=self.fields[mask],
+        )
+
+    def to_point_component_list(self) -> List[PointComponent]:
+        field_names = self.fields.dtype.names
+
+        return [
+            PointComponent(
+                measurement=self.measurement,
+                tags={self.tag_key: tag_value},
+                fields=dict(zip(field_names, values)),
+                time=time,
+            )
+            for tag_value, time, values in zip(
+                self.tag_values.tolist(),
+                self.times.astype("datetime64[us]").tolist(),
+                self.fields.tolist(),
+            )
+        ]
+
+
 @dataclass
 class WriteComponent:
     bucket: str
-    point_component_list: List[PointComponent]
+    point_component_list: List[PointComponent] | PointBatch
 
 
 @dataclass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 
 
 class TimeSeriesDatabaseDriver(ABC):
@@ -23,3 +23,11 @@ class TimeSeriesDatabaseDriver(ABC):
     @abstractmethod
     def read(self) -> List:
         pass
+
+    @abstractmethod
+    def read_timestamps(self) -> Dict:
+        pass
+
+    @abstractmethod
+    def delete(self) -> bool:
+        pass
@@ -0,0 +1,78 @@
+from datetime import date
+
+# Fixed-date public holidays, as (month, day). The exchanges close on these
+# days every year, compensation days are listed per year below.
+FIXED_DATE_HOLIDAYS = [
+    (1, 1),  # New Year's Day
+    (4, 30),  # Reunification Day
+    (5, 1),  # International Workers' Day
+    (9, 2),  # National Day
+]
+
+# Weekday closures of HOSE and HNX that do not follow a fixed date: Lunar New
+# Year, Hung Kings' Commemoration Day and compensation days. This is only a
+# seed, TradingCalendar learns the actual closures from observed sessions.
+VIETNAM_EXCHANGE_HOLIDAYS = [
+    # 2020
+    date(2020, 1, 23),
+    date(2020, 1, 24),
+    date(2020, 1, 27),
+    date(2020, 1, 28),
+    date(2020, 1, 29),
+    date(2020, 4, 2),
+    # 2021
+    date(2021, 2, 10),
+    date(2021, 2, 11),
+    date(2021, 2, 12),
+    date(2021, 2, 15),
+    date(2021, 2, 16),
+    date(2021, 4, 21),
+    date(2021, 5, 3),
+    date(2021, 9, 3),
+    # 2022
+    date(2022, 1, 3),
+    date(2022, 1, 31),
+    date(2022, 2, 1),
+    date(2022, 2, 2),
+    date(2022, 2, 3),
+    date(2022, 2, 4),
+    date(2022, 4, 11),
+    date(2022, 5, 2),
+    date(2022, 5, 3),
+    date(2022, 9, 1),
+    # 2023
+    date(2023, 1, 2),
+    date(2023, 1, 20),
+    date(2023, 1, 23),
+    date(2023, 1, 24),
+    date(2023, 1, 25),
+    date(2023, 1, 26),
+    date(2023, 5, 2),
+    date(2023, 5, 3),
+    date(2023, 9, 1),
+    date(2023, 9, 4),
+    # 2024
+    date(2024, 2, 8),
+    date(2024, 2, 9),
+    date(2024, 2, 12),
+    date(2024, 2, 13),
+    date(2024, 2, 14),
+    date(2024, 4, 18),
+    date(2024, 4, 29),
+    date(2024, 9, 3),
+    # 2025
+    date(2025, 1, 27),
+    date(2025, 1, 28),
+    date(2025, 1, 29),
+    date(2025, 1, 30),
+    date(2025, 1, 31),
+    date(2025, 4, 7),
+    date(2025, 9, 1),
+    # 2026
+    date(2026, 2, 16),
+    date(2026, 2, 17),
+    date(2026, 2, 18),
+    date(2026, 2, 19),
+    date(2026, 2, 20),
+    date(2026, 4, 27),
+]
@@ -0,0 +1,260 @@
+import bisect
+import threading
+from datetime import date, datetime, timedelta
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .holiday import FIXED_DATE_HOLIDAYS, VIETNAM_EXCHANGE_HOLIDAYS
+
+DateLike = Union[date, datetime]
+
+
+class TradingCalendar:
+    """Trading sessions of the Vietnamese exchanges: weekdays that are not holidays."""
+
+    def __init__(self, holidays: Iterable[date] = VIETNAM_EXCHANGE_HOLIDAYS):
+        self._holidays: Set[date] = set()
+        self._sorted_holidays: List[date] = []
+        self._fixed_date_years: Set[int] = set()
+        self._observed_sessions: Set[date] = set()
+
+        self._learned_holidays: Set[date] = set()
+        self._unlearned_holidays: Set[date] = set()
+
+        # Sources that reported no session on a day not yet learned as a holiday
+        self._closure_sources: Dict[date, Set[str]] = {}
+        self._lock = threading.Lock()
+
+        for holiday in holidays:
+            self._add_holiday(self._to_date(holiday))
+
+    # region Public methods
+
+    @property
+    def number_of_holiday(self) -> int:
+        return len(self._holidays)
+
+    def add_holidays(self, holidays: Iterable[DateLike]):
+        with self._lock:
+            for holiday in holidays:
+                self._add_holiday(self._to_date(holiday))
+
+    def remove_holidays(self, sessions: Iterable[DateLike]):
+        """Mark days known to be sessions, overriding seeded or fixed-date holidays."""
+        with self._lock:
+            for session in sessions:
+                session = self._to_date(session)
+                self._observed_sessions.add(session)
+                self._remove_holiday(session)
+
+    def is_session(self, day: DateLike) -> bool:
+        day = self._to_date(day)
+
+        with self._lock:
+            self._ensure_fixed_date_holidays(day.year, day.year)
+            return day.weekday() < 5 and day not in self._holidays
+
+    def next_session(self, day: DateLike) -> date:
+        """Return the first session on or after `day`."""
+        day = self._to_date(day)
+
+        while not self.is_session(day):
+            day += timedelta(days=1)
+
+        return day
+
+    def previous_session(self, day: DateLike) -> date:
+        """Return the last session on or before `day`."""
+        day = self._to_date(day)
+
+        while not self.is_session(day):
+            day -= timedelta(days=1)
+
+        return day
+
+    def sessions(self, start: DateLike, end: DateLike) -> List[date]:
+        start = self._to_date(start)
+        end = self._to_date(end)
+
+        return [
+            start + timedelta(days=offset)
+            for offset in range((end - start).days + 1)
+            if self.is_session(start + timedelta(days=offset))
+        ]
+
+    def count_sessions(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of sessions from `start` to `end`, both inclusive."""
+        start = self._to_date(start)
+        end = self._to_date(end)
+
+        if start > end:
+            return 0
+
+        with self._lock:
+            self._ensure_fixed_date_holidays(start.year, end.year)
+
+            number_of_holiday = bisect.bisect_right(
+                self._sorted_holidays, end
+            ) - bisect.bisect_left(self._sorted_holidays, start)
+
+        return self._count_weekdays(start, end) - number_of_holiday
+
+    def expected_bar_count(
+        self, start: DateLike, end: DateLike, bars_per_session: int = 1
+    ) -> int:
+        """Return how many bars a fully ingested series holds from `start` to `end`."""
+        return self.count_sessions(start, end) * bars_per_session
+
+    def align_interval(
+        self, start: datetime, end: datetime
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Shrink `[start, end]` to its first and last sessions, None if it has none."""
+        if self.count_sessions(start, end) == 0:
+            return None
+
+        first_session = self.next_session(start)
+        last_session = self.previous_session(end)
+
+        return (
+            datetime.combine(first_session, datetime.min.time()),
+            datetime.combine(last_session, datetime.min.time()),
+        )
+
+    def observe_sessions(self, observed_sessions: Iterable[DateLike]) -> int:
+        """Revoke the holidays on which a session was observed."""
+        number_of_change = 0
+
+        with self._lock:
+            for session in {self._to_date(session) for session in observed_sessions}:
+                number_of_change += self._observe_session(session)
+
+        return number_of_change
+
+    def learn_from_sessions(
+        self,
+        observed_sessions: Iterable[DateLike],
+        start: DateLike,
+        end: DateLike,
+        source: str,
+        required_sources: Collection[str],
+    ) -> int:
+        """Learn the holidays of `[start, end]` from the complete response of `source`."""
+        start = self._to_date(start)
+        end = self._to_date(end)
+        observed_sessions = {self._to_date(session) for session in observed_sessions}
+
+        number_of_change = 0
+
+        with self._lock:
+            self._ensure_fixed_date_holidays(start.year, end.year)
+
+            for session in observed_sessions:
+                if start <= session <= end:
+                    number_of_change += self._observe_session(session)
+
+            day = start
+            while day <= end:
+                if (
+                    day.weekday() < 5
+                    and day not in observed_sessions
+                    and day not in self._holidays
+                ):
+                    # One truncated response must not close a day, every
+                    # source has to report it without a session
+                    closure_sources = self._closure_sources.setdefault(day, set())
+                    closure_sources.add(source)
+
+                    if closure_sources.issuperset(required_sources):
+                        del self._closure_sources[day]
+
+                        self._add_holiday(day)
+                        self._observed_sessions.discard(day)
+                        self._learned_holidays.add(day)
+                        self._unlearned_holidays.discard(day)
+                        number_of_change += 1
+
+                day += timedelta(days=1)
+
+        return number_of_change
+
+    def pop_learned_changes(self) -> Tuple[List[date], List[date]]:
+        """Return and forget the holidays learned and unlearned since the last call."""
+        with self._lock:
+            learned_holidays = sorted(self._learned_holidays)
+            unlearned_holidays = sorted(self._unlearned_holidays)
+
+            self._learned_holidays = set()
+            self._unlearned_holidays = set()
+
+        return learned_holidays, unlearned_holidays
+
+    # endregion
+
+    # region Private methods
+
+    def _add_holiday(self, holiday: date):
+        if holiday in self._holidays:
+            return
+
+        self._holidays.add(holiday)
+
+        # Weekend holidays never change a session count
+        if holiday.weekday() < 5:
+            bisect.insort(self._sorted_holidays, holiday)
+
+    def _remove_holiday(self, holiday: date):
+        self._holidays.discard(holiday)
+
+        index = bisect.bisect_left(self._sorted_holidays, holiday)
+        if (
+            index < len(self._sorted_holidays)
+            and self._sorted_holidays[index] == holiday
+        ):
+            del self._sorted_holidays[index]
+
+    def _observe_session(self, session: date) -> int:
+        self._closure_sources.pop(session, None)
+
+        if session not in self._holidays:
+            return 0
+
+        self._remove_holiday(session)
+        self._observed_sessions.add(session)
+        self._learned_holidays.discard(session)
+        self._unlearned_holidays.add(session)
+
+        return 1
+
+    def _ensure_fixed_date_holidays(self, start_year: int, end_year: int):
+        for year in range(start_year, end_year + 1):
+            if year in self._fixed_date_years:
+                continue
+
+            self._fixed_date_years.add(year)
+
+            for month, day in FIXED_DATE_HOLIDAYS:
+                holiday = date(year, month, day)
+
+                # An observed session on a fixed date must not be overwritten
+                if holiday not in self._observed_sessions:
+                    self._add_holiday(holiday)
+
+    @staticmethod
+    def _count_weekdays(start: date, end: date) -> int:
+        number_of_day = (end - start).days + 1
+        number_of_week, remainder = divmod(number_of_day, 7)
+
+        number_of_weekday = number_of_week * 5
+        for offset in range(remainder):
+            if (start.weekday() + offset) % 7 < 5:
+                number_of_weekday += 1
+
+        return number_of_weekday
+
+    @staticmethod
+    def _to_date(day: DateLike) -> date:
+        if isinstance(day, datetime):
+            return day.date()
+
+        return day
+
+    # endregion
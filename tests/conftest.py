@@ -0,0 +1,19 @@
+import pytest
+
+
+class RecordingLogger:
+    """Stand-in for Logger that keeps messages in memory instead of a file."""
+
+    def __init__(self):
+        self.messages = []
+
+    def __getattr__(self, name: str):
+        if not name.startswith("log_"):
+            raise AttributeError(name)
+
+        return lambda message: self.messages.append((name[4:], message))
+
+
+@pytest.fixture
+def logger() -> RecordingLogger:
+    return RecordingLogger()
@@ -0,0 +1,154 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from stock_price_predictor_system.relational_database_driver.columnar import (
+    ColumnarBuilder,
+    DictionaryArray,
+)
+from stock_price_predictor_system.relational_database_driver.in_memory_driver import (
+    InMemoryDriver,
+)
+from stock_price_predictor_system.relational_database_driver.model import (
+    Column,
+    DataType,
+    RecordBatch,
+)
+
+COLUMN_NAMES = ["Symbol", "TradingDate", "Volume", "Close"]
+ROWS = [
+    ("AAA", datetime(2024, 1, 2), 100, Decimal("1.5")),
+    ("BBB", datetime(2024, 1, 2), None, Decimal("2.5")),
+    ("AAA", datetime(2024, 1, 3), 300, None),
+]
+
+
+def build(rows, chunk_size: int = 2):
+    builder = ColumnarBuilder(
+        COLUMN_NAMES, ColumnarBuilder.infer_type_codes(rows, len(COLUMN_NAMES))
+    )
+    for start in range(0, len(rows), chunk_size):
+        builder.append(rows[start : start + chunk_size])
+
+    return builder.build()
+
+
+def test_type_codes_are_taken_from_the_first_value_that_is_not_null():
+    type_codes = ColumnarBuilder.infer_type_codes(
+        [("AAA", None), (None, 1), ("BBB", 2.0)], 2
+    )
+
+    assert type_codes == [str, int]
+
+
+def test_type_code_of_an_all_null_column_is_none():
+    assert ColumnarBuilder.infer_type_codes([(None,), (None,)], 1) == [None]
+
+
+def test_text_column_is_dictionary_encoded_across_chunks():
+    symbols = build(ROWS, chunk_size=1)["Symbol"]
+
+    assert isinstance(symbols, DictionaryArray)
+    assert symbols.codes.tolist() == [0, 1, 0]
+    assert symbols.dictionary.tolist() == ["AAA", "BBB"]
+    assert symbols.decode().tolist() == ["AAA", "BBB", "AAA"]
+
+
+def test_null_text_is_decoded_as_empty_string():
+    builder = ColumnarBuilder(["Symbol"], [str])
+    builder.append([("AAA",), (None,)])
+    symbols = builder.build()["Symbol"]
+
+    assert symbols.codes.tolist() == [0, -1]
+    assert symbols.decode().tolist() == ["AAA", ""]
+
+
+def test_all_null_text_column_decodes_to_empty_strings():
+    symbols = DictionaryArray(
+        codes=np.array([-1, -1], dtype=np.int32), dictionary=np.array([], dtype=np.str_)
+    )
+
+    assert symbols.decode().tolist() == ["", ""]
+
+
+def test_columns_get_numpy_dtypes():
+    columns = build(ROWS[:1])
+
+    assert columns["TradingDate"].dtype == np.dtype("datetime64[ms]")
+    assert columns["Volume"].dtype == np.int64
+    assert columns["Close"].dtype == np.float64
+
+
+def test_integer_column_with_nulls_becomes_float_in_every_chunk():
+    volumes = build(ROWS, chunk_size=2)["Volume"]
+
+    assert volumes.dtype == np.float64
+    assert volumes[0] == 100 and volumes[2] == 300
+    assert np.isnan(volumes[1])
+
+
+def test_null_decimal_becomes_nan():
+    closes = build(ROWS)["Close"]
+
+    assert closes[:2].tolist() == [1.5, 2.5]
+    assert np.isnan(closes[2])
+
+
+def test_date_bool_and_unknown_types():
+    builder = ColumnarBuilder(["Day", "IsOpen", "Note"], [date, bool, bytes])
+    builder.append([(date(2024, 1, 2), True, b"x")])
+    columns = builder.build()
+
+    assert columns["Day"].dtype == np.dtype("datetime64[D]")
+    assert columns["IsOpen"].dtype == bool
+    assert columns["Note"].dtype == object
+
+
+def test_empty_result_has_typed_empty_columns():
+    columns = ColumnarBuilder(["Volume", "Symbol"], [int, str]).build()
+
+    assert columns["Volume"].dtype == np.int64
+    assert len(columns["Volume"]) == 0
+    assert len(columns["Symbol"]) == 0
+
+
+@pytest.fixture
+def driver(logger) -> InMemoryDriver:
+    driver = InMemoryDriver(logger)
+    driver.create_table(
+        database_name="Test",
+        table_name="Price",
+        columns=[
+            Column(columnName=name, dataType=DataType.RAW(), nullable=True)
+            for name in COLUMN_NAMES
+        ],
+        key_column_name="ID",
+    )
+    driver.insert(
+        "Test",
+        "Price",
+        RecordBatch(
+            columnNameList=COLUMN_NAMES,
+            dataTypeList=[DataType.RAW()] * len(COLUMN_NAMES),
+            valueList=ROWS,
+        ),
+    )
+    return driver
+
+
+def test_select_columnar_matches_select(driver):
+    columns = driver.select_columnar(
+        "Test", "Price", columns=["Symbol", "Volume"], array_size=1
+    )
+
+    assert list(columns) == ["Symbol", "Volume"]
+    assert columns["Symbol"].decode().tolist() == [
+        symbol for symbol, _ in driver.select("Test", "Price", ["Symbol", "Volume"])
+    ]
+    assert np.isnan(columns["Volume"][1])
+
+
+def test_select_columnar_of_missing_table_is_none(driver):
+    assert driver.select_columnar("Test", "Missing") is None
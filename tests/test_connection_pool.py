@@ -0,0 +1,222 @@
+import threading
+
+import pytest
+
+from stock_price_predictor_system.relational_database_driver import connection_pool
+from stock_price_predictor_system.relational_database_driver.connection_pool import (
+    ConnectionPool,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        # Far from zero, like the real clock
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection"):
+        self._connection = connection
+
+    def execute(self, query: str):
+        self._connection.queries.append(query)
+        if not self._connection.healthy:
+            raise RuntimeError("Connection is broken.")
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.healthy = True
+        self.is_closed = False
+        self.queries = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def close(self):
+        self.is_closed = True
+
+
+class FakeConnector:
+    def __init__(self):
+        self.connections = []
+        self.error = None
+
+    def __call__(self) -> FakeConnection:
+        if self.error:
+            raise self.error
+
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(connection_pool.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def connect() -> FakeConnector:
+    return FakeConnector()
+
+
+def make_pool(connect: FakeConnector, **kwargs) -> ConnectionPool:
+    options = dict(
+        max_size=2, max_idle_time=100, max_lifetime=1000, health_check_interval=10
+    )
+    options.update(kwargs)
+    return ConnectionPool(connect, **options)
+
+
+def test_released_connection_is_reused(clock, connect):
+    pool = make_pool(connect)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(connect.connections) == 1
+    assert pool.number_of_open_connection == 1
+
+
+def test_acquire_times_out_when_pool_is_exhausted(connect):
+    pool = make_pool(connect, max_size=1)
+    pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+
+def test_waiting_thread_gets_the_released_connection(connect):
+    pool = make_pool(connect, max_size=1)
+    pooled_connection = pool.acquire()
+    acquired = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiter.start()
+    pool.release(pooled_connection)
+    waiter.join(timeout=5)
+
+    assert acquired == [pooled_connection]
+    assert len(connect.connections) == 1
+
+
+def test_failed_connect_frees_its_slot(clock, connect):
+    pool = make_pool(connect, max_size=1)
+    connect.error = RuntimeError("Login failed.")
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    assert pool.number_of_open_connection == 0
+
+    connect.error = None
+    assert pool.acquire().connection is connect.connections[0]
+
+
+def test_idle_connection_is_replaced(clock, connect):
+    pool = make_pool(connect)
+    pool.release(pool.acquire())
+
+    clock.now += 101
+    pooled_connection = pool.acquire()
+
+    assert connect.connections[0].is_closed
+    assert pooled_connection.connection is connect.connections[1]
+    assert pool.number_of_open_connection == 1
+
+
+def test_expired_connection_is_replaced(clock, connect):
+    pool = make_pool(connect)
+    pooled_connection = pool.acquire()
+
+    # Used often, but older than its lifetime
+    for _ in range(21):
+        clock.now += 50
+        pool.release(pooled_connection)
+        pooled_connection = pool.acquire()
+
+    assert connect.connections[0].is_closed
+    assert pooled_connection.connection is connect.connections[1]
+
+
+def test_connection_is_checked_after_health_check_interval(clock, connect):
+    pool = make_pool(connect)
+    pool.release(pool.acquire())
+
+    clock.now += 5
+    pool.release(pool.acquire())
+    assert connect.connections[0].queries == []
+
+    clock.now += 15
+    pool.acquire()
+    assert connect.connections[0].queries == ["SELECT 1"]
+
+
+def test_unhealthy_release_is_checked_before_reuse(clock, connect):
+    pool = make_pool(connect)
+    pooled_connection = pool.acquire()
+    pooled_connection.connection.healthy = False
+
+    pool.release(pooled_connection, healthy=False)
+    replacement = pool.acquire()
+
+    assert connect.connections[0].queries == ["SELECT 1"]
+    assert connect.connections[0].is_closed
+    assert replacement.connection is connect.connections[1]
+
+
+def test_connection_context_releases_unhealthy_on_error(clock, connect):
+    pool = make_pool(connect)
+
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("Statement failed.")
+
+    assert pool.number_of_idle_connection == 1
+    pool.acquire()
+    assert connect.connections[0].queries == ["SELECT 1"]
+
+
+def test_discard_closes_and_frees_the_slot(clock, connect):
+    pool = make_pool(connect, max_size=1)
+    pooled_connection = pool.acquire()
+
+    pool.discard(pooled_connection)
+
+    assert pooled_connection.connection.is_closed
+    assert pool.number_of_open_connection == 0
+    assert pool.acquire().connection is connect.connections[1]
+
+
+def test_close_closes_idle_and_later_released_connections(clock, connect):
+    pool = make_pool(connect)
+    idle = pool.acquire()
+    checked_out = pool.acquire()
+    pool.release(idle)
+
+    pool.close()
+
+    assert idle.connection.is_closed
+    assert not checked_out.connection.is_closed
+
+    pool.release(checked_out)
+
+    assert checked_out.connection.is_closed
+    assert pool.number_of_open_connection == 0
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
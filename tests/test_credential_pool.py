@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.credential_pool import (
+    CrawlerCredential,
+    CredentialPool,
+)
+
+
+def create_pool(logger, size: int) -> CredentialPool:
+    return CredentialPool(
+        logger, [CrawlerCredential(index, None, None, None) for index in range(size)]
+    )
+
+
+def test_pool_needs_a_credential(logger):
+    with pytest.raises(ValueError):
+        CredentialPool(logger, [])
+
+
+def test_every_item_is_processed_once(logger):
+    pool = create_pool(logger, 3)
+    processed = []
+    lock = threading.Lock()
+
+    def process(item) -> bool:
+        with lock:
+            processed.append((item, pool.current.index))
+        return True
+
+    assert pool.run(list(range(30)), process)
+    assert sorted(item for item, _ in processed) == list(range(30))
+    assert {index for _, index in processed} <= {0, 1, 2}
+
+
+def test_current_is_none_outside_of_run(logger):
+    assert create_pool(logger, 2).current is None
+
+
+def test_idle_credential_steals_from_the_busiest_shard(logger):
+    pool = create_pool(logger, 2)
+
+    # Items of credential 1 are slow, so credential 0 ends up taking some
+    def process(item) -> bool:
+        if item % 2:
+            time.sleep(0.01)
+        return True
+
+    assert pool.run(list(range(20)), process)
+    assert pool.number_of_stolen_item > 0
+
+
+def test_failure_stops_every_credential(logger):
+    pool = create_pool(logger, 2)
+    processed = []
+
+    def process(item) -> bool:
+        processed.append(item)
+        if item == 0:
+            raise RuntimeError("boom")
+        time.sleep(0.01)
+        return True
+
+    assert not pool.run(list(range(100)), process)
+    assert len(processed) < 100
+    assert any("boom" in message for _, message in logger.messages)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.fingerprint_index import (
+    FingerprintIndex,
+)
+from stock_price_predictor_system.time_series_database_driver.model import PointBatch
+
+FIELD_DTYPE = np.dtype([("close_price", np.int64), ("per_price_change", np.float64)])
+
+
+def create_point_batch(symbols, days, close_prices) -> PointBatch:
+    return PointBatch(
+        measurement="daily_stock_price",
+        tag_key="symbol",
+        tag_values=np.array(symbols, dtype=np.str_),
+        times=np.array([f"2024-03-{day:02d}" for day in days], dtype="datetime64[s]"),
+        fields=np.array(
+            [(close_price, close_price / 100) for close_price in close_prices],
+            dtype=FIELD_DTYPE,
+        ),
+    )
+
+
+def write(index: FingerprintIndex, point_batch: PointBatch) -> list:
+    changed, fingerprints = index.find_changed(point_batch)
+    written = point_batch.select(changed)
+    index.add(written, fingerprints[changed])
+    return changed.tolist()
+
+
+@pytest.fixture
+def index(logger, tmp_path) -> FingerprintIndex:
+    return FingerprintIndex(logger, str(tmp_path / "fingerprints"))
+
+
+def test_fingerprint_depends_on_every_field():
+    fields = np.array([(1250, 12.5), (1250, 12.5), (1250, 12.6)], dtype=FIELD_DTYPE)
+
+    fingerprints = FingerprintIndex.fingerprint(fields)
+
+    assert fingerprints.dtype == np.uint64
+    assert fingerprints[0] == fingerprints[1] != fingerprints[2]
+
+
+def test_fingerprint_pads_rows_that_are_not_whole_words():
+    fields = np.array([(1, 2), (1, 3)], dtype=[("a", np.int8), ("b", np.int8)])
+
+    fingerprints = FingerprintIndex.fingerprint(fields)
+
+    assert fingerprints[0] != fingerprints[1]
+
+
+def test_only_new_or_changed_points_are_written(index):
+    assert write(index, create_point_batch(["AAA", "BBB"], [4, 4], [10, 20])) == [
+        True,
+        True,
+    ]
+
+    point_batch = create_point_batch(["AAA", "BBB", "AAA"], [4, 4, 5], [10, 21, 30])
+
+    assert write(index, point_batch) == [False, True, True]
+    assert write(index, point_batch) == [False, False, False]
+    assert index.number_of_checked_point == 8
+    assert index.number_of_skipped_point == 4
+
+
+def test_flushed_index_is_loaded_again(logger, index, tmp_path):
+    write(index, create_point_batch(["AAA"], [4], [10]))
+    assert index.flush()
+
+    reloaded_index = FingerprintIndex(logger, str(tmp_path / "fingerprints"))
+
+    assert write(reloaded_index, create_point_batch(["AAA"], [4], [10])) == [False]
+
+
+def test_discarded_days_are_written_again(index):
+    write(index, create_point_batch(["AAA", "AAA"], [4, 5], [10, 20]))
+
+    index.discard("AAA", np.array(["2024-03-05"], dtype="datetime64[D]"))
+
+    assert write(index, create_point_batch(["AAA", "AAA"], [4, 5], [10, 20])) == [
+        False,
+        True,
+    ]
+
+
+def test_clear_forgets_every_fingerprint(index, tmp_path):
+    write(index, create_point_batch(["AAA"], [4], [10]))
+    index.flush()
+
+    assert index.clear()
+    assert not (tmp_path / "fingerprints").exists()
+    assert write(index, create_point_batch(["AAA"], [4], [10])) == [True]
+
+
+def test_corrupt_index_file_only_costs_a_rewrite(logger, index, tmp_path):
+    write(index, create_point_batch(["AAA"], [4], [10]))
+    index.flush()
+    (tmp_path / "fingerprints" / "AAA.npy").write_bytes(b"corrupt")
+
+    reloaded_index = FingerprintIndex(logger, str(tmp_path / "fingerprints"))
+
+    assert write(reloaded_index, create_point_batch(["AAA"], [4], [10])) == [True]
+    assert logger.messages[-1][0] == "warning"
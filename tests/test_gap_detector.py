@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.gap_detector import GapDetector
+from stock_price_predictor_system.trading_calendar.trading_calendar import (
+    TradingCalendar,
+)
+
+
+@pytest.fixture
+def calendar() -> TradingCalendar:
+    # Wednesday 6 March 2024 is a holiday
+    return TradingCalendar([date(2024, 3, 6)])
+
+
+def test_invalid_page_size_is_rejected(calendar):
+    with pytest.raises(ValueError):
+        GapDetector(calendar, 0)
+
+
+def test_complete_series_has_no_gap(calendar):
+    detector = GapDetector(calendar, 10)
+
+    stored_dates = [date(2024, 3, 4), date(2024, 3, 5), date(2024, 3, 7)]
+
+    assert detector.find_missing_sessions(stored_dates) == []
+    assert detector.find_missing_sessions([]) == []
+
+
+def test_missing_sessions_skip_weekends_and_holidays(calendar):
+    detector = GapDetector(calendar, 10)
+
+    stored_dates = [date(2024, 3, 4), date(2024, 3, 13)]
+
+    assert detector.find_missing_sessions(stored_dates) == [
+        date(2024, 3, 5),
+        date(2024, 3, 7),
+        date(2024, 3, 8),
+        date(2024, 3, 11),
+        date(2024, 3, 12),
+    ]
+
+
+def test_bar_on_a_non_session_does_not_hide_a_gap(calendar):
+    detector = GapDetector(calendar, 10)
+
+    # As many bars as sessions, but one of them is on the holiday
+    stored_dates = [date(2024, 3, 4), date(2024, 3, 6), date(2024, 3, 7)]
+
+    assert detector.find_missing_sessions(stored_dates) == [date(2024, 3, 5)]
+
+
+def test_ranges_fit_one_page_of_sessions(calendar):
+    detector = GapDetector(calendar, 3)
+
+    missing_sessions = [
+        date(2024, 3, 4),
+        date(2024, 3, 5),
+        date(2024, 3, 7),
+        date(2024, 3, 8),
+        date(2024, 3, 15),
+    ]
+
+    assert detector.group_into_ranges(missing_sessions) == [
+        (date(2024, 3, 4), date(2024, 3, 7)),
+        (date(2024, 3, 8), date(2024, 3, 8)),
+        (date(2024, 3, 15), date(2024, 3, 15)),
+    ]
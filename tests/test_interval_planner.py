@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.interval_planner import (
+    AdaptiveIntervalPlanner,
+)
+
+
+def create_planner(
+    initial_days: int = 30, target: int = 900
+) -> AdaptiveIntervalPlanner:
+    return AdaptiveIntervalPlanner(
+        initial_interval=timedelta(days=initial_days),
+        min_interval=timedelta(days=7),
+        max_interval=timedelta(days=365),
+        target_number_of_record=target,
+    )
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveIntervalPlanner(
+            timedelta(days=30), timedelta(days=10), timedelta(days=5), 900
+        )
+
+    with pytest.raises(ValueError):
+        AdaptiveIntervalPlanner(
+            timedelta(days=30), timedelta(days=1), timedelta(days=5), 0
+        )
+
+
+def test_initial_interval_is_clamped():
+    assert create_planner(initial_days=1).interval == timedelta(days=7)
+    assert create_planner(initial_days=1000).interval == timedelta(days=365)
+
+
+def test_interval_scales_towards_the_target():
+    planner = create_planner(initial_days=30, target=900)
+
+    planner.observe(450)
+
+    assert planner.next_interval() == timedelta(days=60)
+
+
+def test_interval_shrinks_when_calls_overflow_the_target():
+    planner = create_planner(initial_days=100, target=900)
+
+    planner.observe(1800)
+
+    assert planner.next_interval() == timedelta(days=50)
+
+
+def test_the_fullest_call_of_an_interval_decides():
+    planner = create_planner(initial_days=100, target=900)
+
+    planner.observe(300)
+    planner.observe(1800)
+    planner.observe(10)
+
+    assert planner.next_interval() == timedelta(days=50)
+
+
+def test_growth_is_bounded():
+    planner = create_planner(initial_days=30, target=900)
+
+    # No rows at all grows by the maximum factor, one row is capped by it too
+    assert planner.next_interval() == timedelta(days=120)
+
+    planner.observe(1)
+    assert planner.next_interval() == timedelta(days=365)
+
+
+def test_interval_never_leaves_its_bounds():
+    planner = create_planner(initial_days=10, target=900)
+
+    planner.observe(100000)
+
+    assert planner.next_interval() == timedelta(days=7)
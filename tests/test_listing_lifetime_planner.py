@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from stock_price_predictor_system.ssi_data_crawler.listing_lifetime_planner import (
+    ListingLifetimePlanner,
+)
+
+
+def test_unknown_security_keeps_its_interval():
+    planner = ListingLifetimePlanner()
+
+    assert planner.plan("AAA", datetime(2024, 1, 1), datetime(2024, 1, 31)) == (
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 31),
+    )
+
+
+def test_interval_is_trimmed_to_the_listing_lifetime():
+    planner = ListingLifetimePlanner()
+    planner.set_lifetime("AAA", datetime(2024, 1, 10), datetime(2024, 1, 20))
+
+    assert planner.plan("AAA", datetime(2024, 1, 1), datetime(2024, 1, 31)) == (
+        datetime(2024, 1, 10),
+        datetime(2024, 1, 20),
+    )
+
+
+def test_open_ended_lifetime_trims_one_side():
+    planner = ListingLifetimePlanner()
+    planner.set_lifetime("AAA", datetime(2024, 1, 10), None)
+
+    assert planner.plan("AAA", datetime(2024, 1, 1), datetime(2024, 1, 31)) == (
+        datetime(2024, 1, 10),
+        datetime(2024, 1, 31),
+    )
+
+
+def test_interval_outside_the_lifetime_is_eliminated():
+    planner = ListingLifetimePlanner()
+    planner.set_lifetime("AAA", datetime(2024, 1, 10), datetime(2024, 1, 20))
+
+    assert planner.plan("AAA", datetime(2024, 2, 1), datetime(2024, 2, 28)) is None
+    assert planner.plan("AAA", datetime(2023, 12, 1), datetime(2024, 1, 9)) is None
+    assert planner.plan("AAA", datetime(2024, 1, 15), datetime(2024, 1, 16))
+
+    assert planner.number_of_planned_call == 3
+    assert planner.number_of_eliminated_call == 2
+
+
+def test_lifetime_without_dates_is_ignored():
+    planner = ListingLifetimePlanner()
+    planner.set_lifetime("AAA", None, None)
+
+    assert planner.number_of_security == 0
+
+
+def test_reset_statistics():
+    planner = ListingLifetimePlanner()
+    planner.plan("AAA", datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+    planner.reset_statistics()
+
+    assert planner.number_of_planned_call == 0
+    assert planner.number_of_eliminated_call == 0
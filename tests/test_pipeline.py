@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.pipeline import Pipeline
+
+
+def test_items_flow_through_every_stage(logger):
+    results = []
+    lock = threading.Lock()
+
+    def collect(item):
+        with lock:
+            results.append(item)
+
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("double", lambda item: item * 2, 3, 2)
+    pipeline.add_stage("increment", lambda item: item + 1, 2, 2)
+    pipeline.add_stage("collect", collect, 1, 2)
+    pipeline.start()
+
+    for item in range(50):
+        pipeline.put(item)
+
+    assert pipeline.close()
+    assert sorted(results) == [item * 2 + 1 for item in range(50)]
+
+
+def test_false_result_fails_the_pipeline_and_drains_the_rest(logger):
+    processed = []
+
+    def fail_on_three(item):
+        processed.append(item)
+        return False if item == 3 else item
+
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("check", fail_on_three, 1, 1)
+    pipeline.start()
+
+    for item in range(10):
+        pipeline.put(item)
+
+    assert not pipeline.close()
+    assert processed == [0, 1, 2, 3]
+
+
+def test_exception_in_a_stage_is_a_failure(logger):
+    def raise_error(item):
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("raise", raise_error, 1, 1)
+    pipeline.start()
+    pipeline.put(1)
+
+    assert not pipeline.close()
+    assert any("boom" in message for _, message in logger.messages)
+
+
+def test_finalize_runs_once_after_the_last_worker(logger):
+    finalized = []
+
+    def finalize() -> bool:
+        finalized.append(threading.current_thread().name)
+        return True
+
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("identity", lambda item: item, 4, 1, finalize)
+    pipeline.start()
+    pipeline.put(1)
+
+    assert pipeline.close()
+    assert len(finalized) == 1
+
+
+def test_failed_finalize_fails_the_pipeline(logger):
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("identity", lambda item: item, 1, 1, lambda: False)
+    pipeline.start()
+
+    assert not pipeline.close()
+
+
+def test_wait_until_processed(logger):
+    release = threading.Event()
+
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("first", lambda item: item, 1, 4)
+    pipeline.add_stage("blocked", lambda item: release.wait(), 1, 4)
+    pipeline.start()
+
+    for item in range(3):
+        pipeline.put(item)
+
+    pipeline.wait_until_processed("first", 3)
+    release.set()
+
+    assert pipeline.close()
+
+
+def test_invalid_number_of_worker_is_rejected(logger):
+    with pytest.raises(ValueError):
+        Pipeline(logger).add_stage("identity", lambda item: item, 0, 1)
+
+
+def test_stage_cannot_be_added_once_started(logger):
+    pipeline = Pipeline(logger)
+    pipeline.add_stage("identity", lambda item: item, 1, 1)
+    pipeline.start()
+
+    with pytest.raises(RuntimeError):
+        pipeline.add_stage("late", lambda item: item, 1, 1)
+
+    pipeline.close()
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from stock_price_predictor_system.time_series_database_driver.in_memory_driver import (
+    InMemoryDriver,
+)
+from stock_price_predictor_system.time_series_database_driver.model import (
+    PointBatch,
+    PointComponent,
+    WriteComponent,
+)
+
+FIELD_DTYPE = np.dtype([("close_price", np.int64), ("per_price_change", np.float64)])
+
+
+def create_point_batch(symbols, days, close_prices) -> PointBatch:
+    return PointBatch(
+        measurement="daily_stock_price",
+        tag_key="symbol",
+        tag_values=np.array(symbols, dtype=np.str_),
+        times=np.array([f"2024-03-{day:02d}" for day in days], dtype="datetime64[s]"),
+        fields=np.array(
+            [(close_price, close_price / 100) for close_price in close_prices],
+            dtype=FIELD_DTYPE,
+        ),
+    )
+
+
+def test_select_keeps_the_masked_points():
+    point_batch = create_point_batch(["AAA", "BBB", "AAA"], [4, 4, 5], [10, 20, 30])
+
+    selected = point_batch.select(point_batch.tag_values == "AAA")
+
+    assert len(selected) == 2
+    assert selected.fields["close_price"].tolist() == [10, 30]
+    assert selected.times.tolist() == [datetime(2024, 3, 4), datetime(2024, 3, 5)]
+
+
+def test_concatenate_joins_batches_in_order():
+    point_batch = PointBatch.concatenate(
+        [
+            create_point_batch(["AAA"], [4], [10]),
+            create_point_batch(["BBB", "CCC"], [5, 6], [20, 30]),
+        ]
+    )
+
+    assert point_batch.tag_values.tolist() == ["AAA", "BBB", "CCC"]
+    assert point_batch.fields["close_price"].tolist() == [10, 20, 30]
+
+
+def test_to_point_component_list():
+    point_batch = create_point_batch(["AAA"], [4], [1250])
+
+    assert point_batch.to_point_component_list() == [
+        PointComponent(
+            measurement="daily_stock_price",
+            tags={"symbol": "AAA"},
+            fields={"close_price": 1250, "per_price_change": 12.5},
+            time=datetime(2024, 3, 4),
+        )
+    ]
+
+
+@pytest.mark.parametrize("point_batch_size", [0, 3])
+def test_in_memory_driver_writes_point_batches(logger, point_batch_size):
+    driver = InMemoryDriver(logger)
+    driver.create_bucket("bucket")
+
+    point_batch = create_point_batch(
+        ["AAA"] * point_batch_size,
+        range(4, 4 + point_batch_size),
+        [10] * point_batch_size,
+    )
+
+    assert driver.write(WriteComponent("bucket", point_batch)) == bool(point_batch_size)
+    assert driver.number_of_written_point == point_batch_size
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import numpy as np
+
+from stock_price_predictor_system.ssi_data_crawler.field_schema import (
+    FIELD_SCHEMAS,
+    EndpointSchema,
+    FieldSchema,
+)
+from stock_price_predictor_system.ssi_data_crawler.point_batch_converter import (
+    PointBatchConverter,
+    compile_converters,
+)
+
+SCHEMA = EndpointSchema(
+    endpoint="intraday",
+    measurement="intraday_price",
+    tagKey="Symbol",
+    tagName="symbol",
+    timeKeys=("TradingDate", "Time"),
+    timeFormat="%d/%m/%Y %H:%M:%S",
+    fields=(
+        FieldSchema(key="Close", name="close", dataType=np.int64),
+        FieldSchema(key="Change", name="change", dataType=np.float64),
+    ),
+)
+
+ROWS = [
+    {
+        "Symbol": "AAA",
+        "TradingDate": "04/03/2024",
+        "Time": "09:15:00",
+        "Close": "1250",
+        "Change": "0.5",
+    },
+    {
+        "Symbol": "BBB",
+        "TradingDate": "04/03/2024",
+        "Time": "09:15:00",
+        "Close": 980,
+        "Change": -1.25,
+    },
+    {
+        "Symbol": "AAA",
+        "TradingDate": "05/03/2024",
+        "Time": "14:45:00",
+        "Close": "1300",
+        "Change": "4",
+    },
+]
+
+
+def test_rows_become_typed_columns():
+    point_batch = PointBatchConverter(SCHEMA).convert(ROWS)
+
+    assert point_batch.measurement == "intraday_price"
+    assert point_batch.tag_key == "symbol"
+    assert point_batch.tag_values.tolist() == ["AAA", "BBB", "AAA"]
+    assert point_batch.times.tolist() == [
+        datetime(2024, 3, 4, 9, 15),
+        datetime(2024, 3, 4, 9, 15),
+        datetime(2024, 3, 5, 14, 45),
+    ]
+    assert point_batch.fields.dtype.names == ("close", "change")
+    assert point_batch.fields["close"].tolist() == [1250, 980, 1300]
+    assert point_batch.fields["change"].tolist() == [0.5, -1.25, 4.0]
+
+
+def test_no_rows_give_an_empty_batch():
+    point_batch = PointBatchConverter(SCHEMA).convert([])
+
+    assert len(point_batch) == 0
+    assert point_batch.fields.dtype.names == ("close", "change")
+
+
+def test_convert_iter_matches_convert():
+    converter = PointBatchConverter(SCHEMA)
+
+    point_batch = converter.convert_iter(iter(ROWS), batch_size=2)
+
+    assert point_batch.tag_values.tolist() == ["AAA", "BBB", "AAA"]
+    assert point_batch.fields.tolist() == converter.convert(ROWS).fields.tolist()
+    assert len(converter.convert_iter(iter([]), batch_size=2)) == 0
+
+
+def test_a_converter_is_compiled_per_endpoint():
+    converters = compile_converters(FIELD_SCHEMAS)
+
+    assert set(converters) == set(FIELD_SCHEMAS)
+    assert converters["daily_stock_price"].schema is FIELD_SCHEMAS["daily_stock_price"]
@@ -0,0 +1,136 @@
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler import rate_controller
+from stock_price_predictor_system.ssi_data_crawler.rate_controller import (
+    AimdRateController,
+)
+from stock_price_predictor_system.ssi_data_crawler.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class StubRateLimiter(TokenBucketRateLimiter):
+    """Bucket whose waits are set by the test."""
+
+    def __init__(self, rate: float = 1):
+        super().__init__(rate)
+        self.delay = 0.0
+
+    def acquire(self) -> float:
+        return self.delay
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_controller.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def create_controller(
+    rate_limiter: TokenBucketRateLimiter = None,
+) -> AimdRateController:
+    return AimdRateController(
+        initial_rate=1,
+        min_rate=0.1,
+        max_rate=2,
+        additive_increase=0.5,
+        multiplicative_decrease=0.5,
+        rate_limiter=rate_limiter,
+    )
+
+
+@pytest.mark.parametrize(
+    "initial_rate, min_rate, max_rate, multiplicative_decrease",
+    [(1, 2, 3, 0.5), (3, 1, 2, 0.5), (1, 0, 2, 0.5), (1, 0.1, 2, 1)],
+)
+def test_invalid_arguments_are_rejected(
+    initial_rate, min_rate, max_rate, multiplicative_decrease
+):
+    with pytest.raises(ValueError):
+        AimdRateController(
+            initial_rate, min_rate, max_rate, 0.1, multiplicative_decrease
+        )
+
+
+def test_every_endpoint_shares_one_rate(clock):
+    rate_limiter = StubRateLimiter()
+    rate_limiter.delay = 0.1
+    controller = create_controller(rate_limiter)
+
+    controller.on_success("daily_stock_price", controller.acquire("daily_stock_price"))
+    controller.on_throttle("securities_details", clock.now)
+
+    assert controller.rate == pytest.approx(0.75)
+    assert set(controller.statistics) == {"daily_stock_price", "securities_details"}
+
+
+def test_rate_grows_only_while_calls_are_limited(clock):
+    rate_limiter = StubRateLimiter()
+    controller = create_controller(rate_limiter)
+
+    controller.on_success("daily_stock_price", controller.acquire("daily_stock_price"))
+    assert controller.rate == 1
+
+    rate_limiter.delay = 0.1
+    for _ in range(5):
+        controller.on_success(
+            "daily_stock_price", controller.acquire("daily_stock_price")
+        )
+
+    assert controller.rate == 2
+
+
+def test_one_burst_of_throttles_backs_off_once(clock):
+    controller = create_controller()
+    send_time = clock.now
+
+    clock.now += 1
+    assert controller.on_throttle("daily_stock_price", send_time)
+    assert not controller.on_throttle("daily_stock_price", send_time)
+    assert controller.rate == 0.5
+
+    clock.now += 1
+    assert controller.on_throttle("daily_stock_price", clock.now)
+    assert controller.rate == 0.25
+
+
+def test_rate_never_drops_below_the_minimum(clock):
+    controller = create_controller()
+
+    for _ in range(10):
+        clock.now += 1
+        controller.on_throttle("daily_stock_price", clock.now)
+
+    assert controller.rate == 0.1
+
+
+def test_controller_drives_a_shared_bucket(clock):
+    rate_limiter = TokenBucketRateLimiter(rate=1)
+    first_controller = create_controller(rate_limiter)
+    second_controller = create_controller(rate_limiter)
+
+    first_controller.on_throttle("daily_stock_price", clock.now)
+
+    assert second_controller.rate == 0.5
+
+
+def test_statistics_report_the_effective_rate(clock):
+    controller = create_controller()
+
+    for send_time in [0.0, 0.5, 1.0]:
+        controller.on_success("daily_stock_price", send_time)
+    controller.on_throttle("daily_stock_price", 1.5)
+
+    statistics = controller.statistics["daily_stock_price"]
+    assert statistics.number_of_call == 4
+    assert statistics.number_of_throttled_call == 1
+    assert statistics.effective_rate == 2
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler import rate_limiter
+from stock_price_predictor_system.ssi_data_crawler.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize("rate, capacity", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_arguments_are_rejected(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate, capacity)
+
+
+def test_burst_is_served_without_waiting(clock):
+    limiter = TokenBucketRateLimiter(rate=2, capacity=3)
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
+
+
+def test_calls_past_the_burst_are_spaced_by_the_rate(clock):
+    limiter = TokenBucketRateLimiter(rate=2, capacity=1)
+
+    delays = [limiter.acquire() for _ in range(4)]
+
+    assert delays == [0.0, 0.5, 0.5, 0.5]
+    assert clock.now == pytest.approx(1.5)
+
+
+def test_idle_time_refills_up_to_capacity(clock):
+    limiter = TokenBucketRateLimiter(rate=1, capacity=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 10
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_set_rate_keeps_earned_tokens(clock):
+    limiter = TokenBucketRateLimiter(rate=1, capacity=1)
+    limiter.acquire()
+
+    clock.now += 0.5
+    limiter.set_rate(2)
+
+    # Half a token was earned at the old rate, the other half takes 0.25 s
+    assert limiter.acquire() == pytest.approx(0.25)
+    assert limiter.rate == 2
+
+
+def test_acquire_async_waits_without_blocking(clock, monkeypatch):
+    delays = []
+
+    async def fake_sleep(seconds: float):
+        delays.append(seconds)
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    limiter = TokenBucketRateLimiter(rate=4, capacity=1)
+
+    async def acquire_all():
+        return [await limiter.acquire_async() for _ in range(3)]
+
+    assert asyncio.run(acquire_all()) == [0.0, 0.25, 0.5]
+    assert delays == [0.25, 0.5]
+    assert clock.sleeps == []
@@ -0,0 +1,96 @@
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler import response_cache
+from stock_price_predictor_system.ssi_data_crawler.response_cache import ResponseCache
+
+RESPONSE = {"message": "Success", "status": 200, "totalRecord": 1, "data": [{"a": 1}]}
+
+
+@dataclass
+class InputModel:
+    symbol: str
+    pageIndex: int = 1
+    market: Optional[str] = None
+
+
+@pytest.fixture
+def cache(logger, tmp_path) -> ResponseCache:
+    return ResponseCache(
+        logger,
+        str(tmp_path),
+        {"daily_stock_price": timedelta(hours=1), "securities": timedelta(0)},
+    )
+
+
+def test_put_then_get_returns_the_response(cache, tmp_path):
+    cache.put("daily_stock_price", InputModel("AAA"), RESPONSE)
+
+    assert cache.get("daily_stock_price", InputModel("AAA")) == RESPONSE
+    assert cache.get("daily_stock_price", InputModel("AAA", 2)) is None
+    assert (cache.number_of_hit, cache.number_of_miss) == (1, 1)
+
+    (path,) = [
+        os.path.join(root, name)
+        for root, _, names in os.walk(tmp_path)
+        for name in names
+    ]
+    assert path.endswith(".json.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as cache_file:
+        assert json.load(cache_file)["response"] == RESPONSE
+
+
+def test_unset_parameters_do_not_change_the_key(cache):
+    cache.put("daily_stock_price", InputModel("AAA"), RESPONSE)
+
+    assert cache.get("daily_stock_price", InputModel("AAA", market=None)) == RESPONSE
+
+
+def test_failed_responses_are_not_cached(cache):
+    cache.put("daily_stock_price", InputModel("AAA"), {**RESPONSE, "status": 429})
+
+    assert cache.get("daily_stock_price", InputModel("AAA")) is None
+
+
+def test_endpoints_without_a_ttl_are_not_cached(cache):
+    cache.put("securities", InputModel("AAA"), RESPONSE)
+    cache.put("unknown", InputModel("AAA"), RESPONSE)
+
+    assert cache.get("securities", InputModel("AAA")) is None
+    assert cache.get("unknown", InputModel("AAA")) is None
+    assert cache.number_of_miss == 0
+
+
+def test_expired_entries_are_ignored_unless_immutable(cache, monkeypatch):
+    cache.put("daily_stock_price", InputModel("AAA"), RESPONSE)
+    cache.put("daily_stock_price", InputModel("BBB"), RESPONSE, immutable=True)
+
+    later = response_cache.datetime.now() + timedelta(hours=2)
+
+    class LaterDatetime(response_cache.datetime):
+        @classmethod
+        def now(cls):
+            return later
+
+    monkeypatch.setattr(response_cache, "datetime", LaterDatetime)
+
+    assert cache.get("daily_stock_price", InputModel("AAA")) is None
+    assert cache.get("daily_stock_price", InputModel("BBB")) == RESPONSE
+
+
+def test_unreadable_entry_is_a_miss(cache, tmp_path, logger):
+    cache.put("daily_stock_price", InputModel("AAA"), RESPONSE)
+
+    for root, _, names in os.walk(tmp_path):
+        for name in names:
+            with open(os.path.join(root, name), "wb") as cache_file:
+                cache_file.write(b"not gzip")
+
+    assert cache.get("daily_stock_price", InputModel("AAA")) is None
+    assert logger.messages[-1][0] == "warning"
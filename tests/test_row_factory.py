@@ -0,0 +1,143 @@
+from collections import namedtuple
+from dataclasses import dataclass
+
+import pytest
+
+from stock_price_predictor_system.relational_database_driver.row_factory import (
+    RowIterator,
+    compile_row_factory,
+)
+
+Price = namedtuple("Price", ["symbol", "close"])
+
+
+@dataclass
+class PriceRow:
+    symbol: str
+    close: float
+
+
+class FakeCursor:
+    def __init__(self, rows, error: Exception = None):
+        self._rows = list(rows)
+        self._error = error
+        self.fetch_sizes = []
+
+    def fetchmany(self, size: int):
+        # Fail instead of reporting the end of the rows
+        if not self._rows and self._error:
+            raise self._error
+
+        self.fetch_sizes.append(size)
+        rows = self._rows[:size]
+        self._rows = self._rows[size:]
+        return rows
+
+
+class CloseRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, healthy: bool):
+        self.calls.append(healthy)
+
+
+def test_without_row_type_rows_are_tuples():
+    assert compile_row_factory()(["AAA", 1.5]) == ("AAA", 1.5)
+
+
+def test_namedtuple_in_field_order_uses_make():
+    assert compile_row_factory(Price) == Price._make
+    assert compile_row_factory(Price, ("symbol", "close"))(["AAA", 1.5]) == Price(
+        "AAA", 1.5
+    )
+
+
+def test_namedtuple_columns_are_matched_by_name():
+    make_row = compile_row_factory(Price, ("close", "symbol"))
+
+    assert make_row([1.5, "AAA"]) == Price(symbol="AAA", close=1.5)
+
+
+def test_dataclass_defaults_to_field_order():
+    assert compile_row_factory(PriceRow)(["AAA", 1.5]) == PriceRow("AAA", 1.5)
+
+
+def test_dataclass_columns_are_matched_by_name():
+    make_row = compile_row_factory(PriceRow, ("close", "symbol"))
+
+    assert make_row([1.5, "AAA"]) == PriceRow("AAA", 1.5)
+
+
+def test_factory_is_compiled_once():
+    assert compile_row_factory(PriceRow, ("symbol", "close")) is compile_row_factory(
+        PriceRow, ("symbol", "close")
+    )
+
+
+def test_unsupported_row_type_is_rejected():
+    with pytest.raises(TypeError):
+        compile_row_factory(dict)
+
+
+def test_column_that_is_not_an_identifier_is_rejected():
+    with pytest.raises(ValueError):
+        compile_row_factory(PriceRow, ("symbol", "close) or (1"))
+
+
+def test_iterator_fetches_in_chunks_and_closes_when_exhausted():
+    cursor = FakeCursor([("AAA", 1.0), ("BBB", 2.0), ("CCC", 3.0)])
+    close = CloseRecorder()
+
+    rows = list(RowIterator(cursor, compile_row_factory(Price), close, array_size=2))
+
+    assert rows == [Price("AAA", 1.0), Price("BBB", 2.0), Price("CCC", 3.0)]
+    assert cursor.fetch_sizes == [2, 2, 2]
+    assert close.calls == [True]
+
+
+def test_iterator_closes_unhealthy_when_fetch_fails():
+    cursor = FakeCursor(
+        [("AAA", 1.0), ("BBB", 2.0)], error=RuntimeError("Connection lost.")
+    )
+    close = CloseRecorder()
+    iterator = RowIterator(cursor, tuple, close, array_size=2)
+
+    assert next(iterator) == ("AAA", 1.0)
+    assert next(iterator) == ("BBB", 2.0)
+    with pytest.raises(RuntimeError):
+        next(iterator)
+
+    assert close.calls == [False]
+
+
+def test_iterator_closes_unhealthy_when_row_cannot_be_built():
+    close = CloseRecorder()
+    iterator = RowIterator(FakeCursor([("AAA",)]), compile_row_factory(Price), close)
+
+    with pytest.raises(TypeError):
+        next(iterator)
+
+    assert close.calls == [False]
+
+
+def test_context_closes_once():
+    close = CloseRecorder()
+
+    with RowIterator(FakeCursor([("AAA", 1.0), ("BBB", 2.0)]), tuple, close) as rows:
+        assert next(rows) == ("AAA", 1.0)
+
+    assert close.calls == [True]
+
+    rows.close()
+    assert close.calls == [True]
+
+
+def test_context_closes_unhealthy_on_error():
+    close = CloseRecorder()
+
+    with pytest.raises(ValueError):
+        with RowIterator(FakeCursor([("AAA", 1.0)]), tuple, close):
+            raise ValueError("Caller failed.")
+
+    assert close.calls == [False]
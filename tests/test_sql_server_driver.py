@@ -0,0 +1,272 @@
+import pytest
+
+# pyodbc cannot be imported without the ODBC driver manager
+pytest.importorskip("pyodbc", exc_type=ImportError)
+
+from stock_price_predictor_system.relational_database_driver import sql_server_driver
+from stock_price_predictor_system.relational_database_driver.model import (
+    SqlServerAuthentication,
+)
+from stock_price_predictor_system.relational_database_driver.sql_server_driver import (
+    SqlServerDriver,
+)
+
+
+class FakeCursor:
+    def __init__(self, server: "FakeServer"):
+        self._server = server
+        self._rows = []
+
+    def execute(self, query: str, parameters=None):
+        query = " ".join(query.split())
+        self._server.queries.append(query)
+
+        if self._server.on_execute:
+            self._server.on_execute(query)
+
+        if self._server.failing_query and self._server.failing_query in query:
+            raise RuntimeError(f"Cannot execute {query}.")
+
+        if "WHERE name = ?" in query:
+            self._rows = [(str(parameters[0] in self._server.tables),)]
+        elif "sys.databases" in query:
+            self._rows = [(name,) for name in self._server.tables]
+        elif "sys.tables" in query:
+            database_name = query.split("[")[1].split("]")[0]
+            self._rows = [(name,) for name in self._server.tables[database_name]]
+        else:
+            self._rows = []
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, server: "FakeServer"):
+        self._server = server
+        self.autocommit = True
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self._server)
+
+    def commit(self):
+        self._server.queries.append("COMMIT")
+
+    def rollback(self):
+        self._server.queries.append("ROLLBACK")
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """Databases and their tables, answering the catalog queries of the driver."""
+
+    def __init__(self):
+        self.tables = {"Stock": ["DailyStockPrice"], "master": []}
+        self.queries = []
+        self.failing_query = None
+        self.on_execute = None
+
+    def connect(self, *args, **kwargs) -> FakeConnection:
+        return FakeConnection(self)
+
+    def count(self, text: str) -> int:
+        return sum(text in query for query in self.queries)
+
+
+@pytest.fixture
+def server(monkeypatch) -> FakeServer:
+    server = FakeServer()
+    monkeypatch.setattr(sql_server_driver.pyodbc, "connect", server.connect)
+    return server
+
+
+def open_driver(logger, **kwargs) -> SqlServerDriver:
+    driver = SqlServerDriver(logger, **kwargs)
+    assert driver.open_connection(
+        SqlServerAuthentication(server="localhost", login="sa", password="")
+    )
+    return driver
+
+
+@pytest.fixture
+def driver(logger, server) -> SqlServerDriver:
+    return open_driver(logger)
+
+
+def test_database_names_are_read_once(driver, server):
+    assert driver.check_database_exist("Stock")
+    assert driver.check_database_exist("stock")
+    assert not driver.check_database_exist("Missing")
+
+    assert server.count("sys.databases") == 1
+
+
+def test_table_names_are_read_once_per_database(driver, server):
+    assert driver.check_table_exist("Stock", "DailyStockPrice")
+    assert driver.check_table_exist("STOCK", "dailystockprice")
+    assert not driver.check_table_exist("Stock", "Missing")
+    assert not driver.check_table_exist("master", "DailyStockPrice")
+
+    assert server.count("sys.tables") == 2
+
+
+def test_missing_database_has_no_tables_without_reading_them(driver, server):
+    assert not driver.check_table_exist("Missing", "DailyStockPrice")
+
+    assert server.count("sys.tables") == 0
+
+
+def test_refresh_reads_the_catalog_again(driver, server):
+    assert not driver.check_database_exist("Crawler")
+    server.tables["Crawler"] = ["Watermark"]
+
+    assert not driver.check_database_exist("Crawler")
+    assert driver.check_database_exist("Crawler", refresh=True)
+    assert driver.check_table_exist("Crawler", "Watermark")
+
+
+def test_refresh_catalog_forgets_every_database(driver, server):
+    assert driver.check_table_exist("Stock", "DailyStockPrice")
+    server.tables["Stock"] = []
+
+    driver.refresh_catalog()
+
+    assert not driver.check_table_exist("Stock", "DailyStockPrice")
+    assert server.count("sys.databases") == 2
+
+
+def test_drop_table_forgets_the_tables_of_its_database(driver, server):
+    assert driver.check_table_exist("Stock", "DailyStockPrice")
+    server.on_execute = lambda query: (
+        server.tables["Stock"].clear() if query.startswith("DROP TABLE") else None
+    )
+
+    driver.drop_table("Stock", "DailyStockPrice")
+
+    assert not driver.check_table_exist("Stock", "DailyStockPrice")
+
+
+def test_names_read_during_a_reset_are_not_cached(driver, server):
+    def reset_while_reading(query: str):
+        if "sys.databases" in query:
+            server.on_execute = None
+            driver.refresh_catalog()
+
+    server.on_execute = reset_while_reading
+
+    assert driver.check_database_exist("Stock")
+    assert driver.check_database_exist("Stock")
+
+    assert server.count("sys.databases") == 2
+
+
+def test_failed_catalog_query_is_not_cached(driver, server):
+    server.failing_query = "sys.databases"
+    assert driver.check_database_exist("Stock") is None
+
+    server.failing_query = None
+    assert driver.check_database_exist("Stock")
+    assert server.count("sys.databases") == 2
+
+
+def test_without_cache_every_check_is_a_query(logger, server):
+    driver = open_driver(logger, enable_catalog_cache=False)
+
+    driver.check_database_exist("Stock")
+    driver.check_database_exist("Stock")
+
+    assert server.count("sys.databases") == 2
+
+
+def purge(driver: SqlServerDriver):
+    return driver.delete("Stock", "DailyStockPrice")
+
+
+def test_unit_of_work_commits_its_statements(driver, server):
+    with driver.unit_of_work() as unit_of_work:
+        assert purge(driver)
+
+    assert unit_of_work.committed
+    assert server.queries[-2:] == [
+        "DELETE FROM [Stock].[dbo].[DailyStockPrice]",
+        "COMMIT",
+    ]
+
+
+def test_failed_statement_rolls_the_unit_of_work_back(driver, server):
+    server.failing_query = "DELETE"
+
+    with driver.unit_of_work() as unit_of_work:
+        assert not purge(driver)
+
+    assert unit_of_work.failed
+    assert not unit_of_work.committed
+    assert server.queries[-1] == "ROLLBACK"
+    assert server.count("COMMIT") == 0
+
+
+def test_exception_rolls_the_unit_of_work_back(driver, server):
+    with pytest.raises(ValueError):
+        with driver.unit_of_work():
+            purge(driver)
+            raise ValueError("Caller failed.")
+
+    assert server.queries[-1] == "ROLLBACK"
+    assert driver.begin_transaction()
+
+
+def test_failed_nested_unit_is_rolled_back_to_its_savepoint(driver, server):
+    with driver.unit_of_work() as outer:
+        purge(driver)
+
+        with driver.unit_of_work() as inner:
+            server.failing_query = "DELETE"
+            purge(driver)
+
+        server.failing_query = None
+        purge(driver)
+
+    assert inner.failed and not inner.committed
+    assert outer.committed
+    assert "SAVE TRANSACTION [UnitOfWork1];" in server.queries
+    assert "ROLLBACK TRANSACTION [UnitOfWork1];" in server.queries
+    assert server.count("ROLLBACK") == 1
+
+
+def test_nested_unit_without_savepoint_fails_the_enclosing_unit(driver, server):
+    with driver.unit_of_work() as outer:
+        server.failing_query = "SAVE TRANSACTION"
+
+        with pytest.raises(RuntimeError):
+            with driver.unit_of_work():
+                pytest.fail("The nested unit of work must not run.")
+
+        server.failing_query = None
+        purge(driver)
+
+    assert outer.failed
+    assert not outer.committed
+    assert server.queries[-1] == "ROLLBACK"
+
+
+def test_commit_batch_size_commits_every_batch(driver, server):
+    # Catalog queries are statements too, read it before the unit of work
+    assert driver.check_table_exist("Stock", "DailyStockPrice")
+
+    with driver.unit_of_work(commit_batch_size=2) as unit_of_work:
+        for _ in range(5):
+            purge(driver)
+
+    assert unit_of_work.numberOfStatement == 5
+    assert server.count("COMMIT") == 3
+
+
+def test_unit_of_work_needs_a_connection(logger):
+    with pytest.raises(RuntimeError):
+        with SqlServerDriver(logger).unit_of_work():
+            pytest.fail("The unit of work must not run.")
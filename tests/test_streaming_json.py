@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from stock_price_predictor_system.ssi_data_crawler.streaming_json import (
+    StreamingJsonResponse,
+)
+
+BODY = {
+    "message": "Success",
+    "status": 200,
+    "data": [
+        {"Symbol": "AAA", "ClosePrice": "1250", "Name": "Công ty Ánh Dương"},
+        {"Symbol": "BBB", "ClosePrice": 980.5, "Nested": {"list": [1, 2, [3]]}},
+    ],
+    "totalRecord": 2,
+}
+
+
+def split(body: bytes, size: int):
+    return [body[index : index + size] for index in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 20])
+def test_rows_and_header_match_json_loads(chunk_size):
+    body = json.dumps(BODY, ensure_ascii=False, indent=1).encode("utf-8")
+    response = StreamingJsonResponse(split(body, chunk_size))
+
+    assert response.read_header() == {"message": "Success", "status": 200}
+    assert list(response.rows()) == BODY["data"]
+
+    # Members after the array are known once the rows are consumed
+    assert response.header == {"message": "Success", "status": 200, "totalRecord": 2}
+
+
+def test_number_split_across_chunks_is_not_truncated():
+    response = StreamingJsonResponse([b'{"data": [], "totalRecord": 12', b"34}"])
+
+    assert list(response.rows()) == []
+    assert response.header["totalRecord"] == 1234
+
+
+def test_body_without_array_is_all_header():
+    response = StreamingJsonResponse(
+        [b'{"status": 429, "message": "Too many requests"}']
+    )
+
+    assert response.read_header() == {"status": 429, "message": "Too many requests"}
+    assert list(response.rows()) == []
+
+
+def test_non_array_data_member_is_a_header_value():
+    response = StreamingJsonResponse([b'{"status": 400, "data": null}'])
+
+    assert list(response.rows()) == []
+    assert response.header == {"status": 400, "data": None}
+
+
+def test_rows_close_the_response_even_when_abandoned():
+    closed = []
+    body = json.dumps(BODY).encode("utf-8")
+    response = StreamingJsonResponse(split(body, 8), close=lambda: closed.append(1))
+
+    rows = response.rows()
+    next(rows)
+    rows.close()
+
+    assert closed == [1]
+
+
+def test_malformed_body_raises():
+    with pytest.raises(ValueError):
+        StreamingJsonResponse([b"[1, 2]"]).read_header()
+
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamingJsonResponse([b'{"data": [{"Symbol": "AA']).rows())
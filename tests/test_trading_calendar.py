@@ -0,0 +1,103 @@
+from datetime import date, datetime
+
+from stock_price_predictor_system.trading_calendar.trading_calendar import (
+    TradingCalendar,
+)
+
+MARKETS = {"HOSE", "HNX", "UPCOM"}
+
+# Monday 4 to Friday 8 March 2024, without Wednesday
+MONDAY = date(2024, 3, 4)
+FRIDAY = date(2024, 3, 8)
+WEDNESDAY = date(2024, 3, 6)
+OBSERVED_SESSIONS = [date(2024, 3, 4), date(2024, 3, 5), date(2024, 3, 7), FRIDAY]
+
+
+def test_weekends_and_holidays_are_not_sessions():
+    calendar = TradingCalendar([date(2024, 3, 6)])
+
+    assert calendar.is_session(date(2024, 3, 5))
+    assert not calendar.is_session(date(2024, 3, 6))
+    assert not calendar.is_session(date(2024, 3, 9))
+    assert not calendar.is_session(datetime(2024, 1, 1, 9, 30))
+
+
+def test_seeded_calendar_closes_on_lunar_new_year():
+    calendar = TradingCalendar()
+
+    assert not calendar.is_session(date(2024, 2, 12))
+    assert calendar.next_session(date(2024, 2, 8)) == date(2024, 2, 15)
+    assert calendar.previous_session(date(2024, 2, 14)) == date(2024, 2, 7)
+
+
+def test_count_sessions_matches_the_session_list():
+    calendar = TradingCalendar()
+    start, end = date(2023, 12, 20), date(2024, 5, 10)
+
+    assert calendar.count_sessions(start, end) == len(calendar.sessions(start, end))
+    assert calendar.count_sessions(end, start) == 0
+    assert calendar.expected_bar_count(start, end, 2) == 2 * calendar.count_sessions(
+        start, end
+    )
+
+
+def test_align_interval_shrinks_to_sessions():
+    calendar = TradingCalendar([])
+
+    assert calendar.align_interval(datetime(2024, 3, 2), datetime(2024, 3, 10)) == (
+        datetime(2024, 3, 4),
+        datetime(2024, 3, 8),
+    )
+    assert calendar.align_interval(datetime(2024, 3, 9), datetime(2024, 3, 10)) is None
+
+
+def test_holiday_is_learned_once_every_market_reports_it():
+    calendar = TradingCalendar([])
+
+    for market in ["HOSE", "HNX"]:
+        assert (
+            calendar.learn_from_sessions(
+                OBSERVED_SESSIONS, MONDAY, FRIDAY, market, MARKETS
+            )
+            == 0
+        )
+        assert calendar.is_session(WEDNESDAY)
+
+    assert (
+        calendar.learn_from_sessions(
+            OBSERVED_SESSIONS, MONDAY, FRIDAY, "UPCOM", MARKETS
+        )
+        == 1
+    )
+    assert not calendar.is_session(WEDNESDAY)
+    assert calendar.pop_learned_changes() == ([WEDNESDAY], [])
+
+
+def test_session_of_one_market_cancels_the_reports_of_others():
+    calendar = TradingCalendar([])
+
+    calendar.learn_from_sessions(OBSERVED_SESSIONS, MONDAY, FRIDAY, "HOSE", MARKETS)
+    calendar.learn_from_sessions(
+        OBSERVED_SESSIONS + [WEDNESDAY], MONDAY, FRIDAY, "HNX", MARKETS
+    )
+    calendar.learn_from_sessions(OBSERVED_SESSIONS, MONDAY, FRIDAY, "UPCOM", MARKETS)
+
+    assert calendar.is_session(WEDNESDAY)
+
+
+def test_observed_session_revokes_a_holiday():
+    calendar = TradingCalendar([WEDNESDAY])
+
+    assert calendar.observe_sessions([datetime(2024, 3, 6), date(2024, 3, 7)]) == 1
+
+    assert calendar.is_session(WEDNESDAY)
+    assert calendar.pop_learned_changes() == ([], [WEDNESDAY])
+    assert calendar.pop_learned_changes() == ([], [])
+
+
+def test_observed_session_overrides_a_fixed_date_holiday():
+    calendar = TradingCalendar([])
+    calendar.remove_holidays([date(2030, 1, 1)])
+
+    assert calendar.is_session(date(2030, 1, 1))
+    assert not calendar.is_session(date(2031, 1, 1))
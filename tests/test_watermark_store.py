@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+
+from stock_price_predictor_system.constant import RELATIONAL_DATABASE_NAME
+from stock_price_predictor_system.relational_database_driver.in_memory_driver import (
+    InMemoryDriver,
+)
+from stock_price_predictor_system.relational_database_driver.model import (
+    Column,
+    DataType,
+)
+from stock_price_predictor_system.ssi_data_crawler.database_model import (
+    SymbolWatermark,
+)
+from stock_price_predictor_system.ssi_data_crawler.watermark_store import (
+    WatermarkStore,
+)
+
+
+class FailingInsertDriver(InMemoryDriver):
+    def insert(self, *args, **kwargs) -> bool:
+        return False
+
+
+def create_driver(logger, driver_class=InMemoryDriver) -> InMemoryDriver:
+    driver = driver_class(logger)
+    driver.create_table(
+        database_name=RELATIONAL_DATABASE_NAME,
+        table_name=WatermarkStore.TABLE_NAME,
+        columns=[
+            Column(columnName=key, dataType=DataType.NVARCHAR("MAX"), nullable=True)
+            for key in SymbolWatermark.get_key_list()
+        ],
+        key_column_name="ID",
+    )
+    return driver
+
+
+def stored_watermarks(driver: InMemoryDriver):
+    return dict(
+        driver.select(
+            database_name=RELATIONAL_DATABASE_NAME,
+            table_name=WatermarkStore.TABLE_NAME,
+            columns=["Symbol", "LastTradingDate"],
+        )
+    )
+
+
+@pytest.fixture
+def store(logger) -> WatermarkStore:
+    store = WatermarkStore(logger, create_driver(logger))
+    assert store.load()
+    return store
+
+
+def test_watermark_only_moves_forward(store):
+    store.advance("AAA", datetime(2024, 1, 5))
+    store.advance("AAA", datetime(2024, 1, 3))
+
+    assert store.get("AAA") == datetime(2024, 1, 5)
+    assert store.get("BBB") is None
+
+
+def test_flush_inserts_new_and_updates_stored_symbols(logger):
+    driver = create_driver(logger)
+    store = WatermarkStore(logger, driver)
+    store.load()
+
+    store.advance_all([("AAA", datetime(2024, 1, 2)), ("BBB", datetime(2024, 1, 3))])
+    assert store.flush()
+
+    store.advance("AAA", datetime(2024, 1, 9))
+    assert store.flush()
+
+    assert stored_watermarks(driver) == {
+        "AAA": datetime(2024, 1, 9),
+        "BBB": datetime(2024, 1, 3),
+    }
+
+
+def test_flushed_watermarks_are_loaded_again(logger):
+    driver = create_driver(logger)
+    store = WatermarkStore(logger, driver)
+    store.load()
+    store.advance("AAA", datetime(2024, 1, 2))
+    store.flush()
+
+    reloaded_store = WatermarkStore(logger, driver)
+
+    assert reloaded_store.load()
+    assert reloaded_store.get("AAA") == datetime(2024, 1, 2)
+
+
+def test_failed_flush_keeps_watermarks_for_the_next_one(logger):
+    store = WatermarkStore(logger, create_driver(logger, FailingInsertDriver))
+    store.load()
+    store.advance("AAA", datetime(2024, 1, 2))
+
+    assert not store.flush()
+    assert not store.flush()
+    assert store.get("AAA") == datetime(2024, 1, 2)
+
+
+def test_flush_without_changes_writes_nothing(logger):
+    store = WatermarkStore(logger, create_driver(logger, FailingInsertDriver))
+    store.load()
+
+    assert store.flush()